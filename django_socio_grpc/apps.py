@@ -8,3 +8,7 @@ options.DEFAULT_NAMES = options.DEFAULT_NAMES + ("grpc_messages", "grpc_methods"
 class DjangoSocioGrpcConfig(AppConfig):
     name = "django_socio_grpc"
     verbose_name = "Django Socio gRPC"
+
+    def ready(self):
+        # INFO - Connects the signals invalidating the cached responses in every process
+        from django_socio_grpc import cache  # noqa: F401
@@ -0,0 +1,78 @@
+"""
+Cache of the authentication results of the services.
+
+When the `AUTHENTICATION_CACHE_TIMEOUT` setting is set, `Service.resolve_user` stores
+the user and auth returned by the authentication classes in the Django cache
+`AUTHENTICATION_CACHE_ALIAS`, keyed by the credential of the request (the
+`AUTHENTICATION_CACHE_HEADER` key of its META, the `Authorization` header by default).
+The next requests with the same credential skip the authentication classes until the
+timeout expires or `invalidate_authentication_cache` is called with the credential,
+on logout or token revocation for example.
+
+Only successful authentications are cached. The cached results must be picklable.
+"""
+import hashlib
+from typing import Iterable, Optional
+
+from django.core.cache import caches
+
+from django_socio_grpc.settings import grpc_settings
+
+CACHE_KEY_PREFIX = "django_socio_grpc:auth"
+
+
+def get_authentication_cache_key(credential: str) -> str:
+    # INFO - The credential itself is never part of a key
+    digest = hashlib.sha256(credential.encode()).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{digest}"
+
+
+def _get_authentication_classes_key(authentication_classes: Iterable[type]) -> str:
+    return ",".join(
+        f"{authentication_class.__module__}.{authentication_class.__qualname__}"
+        for authentication_class in authentication_classes
+    )
+
+
+def get_request_credential(context) -> Optional[str]:
+    """
+    Return the credential the authentication of the request is cached by, or None if
+    the cache is disabled or the request has no credential.
+    """
+    if grpc_settings.AUTHENTICATION_CACHE_TIMEOUT is None:
+        return None
+    credential = getattr(context, "META", {}).get(grpc_settings.AUTHENTICATION_CACHE_HEADER)
+    return credential or None
+
+
+def get_cached_authentication(credential: str, authentication_classes: Iterable[type]):
+    """
+    Return the cached user and auth of `credential` for `authentication_classes`, or None.
+    """
+    cached = caches[grpc_settings.AUTHENTICATION_CACHE_ALIAS].get(
+        get_authentication_cache_key(credential)
+    )
+    if cached is None:
+        return None
+    return cached.get(_get_authentication_classes_key(authentication_classes))
+
+
+def set_cached_authentication(
+    credential: str, authentication_classes: Iterable[type], user_auth_tuple
+):
+    cache = caches[grpc_settings.AUTHENTICATION_CACHE_ALIAS]
+    cache_key = get_authentication_cache_key(credential)
+    # INFO - Services with other authentication classes may authenticate the same
+    # credential differently, their results are stored under the same key
+    cached = cache.get(cache_key) or {}
+    cached[_get_authentication_classes_key(authentication_classes)] = user_auth_tuple
+    cache.set(cache_key, cached, grpc_settings.AUTHENTICATION_CACHE_TIMEOUT)
+
+
+def invalidate_authentication_cache(credential: str):
+    """
+    Remove the cached authentication results of `credential`.
+    """
+    caches[grpc_settings.AUTHENTICATION_CACHE_ALIAS].delete(
+        get_authentication_cache_key(credential)
+    )
@@ -0,0 +1,193 @@
+"""
+Cache of the responses of the unary grpc actions, as `Retrieve` and `List`.
+
+The `cache_response` decorator stores the serialized response message of an action
+in a Django cache, keyed by service, action, request message, the metadata changing
+the response (filters, pagination, field mask) and the user. A cache hit returns the
+parsed message without querying the database nor serializing the instances, or the
+stored bytes as is for the `encoded_response_actions` of the service.
+
+The responses are invalidated when an instance of the model of the service (or of the
+other `models` given to the decorator) is saved or deleted: each model has a version in
+the `RESPONSE_CACHE_ALIAS` cache, part of the keys, reset by the `post_save` and
+`post_delete` signals of every model, connected when the app is ready so that the writes
+of any process (admin, workers, commands) invalidate the shared responses. Writes not
+sending signals (``QuerySet.update``, ``bulk_create``...) must call
+`invalidate_response_cache`, the bulk mixins do.
+
+The entries hold the full name of the response message with its bytes, so that any
+process having imported the generated module parses them, even before its first miss.
+"""
+import asyncio
+import functools
+import hashlib
+from typing import Dict
+from uuid import uuid4
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db.models.signals import post_delete, post_save
+from google.protobuf import symbol_database
+
+from django_socio_grpc.services.servicer_proxy import EncodedMessage
+from django_socio_grpc.settings import grpc_settings
+from django_socio_grpc.utils.executor import db_sync_to_async
+
+CACHE_KEY_PREFIX = "django_socio_grpc"
+DEFAULT_VARY_ON_METADATA = ("FILTERS", "PAGINATION", "FIELD_MASK")
+
+
+def _get_version_key(model) -> str:
+    return f"{CACHE_KEY_PREFIX}:version:{model._meta.label_lower}"
+
+
+def _get_versions(cache, models) -> Dict[str, str]:
+    keys = [_get_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # INFO - A new version is set so that the responses cached before the eviction
+            # of a version are never reused
+            cache.add(key, uuid4().hex, None)
+            versions[key] = cache.get(key)
+    return versions
+
+
+def _get_versions_cache():
+    return caches[grpc_settings.RESPONSE_CACHE_ALIAS]
+
+
+def invalidate_response_cache(model):
+    """
+    Invalidate the cached responses depending on `model`.
+    """
+    # INFO - The next read sets a new version, a single write whether or not responses
+    # depending on the model are cached
+    _get_versions_cache().delete(_get_version_key(model))
+
+
+def _invalidate_on_signal(sender, **kwargs):
+    invalidate_response_cache(sender)
+
+
+post_save.connect(_invalidate_on_signal, dispatch_uid="django_socio_grpc_response_cache")
+post_delete.connect(_invalidate_on_signal, dispatch_uid="django_socio_grpc_response_cache")
+
+
+def get_response_cache_key(
+    service, request, context, models, vary_on_metadata, vary_on_user
+) -> str:
+    """
+    Return the cache key of the response of `service` to `request`, for the current
+    versions of `models`.
+    """
+    metadata = {key.upper(): value for key, value in context.invocation_metadata() or ()}
+    map_metadata_keys = grpc_settings.MAP_METADATA_KEYS
+    parts = [
+        service.get_service_name(),
+        service.action,
+        request.SerializeToString(deterministic=True),
+    ]
+    for metadata_key in vary_on_metadata:
+        metadata_key = map_metadata_keys.get(metadata_key, metadata_key)
+        parts.append(metadata.get(metadata_key.upper(), ""))
+    if vary_on_user:
+        user = getattr(context, "user", None)
+        parts.append(str(user.pk) if user is not None and user.is_authenticated else "")
+    parts += sorted(_get_versions(_get_versions_cache(), models).items())
+
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:response:{digest}"
+
+
+def _get_message_class(full_name):
+    try:
+        return symbol_database.Default().GetSymbol(full_name)
+    except KeyError:
+        return None
+
+
+def cache_response(
+    timeout=DEFAULT_TIMEOUT,
+    cache_alias=None,
+    models=(),
+    vary_on_metadata=DEFAULT_VARY_ON_METADATA,
+    vary_on_user=True,
+):
+    """
+    Cache the response message of a unary grpc action.
+
+    :param timeout: Number of seconds the responses are cached. Default to the timeout of the cache.
+    :param cache_alias: Alias of the Django cache storing the responses. Default to the `RESPONSE_CACHE_ALIAS` setting.
+    :param models: Models whose saves and deletions invalidate the responses, in addition to the model of the service queryset.
+    :param vary_on_metadata: Keys of `MAP_METADATA_KEYS` (or metadata keys) whose values are part of the cache key.
+    :param vary_on_user: If true the responses are cached by authenticated user. Default to true
+    """
+
+    def decorator(function):
+        def get_cache():
+            return caches[cache_alias or grpc_settings.RESPONSE_CACHE_ALIAS]
+
+        def get_cache_key(service, request, context):
+            service_models = list(models)
+            get_queryset = getattr(service, "get_queryset", None)
+            if get_queryset is not None:
+                service_models.insert(0, get_queryset().model)
+            return get_response_cache_key(
+                service,
+                request,
+                context,
+                service_models,
+                vary_on_metadata,
+                vary_on_user,
+            )
+
+        def get_cached_response(service, request, context):
+            cache_key = get_cache_key(service, request, context)
+            cached = get_cache().get(cache_key)
+            if cached is None:
+                return cache_key, None
+            message_name, cached = cached
+            response_class = _get_message_class(message_name)
+            encoded = service.action in getattr(service, "encoded_response_actions", ())
+            if response_class is None and not encoded:
+                return cache_key, None
+            if encoded:
+                # INFO - The cached bytes are sent as is
+                return cache_key, EncodedMessage(cached, response_class)
+            return cache_key, response_class.FromString(cached)
+
+        def set_cached_response(service, cache_key, response):
+            get_cache().set(
+                cache_key,
+                (response.DESCRIPTOR.full_name, response.SerializeToString()),
+                timeout,
+            )
+
+        if asyncio.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def async_wrapper(self, request, context):
+                cache_key, response = await db_sync_to_async(get_cached_response, "cache")(
+                    self, request, context
+                )
+                if response is None:
+                    response = await function(self, request, context)
+                    await db_sync_to_async(set_cached_response, "cache")(
+                        self, cache_key, response
+                    )
+                return response
+
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(self, request, context):
+            cache_key, response = get_cached_response(self, request, context)
+            if response is None:
+                response = function(self, request, context)
+                set_cached_response(self, cache_key, response)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -81,6 +81,13 @@ class Unimplemented(GRPCException):
     default_code = "unimplemented"
 
 
+class QueryBudgetExceeded(GRPCException):
+    status_code = StatusCode.INTERNAL
+    default_detail = _("Query budget exceeded.")
+    default_code = "query_budget_exceeded"
+    logging_level = "ERROR"
+
+
 def get_exception_status_code_and_details(exc: Exception) -> Tuple[grpc.StatusCode, str]:
     """
     Get the gRPC status code and details from the exception.
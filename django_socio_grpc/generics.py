@@ -1,20 +1,112 @@
 import asyncio
+import copy
+import functools
+import hashlib
 import logging
 
-from asgiref.sync import async_to_sync, sync_to_async
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db.models.query import QuerySet
 from django.http import Http404
 from django.shortcuts import get_object_or_404
+from rest_framework.filters import OrderingFilter, SearchFilter
 
 from django_socio_grpc import mixins, services
 from django_socio_grpc.exceptions import NotFound
+from django_socio_grpc.pagination import (
+    CountStrategy,
+    StrategyCountPaginator,
+    estimate_count,
+)
 from django_socio_grpc.settings import grpc_settings
 from django_socio_grpc.utils import model_meta
+from django_socio_grpc.utils.executor import db_sync_to_async
+from django_socio_grpc.utils.field_mask import (
+    apply_field_mask,
+    get_field_mask_only_fields,
+    parse_field_mask,
+)
 from django_socio_grpc.utils.tools import rreplace
 
+try:
+    from django_filters.rest_framework import DjangoFilterBackend
+except ImportError:
+    # INFO - django-filter is optional
+    DjangoFilterBackend = None
+
 logger = logging.getLogger("django_socio_grpc.services")
 
+# INFO - Subclasses of the django-filter backends caching their FilterSet classes
+_filterset_cache_backends = {}
+# INFO - Backends not keeping request state, that can not declare it themselves
+_STATELESS_FILTER_BACKENDS = tuple(
+    backend for backend in (DjangoFilterBackend, SearchFilter, OrderingFilter) if backend
+)
+
+
+def _get_filterset_cache_backend(backend_class):
+    """
+    Return a subclass of the django-filter `backend_class` building the FilterSet class
+    of its ``filterset_fields`` once by (service class, queryset model), instead of
+    once by request.
+    """
+    try:
+        return _filterset_cache_backends[backend_class]
+    except KeyError:
+        pass
+
+    class FilterSetCacheBackend(backend_class):
+        _filterset_classes = {}
+
+        def get_filterset_class(self, view, queryset=None):
+            filterset_class = getattr(view, "filterset_class", None)
+            filterset_fields = getattr(view, "filterset_fields", None)
+            key = (type(view), getattr(queryset, "model", None))
+            cached = self._filterset_classes.get(key)
+            # INFO - The FilterSet class is rebuilt if the service options changed
+            if (
+                cached is None
+                or cached[0] is not filterset_class
+                or cached[1] != filterset_fields
+            ):
+                cached = (
+                    filterset_class,
+                    copy.deepcopy(filterset_fields),
+                    super().get_filterset_class(view, queryset),
+                )
+                self._filterset_classes[key] = cached
+            return cached[2]
+
+    FilterSetCacheBackend.__name__ = backend_class.__name__
+    FilterSetCacheBackend.__qualname__ = backend_class.__qualname__
+    FilterSetCacheBackend.__module__ = backend_class.__module__
+    _filterset_cache_backends[backend_class] = FilterSetCacheBackend
+    return FilterSetCacheBackend
+
+
+def _build_filter_step(backend_class):
+    """
+    Return the ``(backend_class, shared backend or None, is_async)`` step of the filter
+    pipeline of `backend_class`. The backend is only shared if its class sets
+    ``stateless = True`` or is one of `_STATELESS_FILTER_BACKENDS`.
+    """
+    stateless = getattr(
+        backend_class, "stateless", backend_class in _STATELESS_FILTER_BACKENDS
+    )
+    if (
+        DjangoFilterBackend is not None
+        and issubclass(backend_class, DjangoFilterBackend)
+        and backend_class.get_filterset_class is DjangoFilterBackend.get_filterset_class
+    ):
+        backend_class = _get_filterset_cache_backend(backend_class)
+    backend = backend_class() if stateless else None
+    return (
+        backend_class,
+        backend,
+        asyncio.iscoroutinefunction(backend_class.filter_queryset),
+    )
+
 
 class GenericService(services.Service):
     """
@@ -35,6 +127,23 @@ class GenericService(services.Service):
     # The style to use for queryset pagination.
     pagination_class = grpc_settings.DEFAULT_PAGINATION_CLASS
 
+    # How the count of paginated list responses is computed, see ``CountStrategy``.
+    count_strategy = grpc_settings.DEFAULT_COUNT_STRATEGY
+    count_cache_timeout = grpc_settings.COUNT_CACHE_TIMEOUT
+
+    # Apply to the queryset the ``select_related`` and ``prefetch_related`` paths of the
+    # relations of the serializer, see ``get_related_queryset()``.
+    optimize_related_queries = grpc_settings.OPTIMIZE_RELATED_QUERIES
+
+    # Fetch the instances with the async queryset API of Django (``aget``, ``async for``)
+    # in the async mixins, and call ``get_queryset()`` and build the serializers in the
+    # event loop instead of running each step in a thread, see ``aget_queryset()``.
+    async_orm = grpc_settings.ASYNC_ORM
+
+    # Actions whose response and queryset are restricted to the fields of the
+    # ``FIELD_MASK`` metadata of the request, see ``get_field_mask()``.
+    field_mask_actions = ("List", "Retrieve", "Stream")
+
     service_name = None
 
     @classmethod
@@ -69,6 +178,91 @@ class GenericService(services.Service):
         if isinstance(queryset, QuerySet):
             # Ensure queryset is re-evaluated on each request.
             queryset = queryset.all()
+            if self.optimize_related_queries:
+                queryset = self.get_related_queryset(queryset)
+            if self.get_field_mask() is not None:
+                queryset = self.get_field_mask_queryset(queryset)
+        return queryset
+
+    async def aget_queryset(self):
+        """
+        Async ``get_queryset()``. With ``async_orm`` it is called in the event loop
+        so it must not query the database.
+        """
+        if self.async_orm:
+            return self.get_queryset()
+        return await db_sync_to_async(self.get_queryset, "queryset")()
+
+    async def aget_instances(self, queryset):
+        """
+        Return the instances of the not paginated `queryset` to serialize. With
+        ``async_orm`` they are fetched with the async queryset API, otherwise the
+        queryset is evaluated by the serializer.
+        """
+        if self.async_orm and isinstance(queryset, QuerySet):
+            return [instance async for instance in queryset]
+        return queryset
+
+    def get_field_mask(self):
+        """
+        Return the tree of the field mask paths of the request, or None if the action
+        is not in ``field_mask_actions`` or the request has no field mask.
+        """
+        if self.action not in self.field_mask_actions:
+            return None
+        if not hasattr(self, "_field_mask"):
+            paths = getattr(self.context, "field_mask", None)
+            self._field_mask = parse_field_mask(paths) if paths else None
+        return self._field_mask
+
+    def get_field_mask_queryset(self, queryset):
+        """
+        Only load the columns read by the fields of the field mask. The queryset is left
+        untouched if one of them reads an attribute that is not a model field.
+        """
+        serializer_class = self.get_serializer_class()
+        model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+        if model is None or not issubclass(queryset.model, model):
+            return queryset
+        only_fields = get_field_mask_only_fields(
+            queryset.model, serializer_class(), self.get_field_mask()
+        )
+        if only_fields is None:
+            return queryset
+        return queryset.only(*only_fields)
+
+    def get_related_queryset(self, queryset):
+        """
+        Fetch the relations read by the serializer with ``select_related`` and
+        ``prefetch_related``, so serializing a list costs the same number of queries
+        whatever its length. The paths are computed once by serializer class.
+        """
+        serializer_class = self.get_serializer_class()
+        model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+        if model is None or not issubclass(queryset.model, model):
+            return queryset
+        select_related, prefetch_related = model_meta.get_serializer_related_paths(
+            serializer_class
+        )
+        if not select_related and not prefetch_related:
+            return queryset
+        if (field_mask := self.get_field_mask()) is not None:
+            # INFO - Relations of the fields out of the field mask are not serialized
+            sources = {
+                field.source_attrs[0]
+                for name, field in serializer_class().fields.items()
+                if name in field_mask and field.source_attrs
+            }
+            select_related = [
+                path for path in select_related if path.split("__")[0] in sources
+            ]
+            prefetch_related = [
+                path for path in prefetch_related if path.split("__")[0] in sources
+            ]
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
         return queryset
 
     def get_serializer_class(self):
@@ -89,6 +283,12 @@ class GenericService(services.Service):
         lookup_request_field = self.lookup_request_field or lookup_field
         return lookup_request_field
 
+    async def aget_lookup_request_field(self):
+        """
+        Async ``get_lookup_request_field()``, getting the queryset with ``aget_queryset()``.
+        """
+        return self.get_lookup_request_field(await self.aget_queryset())
+
     def get_object(self):
         """
         Returns an object instance that should be used for detail services.
@@ -118,7 +318,7 @@ class GenericService(services.Service):
         Defaults to using the lookup_field parameter to filter the base
         queryset.
         """
-        queryset = await sync_to_async(self.get_queryset)()
+        queryset = await self.aget_queryset()
         queryset = await self.afilter_queryset(queryset)
         lookup_request_field = self.get_lookup_request_field(queryset)
         assert hasattr(self.request, lookup_request_field), (
@@ -130,12 +330,64 @@ class GenericService(services.Service):
         lookup_value = getattr(self.request, lookup_request_field)
         filter_kwargs = {lookup_request_field: lookup_value}
         try:
-            obj = await sync_to_async(get_object_or_404)(queryset, **filter_kwargs)
+            if self.async_orm and isinstance(queryset, QuerySet):
+                try:
+                    obj = await queryset.aget(**filter_kwargs)
+                except queryset.model.DoesNotExist:
+                    raise Http404
+            else:
+                obj = await db_sync_to_async(get_object_or_404, "queryset")(
+                    queryset, **filter_kwargs
+                )
         except (TypeError, ValueError, ValidationError, Http404):
             raise NotFound(detail=f"{queryset.model.__name__}: {lookup_value} not found!")
         await self.acheck_object_permissions(obj)
         return obj
 
+    def get_bulk_objects(self, lookup_values):
+        """
+        Returns the instances matching each of `lookup_values`, in the same order,
+        with a single query. Used by the bulk services in place of `get_object`.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        instances = self._get_bulk_objects(queryset, lookup_values)
+        for obj in instances:
+            self.check_object_permissions(obj)
+        return instances
+
+    async def aget_bulk_objects(self, lookup_values):
+        """
+        Returns the instances matching each of `lookup_values`, in the same order,
+        with a single query. Used by the bulk services in place of `aget_object`.
+        """
+        queryset = await self.aget_queryset()
+        queryset = await self.afilter_queryset(queryset)
+        instances = await db_sync_to_async(self._get_bulk_objects, "queryset")(
+            queryset, lookup_values
+        )
+        for obj in instances:
+            await self.acheck_object_permissions(obj)
+        return instances
+
+    def _get_bulk_objects(self, queryset, lookup_values):
+        lookup_request_field = self.get_lookup_request_field(queryset)
+        filter_kwargs = {f"{lookup_request_field}__in": lookup_values}
+        try:
+            # INFO - Values are compared as strings as the request values may not have
+            # the python type of the field (uuid for example)
+            instances = {
+                str(getattr(obj, lookup_request_field)): obj
+                for obj in queryset.filter(**filter_kwargs)
+            }
+        except (TypeError, ValueError, ValidationError):
+            instances = {}
+        missing_values = [str(value) for value in lookup_values if str(value) not in instances]
+        if missing_values:
+            raise NotFound(
+                detail=f"{queryset.model.__name__}: {', '.join(missing_values)} not found!"
+            )
+        return [instances[str(value)] for value in lookup_values]
+
     def get_serializer(self, *args, **kwargs):
         """
         Return the serializer instance that should be used for validating and
@@ -143,12 +395,23 @@ class GenericService(services.Service):
         """
         serializer_class = self.get_serializer_class()
         kwargs.setdefault("context", self.get_serializer_context())
-        return serializer_class(*args, **kwargs)
+        serializer = serializer_class(*args, **kwargs)
+        if (field_mask := self.get_field_mask()) is not None:
+            apply_field_mask(serializer, field_mask)
+        return serializer
 
     async def aget_serializer(self, *args, **kwargs):
         serializer_class = self.get_serializer_class()
         kwargs.setdefault("context", self.get_serializer_context())
-        return await sync_to_async(serializer_class)(*args, **kwargs)
+        if self.async_orm:
+            serializer = serializer_class(*args, **kwargs)
+        else:
+            serializer = await db_sync_to_async(serializer_class, "serializers")(
+                *args, **kwargs
+            )
+        if (field_mask := self.get_field_mask()) is not None:
+            apply_field_mask(serializer, field_mask)
+        return serializer
 
     def get_serializer_context(self):
         """
@@ -161,38 +424,69 @@ class GenericService(services.Service):
             "service": self,
         }
 
+    def get_filter_backends(self):
+        """
+        Return the ``(backend, is_async)`` pairs of ``filter_backends``. The pipeline is
+        built once by service class. The backends of the classes setting
+        ``stateless = True`` are shared by the requests, the others are instantiated by call.
+        """
+        filter_backends = tuple(self.filter_backends)
+        cached = type(self).__dict__.get("_filter_pipeline")
+        if cached is None or cached[0] != filter_backends:
+            cached = (
+                filter_backends,
+                [_build_filter_step(backend) for backend in filter_backends],
+            )
+            type(self)._filter_pipeline = cached
+        return [
+            (backend_class() if backend is None else backend, is_async)
+            for backend_class, backend, is_async in cached[1]
+        ]
+
+    @classmethod
+    def _warn_filter_override(cls, method_name, message):
+        """
+        Log `message` if the service overrides `method_name`, once by service class.
+        """
+        checked = cls.__dict__.get("_checked_filter_overrides")
+        if checked is None:
+            checked = cls._checked_filter_overrides = set()
+        if method_name in checked:
+            return
+        checked.add(method_name)
+        if getattr(cls, method_name) != getattr(GenericService, method_name):
+            logger.warning(message)
+
     def filter_queryset(self, queryset):
         """Given a queryset, filter it, returning a new queryset."""
 
         # INFO - AM - 05/05/2023 - If user has overriden filter_queryset but we are in async context we put a warning message as it can bring filtering issues
-        if type(self).afilter_queryset != GenericService.afilter_queryset:
-            logger.warning(
-                "You have defined a custom afilter_queryset method but you are using sync mixins. Sync mixin use the method filter_queryset. If you want to keep this filtering logic please rename your method"
-            )
+        self._warn_filter_override(
+            "afilter_queryset",
+            "You have defined a custom afilter_queryset method but you are using sync mixins. Sync mixin use the method filter_queryset. If you want to keep this filtering logic please rename your method",
+        )
 
-        for backend in list(self.filter_backends):
-            if asyncio.iscoroutinefunction(backend().filter_queryset):
-                queryset = async_to_sync(backend().filter_queryset)(
-                    self.context, queryset, self
-                )
+        for backend, is_async in self.get_filter_backends():
+            if is_async:
+                queryset = async_to_sync(backend.filter_queryset)(self.context, queryset, self)
             else:
-                queryset = backend().filter_queryset(self.context, queryset, self)
+                queryset = backend.filter_queryset(self.context, queryset, self)
         return queryset
 
     async def afilter_queryset(self, queryset):
         """Given a queryset, filter it, returning a new queryset."""
 
         # INFO - AM - 05/05/2023 - If user has overriden filter_queryset but we are in async context we put a warning message as it can bring filtering issues
-        if type(self).filter_queryset != GenericService.filter_queryset:
-            logger.warning(
-                "You have defined a custom filter_queryset method but you are using async mixins. Async mixin use the method afilter_queryset. If you want to keep this filtering logic please rename your method"
-            )
+        self._warn_filter_override(
+            "filter_queryset",
+            "You have defined a custom filter_queryset method but you are using async mixins. Async mixin use the method afilter_queryset. If you want to keep this filtering logic please rename your method",
+        )
 
-        for backend in list(self.filter_backends):
-            if asyncio.iscoroutinefunction(backend().filter_queryset):
-                queryset = await backend().filter_queryset(self.context, queryset, self)
+        for backend, is_async in self.get_filter_backends():
+            if is_async:
+                queryset = await backend.filter_queryset(self.context, queryset, self)
             else:
-                queryset = await sync_to_async(backend().filter_queryset)(
+                queryset = await db_sync_to_async(backend.filter_queryset, "filters")(
                     self.context, queryset, self
                 )
         return queryset
@@ -207,6 +501,13 @@ class GenericService(services.Service):
                 self._paginator = None
             else:
                 self._paginator = self.pagination_class()
+                # INFO - Paginators based on the django paginator (as PageNumberPagination) count with the count strategy
+                if self.count_strategy != CountStrategy.EXACT and hasattr(
+                    self._paginator, "django_paginator_class"
+                ):
+                    self._paginator.django_paginator_class = functools.partial(
+                        StrategyCountPaginator, count_function=self.count_queryset
+                    )
         return self._paginator
 
     def paginate_queryset(self, queryset):
@@ -217,6 +518,56 @@ class GenericService(services.Service):
             return None
         return self.paginator.paginate_queryset(queryset, self.context, view=self)
 
+    async def apaginate_queryset(self, queryset):
+        """
+        Async ``paginate_queryset()``. With ``async_orm``, the paginators defining
+        ``apaginate_queryset`` fetch the page with the async queryset API.
+        """
+        if type(self).paginate_queryset is GenericService.paginate_queryset:
+            if self.paginator is None:
+                return None
+            if self.async_orm and hasattr(self.paginator, "apaginate_queryset"):
+                return await self.paginator.apaginate_queryset(
+                    queryset, self.context, view=self
+                )
+        return await db_sync_to_async(self.paginate_queryset, "queryset")(queryset)
+
+    def count_queryset(self, queryset):
+        """
+        Return the number of instances of the paginated `queryset` with `count_strategy`.
+        """
+        if self.count_strategy == CountStrategy.NONE:
+            return 0
+        if self.count_strategy == CountStrategy.ESTIMATE:
+            return estimate_count(queryset)
+        if self.count_strategy == CountStrategy.CACHED:
+            return cache.get_or_set(
+                self.get_count_cache_key(queryset), queryset.count, self.count_cache_timeout
+            )
+        return queryset.count()
+
+    def get_count_cache_key(self, queryset):
+        """
+        Cache key of the count of `queryset` with the "cached" count strategy.
+        The query holds the filters of the request metadata as well as any filtering
+        done in `get_queryset` (by user for example) so it is used as key.
+        """
+        sql, params = queryset.query.sql_with_params()
+        query_hash = hashlib.md5(f"{sql}{params}".encode()).hexdigest()
+        return f"django_socio_grpc:count:{self.get_service_name()}:{query_hash}"
+
+    def get_paginated_message(self, message):
+        """
+        Write the pagination state in the list `message` of the current page.
+        Paginators defining `get_paginated_message` write their own fields,
+        otherwise only `count` is set.
+        """
+        if hasattr(self.paginator, "get_paginated_message"):
+            return self.paginator.get_paginated_message(message)
+        if hasattr(message, "count"):
+            message.count = self.paginator.page.paginator.count
+        return message
+
 
 ############################################################
 #   Synchronous Service                                    #
@@ -38,6 +38,7 @@ from MyService abstract parents. This dict is then registered.
 
 import abc
 import asyncio
+import copy
 import functools
 from asyncio.coroutines import _is_coroutine
 from dataclasses import dataclass, field
@@ -46,6 +47,7 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, Uni
 from asgiref.sync import SyncToAsync
 from rest_framework.serializers import BaseSerializer
 
+from django_socio_grpc.pagination import CountStrategy
 from django_socio_grpc.protobuf.exceptions import ProtoRegistrationError
 from django_socio_grpc.protobuf.proto_classes import (
     FieldCardinality,
@@ -70,6 +72,8 @@ if TYPE_CHECKING:
 
 RequestResponseType = Union[str, Type[BaseSerializer], Placeholder, List[FieldDict]]
 
+DEFAULT_PAGINATION_RESPONSE_FIELDS: List[FieldDict] = [{"name": "count", "type": "int32"}]
+
 
 @dataclass
 class GRPCAction:
@@ -115,7 +119,11 @@ class GRPCAction:
             owner._decorated_grpc_action_registry.update({name: self.get_action_params()})
 
     def __get__(self, obj, type=None):
-        return self.clone(function=self.function.__get__(obj, type))
+        # INFO - Binding the function does not change what `__post_init__` computed so the
+        # action is copied instead of cloned, as it is done on each access to the action
+        bound_action = copy.copy(self)
+        bound_action.function = self.function.__get__(obj, type)
+        return bound_action
 
     def __call__(self, *args, **kwargs):
         return self.function(*args, **kwargs)
@@ -155,6 +163,7 @@ class GRPCAction:
         service: Type["Service"],
         as_list: bool,
         list_field_name: Optional[str],
+        is_response: bool = False,
     ):
         assert not isinstance(message, Placeholder)
         try:
@@ -178,13 +187,24 @@ class GRPCAction:
                         cardinality=FieldCardinality.REPEATED,
                     )
                 ]
-                if getattr(service, "pagination_class", None):
-                    fields.append(
-                        ProtoField(
-                            name="count",
-                            field_type="int32",
-                        )
-                    ),
+                # INFO - The pagination fields are only written in the list responses
+                pagination_class = getattr(service, "pagination_class", None)
+                if is_response and pagination_class:
+                    # INFO - The pagination class can declare the fields it writes in the response
+                    pagination_fields = getattr(
+                        pagination_class, "response_fields", DEFAULT_PAGINATION_RESPONSE_FIELDS
+                    )
+                    # INFO - The count is not generated when the service does not count its queryset
+                    if getattr(service, "count_strategy", None) == CountStrategy.NONE:
+                        pagination_fields = [
+                            field_dict
+                            for field_dict in pagination_fields
+                            if field_dict["name"] != "count"
+                        ]
+                    fields += [
+                        ProtoField.from_field_dict(field_dict)
+                        for field_dict in pagination_fields
+                    ]
 
                 base_list_name = action_name
                 prefixable = True
@@ -241,6 +261,7 @@ class GRPCAction:
             service,
             self.use_response_list,
             self.response_message_list_attr,
+            is_response=True,
         )
 
         return ProtoRpc(
@@ -2,16 +2,26 @@ import asyncio
 import errno
 import logging
 import os
+import signal
 import sys
-from concurrent import futures
+import threading
+import time
 
 import grpc
 from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
 from django.utils import autoreload
 
+from django_socio_grpc.metrics import start_metrics_http_server
+from django_socio_grpc.services.servicer_proxy import in_flight_rpcs
 from django_socio_grpc.settings import grpc_settings
+from django_socio_grpc.utils.event_loop import EVENT_LOOPS, install_event_loop_policy
+from django_socio_grpc.utils.executor import (
+    ConnectionsThreadPoolExecutor,
+    shutdown_executor,
+)
 
 logger = logging.getLogger("django_socio_grpc.internal")
 
@@ -22,6 +32,9 @@ class Command(BaseCommand):
     # Validation is called explicitly each time the server is reloaded.
     requires_system_checks = []
 
+    # Workers exiting before having run this number of seconds are restarted after a delay
+    worker_min_uptime = 1
+
     def add_arguments(self, parser):
         parser.add_argument(
             "address",
@@ -36,6 +49,30 @@ class Command(BaseCommand):
             dest="max_workers",
             help="Number of maximum worker threads.",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            dest="workers",
+            help=(
+                "Number of server processes. With more than one, each worker process runs "
+                "its own server bound to the same address (SO_REUSEPORT)."
+            ),
+        )
+        parser.add_argument(
+            "--grace-period",
+            type=float,
+            default=grpc_settings.SHUTDOWN_GRACE_PERIOD,
+            dest="grace_period",
+            help="Seconds given to in-flight RPCs to finish on SIGTERM or SIGINT.",
+        )
+        parser.add_argument(
+            "--loop",
+            choices=EVENT_LOOPS,
+            default=grpc_settings.EVENT_LOOP,
+            dest="loop",
+            help="Event loop of the server. uvloop falls back to asyncio if not installed.",
+        )
         parser.add_argument(
             "--dev",
             action="store_true",
@@ -50,11 +87,90 @@ class Command(BaseCommand):
         self.address = options["address"]
         self.development_mode = options["development_mode"]
         self.max_workers = options["max_workers"]
+        self.workers = options["workers"]
+        self.grace_period = options["grace_period"]
+        if self.workers > 1 and self.development_mode:
+            raise CommandError("--workers can not be used with --dev")
 
         # set GRPC_ASYNC to "true" in order to start server asynchronously
         grpc_settings.GRPC_ASYNC = True
+        # INFO - Installed before forking the workers so that they all use it
+        install_event_loop_policy(options.get("loop", grpc_settings.EVENT_LOOP))
+
+        if self.workers > 1:
+            self.run_workers()
+        else:
+            asyncio.run(self.run(**options))
+
+    def run_workers(self):
+        """
+        Fork `workers` server processes and restart them when they exit
+        until SIGTERM or SIGINT is received.
+        """
+        logger.info(
+            f"Starting {self.workers} async gRPC server workers at {self.address}\n",
+            extra={"emit_to_server": False},
+        )
+        # INFO - Import the handlers hook (and so services, serializers and models) once
+        # before forking. The hook itself is called in each worker with its own server.
+        grpc_settings.ROOT_HANDLERS_HOOK
+        # INFO - Database connections must not be shared with the workers
+        connections.close_all()
+        if grpc_settings.ENABLE_METRICS and grpc_settings.METRICS_PORT:
+            logger.warning("METRICS_PORT is ignored when running several workers")
+
+        self.worker_pids = {}
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.stop_workers)
+        signal.signal(signal.SIGINT, self.stop_workers)
+
+        for _ in range(self.workers):
+            self.spawn_worker()
 
-        asyncio.run(self.run(**options))
+        while self.worker_pids:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            started_at = self.worker_pids.pop(pid, None)
+            if started_at is None or self.stopping:
+                continue
+            logger.warning(f"gRPC server worker {pid} exited ({status}), restarting it")
+            if time.monotonic() - started_at < self.worker_min_uptime:
+                time.sleep(self.worker_min_uptime)
+            if not self.stopping:
+                self.spawn_worker()
+
+        logger.warning("Exit gRPC Server")
+
+    def spawn_worker(self):
+        pid = os.fork()
+        if pid:
+            self.worker_pids[pid] = time.monotonic()
+            return
+
+        # INFO - In the worker process: never return in the supervision loop of the parent
+        exit_code = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            asyncio.run(self._serve())
+        except BaseException:
+            logger.exception("gRPC server worker crashed")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def stop_workers(self, signum, frame):
+        """
+        Ask the workers to drain their in-flight RPCs and stop.
+        """
+        self.stopping = True
+        for pid in self.worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
 
     async def run(self, **options):
         """Run the server, using the autoreloader if needed."""
@@ -75,10 +191,11 @@ class Command(BaseCommand):
 
     async def _serve(self):
         try:
+            self.executor = ConnectionsThreadPoolExecutor(max_workers=self.max_workers)
             server = grpc.aio.server(
-                futures.ThreadPoolExecutor(max_workers=self.max_workers),
+                self.executor,
                 interceptors=grpc_settings.SERVER_INTERCEPTORS,
-                options=grpc_settings.SERVER_OPTIONS,
+                options=self.get_server_options(),
             )
             # INFO - AM - 05/04/202 - Make sure that ROOT_HANDLERS_HOOK is called with correct context to be able to use SynchronousOnlyOperation in it
             if asyncio.iscoroutinefunction(grpc_settings.ROOT_HANDLERS_HOOK):
@@ -87,7 +204,14 @@ class Command(BaseCommand):
                 await sync_to_async(grpc_settings.ROOT_HANDLERS_HOOK)(server)
             server.add_insecure_port(self.address)
             await server.start()
-            await server.wait_for_termination()
+            self.serve_metrics()
+            # INFO - Signal handlers can only be installed in the main thread, the autoreloader
+            # of the development mode serves in another one and is stopped by KeyboardInterrupt
+            if threading.current_thread() is not threading.main_thread():
+                await server.wait_for_termination()
+                return
+            await self.wait_for_stop_signal()
+            await self.shutdown(server)
         except OSError as e:
             # Use helpful error messages instead of ugly tracebacks.
             ERRORS = {
@@ -113,6 +237,65 @@ class Command(BaseCommand):
             await server.stop(0)
             logger.warning("Exit gRPC Server")
 
+    def get_server_options(self):
+        options = list(grpc_settings.SERVER_OPTIONS or [])
+        if self.workers > 1:
+            # INFO - All the workers listen on the same address
+            options.append(("grpc.so_reuseport", 1))
+        return options
+
+    async def wait_for_stop_signal(self):
+        loop = asyncio.get_running_loop()
+        stop_event = asyncio.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, stop_event.set)
+        await stop_event.wait()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(signum)
+
+    async def shutdown(self, server):
+        """
+        Stop accepting new RPCs, wait up to `grace_period` seconds for the in-flight ones
+        to finish and close the database connections.
+        """
+        logger.info(
+            f"Shutting down gRPC server, waiting for {in_flight_rpcs.count} in-flight RPCs",
+            extra={"emit_to_server": False},
+        )
+        stop_task = asyncio.ensure_future(server.stop(self.grace_period))
+        drained = await sync_to_async(in_flight_rpcs.wait, thread_sensitive=False)(
+            self.grace_period
+        )
+        if not drained:
+            logger.warning(
+                f"{in_flight_rpcs.count} RPCs still in flight after {self.grace_period}s, cancelling them",
+                extra={"emit_to_server": False},
+            )
+        await stop_task
+        # INFO - close_all only closes the connections of its thread: the thread-sensitive
+        # thread, the threads of the server executor and of the sync_to_async pool
+        await sync_to_async(connections.close_all)()
+        await sync_to_async(self.close_executor_connections, thread_sensitive=False)()
+        logger.warning("Exit gRPC Server", extra={"emit_to_server": False})
+
+    def close_executor_connections(self):
+        """
+        Shut down the server executor and the `db_sync_to_async` pool, closing the
+        database connections of their threads once they exited.
+        """
+        executor = getattr(self, "executor", None)
+        if executor is not None:
+            executor.shutdown(close_connections=True)
+        shutdown_executor(close_connections=True)
+
+    def serve_metrics(self):
+        if not grpc_settings.ENABLE_METRICS or not grpc_settings.METRICS_PORT:
+            return
+        # INFO - Metrics are recorded by process, the workers can not share a port
+        if self.workers > 1:
+            return
+        start_metrics_http_server(grpc_settings.METRICS_PORT, grpc_settings.METRICS_ADDRESS)
+
     def inner_run(self, *args, **options):
         # ------------------------------------------------------------------------
         # If an exception was silenced in ManagementUtility.execute in order
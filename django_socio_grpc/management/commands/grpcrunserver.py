@@ -1,15 +1,23 @@
 import errno
 import logging
 import os
+import signal
 import sys
-from concurrent import futures
+import threading
 
 import grpc
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import connections
 from django.utils import autoreload
 
+from django_socio_grpc.metrics import start_metrics_http_server
+from django_socio_grpc.services.servicer_proxy import in_flight_rpcs
 from django_socio_grpc.settings import grpc_settings
+from django_socio_grpc.utils.executor import (
+    ConnectionsThreadPoolExecutor,
+    shutdown_executor,
+)
 
 logger = logging.getLogger("django_socio_grpc.internal")
 
@@ -34,6 +42,13 @@ class Command(BaseCommand):
             dest="max_workers",
             help="Number of maximum worker threads.",
         )
+        parser.add_argument(
+            "--grace-period",
+            type=float,
+            default=grpc_settings.SHUTDOWN_GRACE_PERIOD,
+            dest="grace_period",
+            help="Seconds given to in-flight RPCs to finish on SIGTERM or SIGINT.",
+        )
         parser.add_argument(
             "--reflection", default="", dest="reflection", help="Start gRPC Server Reflection."
         )
@@ -56,6 +71,7 @@ class Command(BaseCommand):
         self.reflection = options["reflection"]
         self.development_mode = options["development_mode"]
         self.max_workers = options["max_workers"]
+        self.grace_period = options["grace_period"]
         self.run(**options)
 
     def run(self, **options):
@@ -81,8 +97,9 @@ class Command(BaseCommand):
 
         # ----------------------------------------------
         # --- Instantiate the gRPC server itself     ---
+        self.executor = ConnectionsThreadPoolExecutor(max_workers=self.max_workers)
         server = grpc.server(
-            futures.ThreadPoolExecutor(max_workers=self.max_workers),
+            self.executor,
             interceptors=grpc_settings.SERVER_INTERCEPTORS,
             options=grpc_settings.SERVER_OPTIONS,
         )
@@ -95,7 +112,55 @@ class Command(BaseCommand):
         # ---  common start of the gRPC server itself  ---
         server.add_insecure_port(self.address)
         server.start()
-        server.wait_for_termination()
+        self.serve_metrics()
+
+        # INFO - Signal handlers can only be installed in the main thread, the autoreloader
+        # of the development mode serves in another one and is stopped by KeyboardInterrupt
+        if threading.current_thread() is not threading.main_thread():
+            server.wait_for_termination()
+            return
+
+        stop_event = threading.Event()
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+        signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+        stop_event.wait()
+        self.shutdown(server)
+
+    def shutdown(self, server):
+        """
+        Stop accepting new RPCs, wait up to `grace_period` seconds for the in-flight ones
+        to finish and close the database connections.
+        """
+        logger.info(
+            f"Shutting down gRPC server, waiting for {in_flight_rpcs.count} in-flight RPCs"
+        )
+        stopped_event = server.stop(self.grace_period)
+        if not in_flight_rpcs.wait(self.grace_period):
+            logger.warning(
+                f"{in_flight_rpcs.count} RPCs still in flight after {self.grace_period}s, cancelling them"
+            )
+        if stopped_event is not None:
+            stopped_event.wait()
+        # INFO - close_all only closes the connections of its thread, the RPCs ran in the
+        # threads of the server executor
+        connections.close_all()
+        self.close_executor_connections()
+        logger.warning("Exit gRPC Server")
+
+    def close_executor_connections(self):
+        """
+        Shut down the server executor and the `db_sync_to_async` pool, closing the
+        database connections of their threads once they exited.
+        """
+        executor = getattr(self, "executor", None)
+        if executor is not None:
+            executor.shutdown(close_connections=True)
+        shutdown_executor(close_connections=True)
+
+    def serve_metrics(self):
+        if not grpc_settings.ENABLE_METRICS or not grpc_settings.METRICS_PORT:
+            return
+        start_metrics_http_server(grpc_settings.METRICS_PORT, grpc_settings.METRICS_ADDRESS)
 
     def inner_run(self, *args, **options):
         # ------------------------------------------------------------------------
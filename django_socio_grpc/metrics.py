@@ -0,0 +1,302 @@
+"""
+In-process metrics of the gRPC actions.
+
+When `ENABLE_METRICS` is set, the servicer proxies record for each `Service/action`
+the number of handled RPCs by status code, a latency histogram, the number of sent
+messages and the number of RPCs in flight. The sync calls of the async services record
+the number of calls waiting for and running in each executor thread. The metrics are
+kept in memory, by process, and exported in the Prometheus text format either:
+
+- from a local HTTP port with `start_metrics_http_server` (started by the run commands
+  when the `METRICS_PORT` setting is set),
+- from the `django_socio_grpc.Metrics/Export` gRPC method added to a server with
+  `add_metrics_handler_to_server`.
+"""
+import logging
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+import grpc
+from google.protobuf import empty_pb2, wrappers_pb2
+
+from django_socio_grpc.exceptions import get_exception_status_code_and_details
+from django_socio_grpc.settings import grpc_settings
+
+logger = logging.getLogger("django_socio_grpc.internal")
+
+METRICS_SERVICE_NAME = "django_socio_grpc.Metrics"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OK_CODE = grpc.StatusCode.OK.name
+CANCELLED_CODE = grpc.StatusCode.CANCELLED.name
+
+
+class ActionMetrics:
+    """
+    Metrics of one action. Each RPC takes the lock twice, only to update a few counters.
+    """
+
+    def __init__(self, service_name: str, action: str, buckets: Tuple[float, ...]):
+        self.service_name = service_name
+        self.action = action
+        self.buckets = tuple(sorted(buckets))
+        self.handled: Dict[str, int] = {}
+        self.in_flight = 0
+        self.messages_sent = 0
+        # INFO - Not cumulative, the last one counts the latencies above the largest bucket
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.latency_sum = 0.0
+        self._lock = threading.Lock()
+
+    def start(self) -> float:
+        with self._lock:
+            self.in_flight += 1
+        return time.perf_counter()
+
+    def observe(
+        self,
+        exception: Optional[Exception],
+        started_at: float,
+        messages_sent: int,
+        cancelled: bool = False,
+    ):
+        latency = time.perf_counter() - started_at
+        if cancelled:
+            code = CANCELLED_CODE
+        elif exception is None:
+            code = OK_CODE
+        else:
+            code = get_exception_status_code_and_details(exception)[0].name
+        bucket = bisect_left(self.buckets, latency)
+        with self._lock:
+            self.in_flight -= 1
+            self.handled[code] = self.handled.get(code, 0) + 1
+            self.messages_sent += messages_sent
+            self.bucket_counts[bucket] += 1
+            self.latency_sum += latency
+
+    def snapshot(self):
+        with self._lock:
+            return (
+                dict(self.handled),
+                self.in_flight,
+                self.messages_sent,
+                list(self.bucket_counts),
+                self.latency_sum,
+            )
+
+
+class ExecutorMetrics:
+    """
+    Metrics of the sync calls run in threads by the async services, for one executor.
+    A call is pending from its submission until a thread starts running it.
+    """
+
+    def __init__(self, executor: str):
+        self.executor = executor
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.wait_sum = 0.0
+        self._lock = threading.Lock()
+
+    def submit(self) -> float:
+        with self._lock:
+            self.pending += 1
+        return time.perf_counter()
+
+    def start(self, submitted_at: float):
+        wait = time.perf_counter() - submitted_at
+        with self._lock:
+            self.pending -= 1
+            self.running += 1
+            self.wait_sum += wait
+
+    def cancel(self):
+        with self._lock:
+            self.pending -= 1
+
+    def finish(self):
+        with self._lock:
+            self.running -= 1
+            self.completed += 1
+
+    def snapshot(self):
+        with self._lock:
+            return self.pending, self.running, self.completed, self.wait_sum
+
+
+def _format_labels(**labels) -> str:
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return ",".join(f'{name}="{escape(value)}"' for name, value in labels.items())
+
+
+class MetricsRegistry:
+    """
+    Metrics of all the actions of the process.
+    """
+
+    def __init__(self):
+        self.actions: Dict[Tuple[str, str], ActionMetrics] = {}
+        self.executors: Dict[str, ExecutorMetrics] = {}
+
+    def get_action_metrics(self, service_name: str, action: str) -> ActionMetrics:
+        key = (service_name, action)
+        try:
+            return self.actions[key]
+        except KeyError:
+            return self.actions.setdefault(
+                key,
+                ActionMetrics(service_name, action, grpc_settings.METRICS_HISTOGRAM_BUCKETS),
+            )
+
+    def get_executor_metrics(self, executor: str) -> ExecutorMetrics:
+        try:
+            return self.executors[executor]
+        except KeyError:
+            return self.executors.setdefault(executor, ExecutorMetrics(executor))
+
+    def clear(self):
+        self.actions.clear()
+        self.executors.clear()
+
+    def export(self) -> str:
+        """
+        Return the metrics in the Prometheus text format.
+        """
+        handled_lines = []
+        in_flight_lines = []
+        messages_lines = []
+        latency_lines = []
+        for metrics in list(self.actions.values()):
+            handled, in_flight, messages_sent, bucket_counts, latency_sum = metrics.snapshot()
+            labels = {"grpc_service": metrics.service_name, "grpc_method": metrics.action}
+            for code, count in sorted(handled.items()):
+                handled_lines.append(
+                    f"grpc_server_handled_total{{{_format_labels(**labels, grpc_code=code)}}} {count}"
+                )
+            in_flight_lines.append(
+                f"grpc_server_in_flight_rpcs{{{_format_labels(**labels)}}} {in_flight}"
+            )
+            messages_lines.append(
+                f"grpc_server_msg_sent_total{{{_format_labels(**labels)}}} {messages_sent}"
+            )
+            cumulative_count = 0
+            for le, count in zip((*metrics.buckets, "+Inf"), bucket_counts):
+                cumulative_count += count
+                latency_lines.append(
+                    f"grpc_server_handling_seconds_bucket{{{_format_labels(**labels, le=le)}}} {cumulative_count}"
+                )
+            latency_lines.append(
+                f"grpc_server_handling_seconds_sum{{{_format_labels(**labels)}}} {latency_sum}"
+            )
+            latency_lines.append(
+                f"grpc_server_handling_seconds_count{{{_format_labels(**labels)}}} {cumulative_count}"
+            )
+        executor_lines = {
+            "pending": [],
+            "running": [],
+            "completed": [],
+            "wait": [],
+        }
+        for metrics in list(self.executors.values()):
+            pending, running, completed, wait_sum = metrics.snapshot()
+            labels = _format_labels(executor=metrics.executor)
+            executor_lines["pending"].append(
+                f"grpc_server_sync_to_async_pending_calls{{{labels}}} {pending}"
+            )
+            executor_lines["running"].append(
+                f"grpc_server_sync_to_async_running_calls{{{labels}}} {running}"
+            )
+            executor_lines["completed"].append(
+                f"grpc_server_sync_to_async_calls_total{{{labels}}} {completed}"
+            )
+            executor_lines["wait"].append(
+                f"grpc_server_sync_to_async_wait_seconds_total{{{labels}}} {wait_sum}"
+            )
+
+        lines = [
+            "# HELP grpc_server_handled_total Total number of RPCs completed on the server.",
+            "# TYPE grpc_server_handled_total counter",
+            *handled_lines,
+            "# HELP grpc_server_in_flight_rpcs Number of RPCs being handled by the server.",
+            "# TYPE grpc_server_in_flight_rpcs gauge",
+            *in_flight_lines,
+            "# HELP grpc_server_msg_sent_total Total number of response messages sent by the server.",
+            "# TYPE grpc_server_msg_sent_total counter",
+            *messages_lines,
+            "# HELP grpc_server_handling_seconds Latency of the RPCs handled by the server.",
+            "# TYPE grpc_server_handling_seconds histogram",
+            *latency_lines,
+        ]
+        if self.executors:
+            lines += [
+                "# HELP grpc_server_sync_to_async_pending_calls Number of sync calls waiting for a thread.",
+                "# TYPE grpc_server_sync_to_async_pending_calls gauge",
+                *executor_lines["pending"],
+                "# HELP grpc_server_sync_to_async_running_calls Number of sync calls running in a thread.",
+                "# TYPE grpc_server_sync_to_async_running_calls gauge",
+                *executor_lines["running"],
+                "# HELP grpc_server_sync_to_async_calls_total Total number of sync calls completed.",
+                "# TYPE grpc_server_sync_to_async_calls_total counter",
+                *executor_lines["completed"],
+                "# HELP grpc_server_sync_to_async_wait_seconds_total Total time the sync calls waited for a thread.",
+                "# TYPE grpc_server_sync_to_async_wait_seconds_total counter",
+                *executor_lines["wait"],
+            ]
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+class MetricsHTTPRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = metrics_registry.export().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_http_server(port: int, address: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    Serve the metrics on `address:port` from a daemon thread.
+    """
+    http_server = ThreadingHTTPServer((address, port), MetricsHTTPRequestHandler)
+    thread = threading.Thread(
+        target=http_server.serve_forever, name="grpc-metrics-http-server", daemon=True
+    )
+    thread.start()
+    logger.info(f"Serving gRPC metrics at http://{address or '0.0.0.0'}:{port}/metrics")
+    return http_server
+
+
+def export_metrics(request, context):
+    return wrappers_pb2.StringValue(value=metrics_registry.export())
+
+
+def add_metrics_handler_to_server(server):
+    """
+    Add the `django_socio_grpc.Metrics/Export` method to `server`. It takes a
+    `google.protobuf.Empty` and returns the metrics in a `google.protobuf.StringValue`.
+    """
+    handler = grpc.method_handlers_generic_handler(
+        METRICS_SERVICE_NAME,
+        {
+            "Export": grpc.unary_unary_rpc_method_handler(
+                export_metrics,
+                request_deserializer=empty_pb2.Empty.FromString,
+                response_serializer=wrappers_pb2.StringValue.SerializeToString,
+            )
+        },
+    )
+    server.add_generic_rpc_handlers((handler,))
@@ -8,42 +8,50 @@ middlewares as sync and async compatible
 
 import asyncio
 import logging
-from typing import Callable
+import time
+from contextvars import ContextVar
+from typing import Callable, Optional
 
-from asgiref.sync import async_to_sync, sync_to_async
+from asgiref.sync import async_to_sync
 from django import db
+from django.db.backends.signals import connection_created
 from django.utils import translation
 from django.utils.decorators import sync_and_async_middleware
 from django.utils.translation import get_language_from_request
 
+from django_socio_grpc.exceptions import QueryBudgetExceeded
 from django_socio_grpc.services.servicer_proxy import GRPCRequestContainer
 from django_socio_grpc.settings import grpc_settings
-from django_socio_grpc.utils.utils import safe_async_response
+from django_socio_grpc.utils.connections import (
+    _close_old_connections,
+    connection_health_manager,
+    track_connections,
+)
+from django_socio_grpc.utils.executor import db_sync_to_async
+from django_socio_grpc.utils.utils import isgeneratorfunction, safe_async_response
 
 logger = logging.getLogger("django_socio_grpc.middlewares")
 
 
-def _close_old_connections():
-    for conn in db.connections.all():
-        if conn.connection is None:
-            continue
-        if conn.get_autocommit():
-            conn.close_if_unusable_or_obsolete()
-
-
 @sync_and_async_middleware
 def close_old_connections_middleware(get_response: Callable):
+    """
+    Close the obsolete database connections before and after each RPC, as Django does for
+    each HTTP request. In async mode the check only hops to a thread when a connection
+    opened by the sync code of the services may need to be closed, see `ConnectionHealthManager`.
+    """
     if asyncio.iscoroutinefunction(get_response):
+        track_connections()
 
         async def middleware(request: GRPCRequestContainer):
             db.reset_queries()
-            await sync_to_async(_close_old_connections)()
+            await connection_health_manager.acheck()
             try:
                 # INFO - L.G. - 03/01/2023 - We need to use safe_async_response here
                 # because get_response might return a generator
                 return await safe_async_response(get_response, request)
             finally:
-                await sync_to_async(_close_old_connections)()
+                await connection_health_manager.acheck()
 
     else:
 
@@ -58,6 +66,169 @@ def close_old_connections_middleware(get_response: Callable):
     return middleware
 
 
+class QueryStats:
+    """
+    Number and duration of the database queries of an RPC and of its stream messages.
+    """
+
+    def __init__(self, request: GRPCRequestContainer):
+        self.request = request
+        self.count = 0
+        self.duration = 0.0
+        self.messages = 0
+        self.max_message_count = 0
+        self._message_start_count = 0
+        self.budget = self.get_budget()
+        self.budget_exceeded = False
+
+    def get_budget(self) -> Optional[int]:
+        budget = self.request.service.query_budget
+        if isinstance(budget, dict):
+            return budget.get(self.request.action, grpc_settings.QUERY_BUDGET)
+        return budget
+
+    @property
+    def path(self):
+        return f"{self.request.service.get_service_name()}/{self.request.action}"
+
+    def record(self, duration: float):
+        self.count += 1
+        self.duration += duration
+
+    def end_message(self):
+        message_count = self.count - self._message_start_count
+        self._message_start_count = self.count
+        self.messages += 1
+        self.max_message_count = max(self.max_message_count, message_count)
+        logger.debug(f"{message_count} queries for message {self.messages} of {self.path}")
+        self.check_budget()
+
+    def check_budget(self):
+        if self.budget is None or self.count <= self.budget or self.budget_exceeded:
+            return
+        self.budget_exceeded = True
+        message = (
+            f"{self.path} made {self.count} queries, more than its budget of {self.budget}"
+        )
+        if grpc_settings.RAISE_ON_QUERY_BUDGET_EXCEEDED:
+            raise QueryBudgetExceeded(detail=message)
+        logger.warning(message, extra={"request": self.request, **self.get_log_extra()})
+
+    def get_log_extra(self):
+        log_extra = {"query_count": self.count, "query_duration": self.duration}
+        if self.messages:
+            log_extra["max_message_query_count"] = self.max_message_count
+        return log_extra
+
+
+_query_stats = ContextVar("query_stats", default=None)
+
+
+def _record_query(execute, sql, params, many, context):
+    query_stats = _query_stats.get()
+    if query_stats is None:
+        return execute(sql, params, many, context)
+    started_at = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        query_stats.record(time.perf_counter() - started_at)
+
+
+def _install_query_recorder(connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def _start_query_stats(request: GRPCRequestContainer) -> QueryStats:
+    query_stats = QueryStats(request)
+    _query_stats.set(query_stats)
+    return query_stats
+
+
+def _end_query_stats(query_stats: QueryStats):
+    _query_stats.set(None)
+    query_stats.request.log_extra.update(query_stats.get_log_extra())
+
+
+def _sync_stream_with_query_stats(stream, query_stats: QueryStats):
+    try:
+        for message in stream:
+            query_stats.end_message()
+            yield message
+    finally:
+        _end_query_stats(query_stats)
+    query_stats.check_budget()
+
+
+async def _async_stream_with_query_stats(stream, query_stats: QueryStats):
+    try:
+        async for message in stream:
+            query_stats.end_message()
+            yield message
+    finally:
+        _end_query_stats(query_stats)
+    query_stats.check_budget()
+
+
+@sync_and_async_middleware
+def query_count_middleware(get_response: Callable):
+    """
+    Count the database queries of each RPC and their duration, for streams also by sent message.
+    The count and duration are added to the response log record as `query_count` and
+    `query_duration` (and `max_message_query_count` for streams).
+    When an RPC makes more queries than the `query_budget` of its service (default is the
+    `QUERY_BUDGET` setting), a warning is logged or, with `RAISE_ON_QUERY_BUDGET_EXCEEDED`,
+    `QueryBudgetExceeded` is raised.
+
+    Queries are recorded by a wrapper of the database connections (`execute_wrappers`),
+    installed on the connections of the thread loading the middleware and on each new connection.
+    """
+    connection_created.connect(
+        _install_query_recorder, dispatch_uid="django_socio_grpc.query_count_middleware"
+    )
+    for connection in db.connections.all():
+        _install_query_recorder(connection)
+
+    if asyncio.iscoroutinefunction(get_response):
+
+        async def middleware(request: GRPCRequestContainer):
+            query_stats = _start_query_stats(request)
+            try:
+                response = await safe_async_response(get_response, request)
+            except BaseException:
+                _end_query_stats(query_stats)
+                raise
+            if isgeneratorfunction(getattr(request.service, request.action)):
+                response.response.grpc_response = _async_stream_with_query_stats(
+                    response.response.grpc_response, query_stats
+                )
+                return response
+            _end_query_stats(query_stats)
+            query_stats.check_budget()
+            return response
+
+    else:
+
+        def middleware(request: GRPCRequestContainer):
+            query_stats = _start_query_stats(request)
+            try:
+                response = get_response(request)
+            except BaseException:
+                _end_query_stats(query_stats)
+                raise
+            if isgeneratorfunction(getattr(request.service, request.action)):
+                response.response.grpc_response = _sync_stream_with_query_stats(
+                    response.response.grpc_response, query_stats
+                )
+                return response
+            _end_query_stats(query_stats)
+            query_stats.check_budget()
+            return response
+
+    return middleware
+
+
 def _log_requests(request: GRPCRequestContainer):
     if (
         f"{request.service.__class__.__name__}.{request.action}"
@@ -119,7 +290,9 @@ def auth_without_session_middleware(get_response: Callable):
             if asyncio.iscoroutinefunction(request.service.perform_authentication):
                 await request.service.perform_authentication()
             else:
-                await sync_to_async(request.service.perform_authentication)()
+                await db_sync_to_async(
+                    request.service.perform_authentication, "authentication"
+                )()
             return await safe_async_response(get_response, request)
 
     else:
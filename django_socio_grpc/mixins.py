@@ -1,7 +1,21 @@
+import asyncio
+import queue
+import threading
+import time
+from importlib import import_module
+from itertools import islice
+
 from asgiref.sync import sync_to_async
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models.query import QuerySet
 from google.protobuf import empty_pb2
 from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.model_meta import get_field_info
+from rest_framework.validators import UniqueValidator
 
+from .cache import invalidate_response_cache
 from .decorators import grpc_action
 from .grpc_actions.actions import GRPCActionMixin
 from .grpc_actions.placeholders import (
@@ -11,9 +25,10 @@ from .grpc_actions.placeholders import (
     StrTemplatePlaceholder,
 )
 from .grpc_actions.utils import get_serializer_base_name
-from .protobuf.json_format import message_to_dict
+from .protobuf.decoder import decode_message
 from .settings import grpc_settings
-from .utils.constants import DEFAULT_LIST_FIELD_NAME, REQUEST_SUFFIX
+from .utils.constants import DEFAULT_LIST_FIELD_NAME, REQUEST_SUFFIX, RESPONSE_SUFFIX
+from .utils.executor import db_sync_to_async
 
 
 ############################################################
@@ -76,9 +91,7 @@ class ListModelMixin(GRPCActionMixin):
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
-            if hasattr(serializer.message, "count"):
-                serializer.message.count = self.paginator.page.paginator.count
-            return serializer.message
+            return self.get_paginated_message(serializer.message)
         else:
             serializer = self.get_serializer(queryset, many=True)
             return serializer.message
@@ -112,6 +125,10 @@ class ListModelMixin(GRPCActionMixin):
 
 
 class StreamModelMixin(GRPCActionMixin):
+    # INFO - Number of instances fetched and serialized at once when streaming a not paginated queryset.
+    # If None the whole queryset is serialized before sending the first message.
+    stream_chunk_size = None
+
     @grpc_action(
         request=[],
         request_name=StrTemplatePlaceholder(
@@ -134,11 +151,35 @@ class StreamModelMixin(GRPCActionMixin):
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True, stream=True)
+        elif self.stream_chunk_size:
+            for messages in self.get_stream_messages(queryset):
+                yield from messages
+            return
         else:
             serializer = self.get_serializer(queryset, many=True, stream=True)
 
         yield from serializer.message
 
+    def get_stream_chunks(self, queryset):
+        """
+        Iterate over the queryset by lists of ``stream_chunk_size`` instances.
+        Querysets are fetched with ``QuerySet.iterator`` that use a server side
+        cursor when the database supports it, so only one chunk is in memory.
+        """
+        if isinstance(queryset, QuerySet):
+            iterator = queryset.iterator(chunk_size=self.stream_chunk_size)
+        else:
+            iterator = iter(queryset)
+        while chunk := list(islice(iterator, self.stream_chunk_size)):
+            yield chunk
+
+    def get_stream_messages(self, queryset):
+        """
+        Iterate over the list of messages of each chunk of the queryset.
+        """
+        for chunk in self.get_stream_chunks(queryset):
+            yield self.get_serializer(chunk, many=True, stream=True).message
+
     @staticmethod
     def get_default_method(model_name):
         return {
@@ -269,7 +310,7 @@ class PartialUpdateModelMixin(GRPCActionMixin):
         Performs a partial update on the given `_partial_update_fields`.
         """
 
-        content = message_to_dict(request)
+        content = decode_message(request)
 
         data = {k: v for k, v in content.items() if k in request._partial_update_fields}
 
@@ -348,6 +389,489 @@ class DestroyModelMixin(GRPCActionMixin):
         }
 
 
+def _overrides_save_method(serializer, method_name):
+    """
+    Return whether the class of `serializer` customizes its `method_name` (``create`` or
+    ``update``), that the bulk writes would skip.
+    """
+    return getattr(type(serializer), method_name) is not getattr(
+        serializers.ModelSerializer, method_name
+    )
+
+
+def _bulk_create_instances(serializer, validated_data):
+    """
+    Create the instances of each item of `validated_data` with one ``bulk_create``.
+    The to many relations are set after, one item at a time.
+    If `serializer` (the serializer of one item) overrides ``create``, it is called
+    for each item instead.
+    """
+    if _overrides_save_method(serializer, "create"):
+        return [serializer.create(dict(attrs)) for attrs in validated_data]
+    model = serializer.Meta.model
+    info = get_field_info(model)
+    instances = []
+    to_many_relations = []
+    for attrs in validated_data:
+        attrs = dict(attrs)
+        to_many_relations.append(
+            {
+                field_name: attrs.pop(field_name)
+                for field_name, relation_info in info.relations.items()
+                if relation_info.to_many and field_name in attrs
+            }
+        )
+        instances.append(model(**attrs))
+
+    model._default_manager.bulk_create(instances)
+
+    for instance, relations in zip(instances, to_many_relations):
+        for field_name, value in relations.items():
+            getattr(instance, field_name).set(value)
+    # INFO - bulk_create does not send the post_save signal
+    invalidate_response_cache(model)
+    return instances
+
+
+def _bulk_update_instances(model, serializers):
+    """
+    Write the validated data of each serializer in its instance and save them
+    with one ``bulk_update``. The to many relations are set after, one item at a time.
+    If the serializers override ``update``, each one is saved instead.
+    """
+    if serializers and _overrides_save_method(serializers[0], "update"):
+        return [serializer.save() for serializer in serializers]
+    info = get_field_info(model)
+    concrete_fields = {
+        field.name for field in model._meta.concrete_fields if not field.primary_key
+    }
+    update_fields = set()
+    to_many_relations = []
+    for serializer in serializers:
+        instance = serializer.instance
+        for attr, value in serializer.validated_data.items():
+            if attr in info.relations and info.relations[attr].to_many:
+                to_many_relations.append((instance, attr, value))
+            else:
+                setattr(instance, attr, value)
+                if attr in concrete_fields:
+                    update_fields.add(attr)
+
+    instances = [serializer.instance for serializer in serializers]
+    if update_fields:
+        model._default_manager.bulk_update(instances, sorted(update_fields))
+
+    for instance, attr, value in to_many_relations:
+        getattr(instance, attr).set(value)
+    # INFO - bulk_update does not send the post_save signal
+    invalidate_response_cache(model)
+
+    for instance in instances:
+        if getattr(instance, "_prefetched_objects_cache", None):
+            # If 'prefetch_related' has been applied to a queryset, we need to
+            # forcibly invalidate the prefetch cache on the instance.
+            instance._prefetched_objects_cache = {}
+    return instances
+
+
+def _bulk_upsert_instances(model, validated_data, unique_field):
+    """
+    Create or update the instances of `model` of each item of `validated_data` with one
+    ``bulk_create``, updating the rows conflicting on `unique_field`.
+    """
+    concrete_fields = {field.name for field in model._meta.concrete_fields}
+    instances = []
+    update_fields = set()
+    for attrs in validated_data:
+        attrs = {attr: value for attr, value in attrs.items() if attr in concrete_fields}
+        update_fields.update(attrs)
+        instances.append(model(**attrs))
+    update_fields.discard(unique_field)
+
+    if update_fields:
+        model._default_manager.bulk_create(
+            instances,
+            update_conflicts=True,
+            unique_fields=[unique_field],
+            update_fields=sorted(update_fields),
+        )
+    else:
+        model._default_manager.bulk_create(instances, ignore_conflicts=True)
+    invalidate_response_cache(model)
+    return instances
+
+
+_STREAM_END = object()
+
+
+def _read_stream_in_thread(request):
+    """
+    Read the messages of the `request` stream in a thread, so that they can be waited
+    for with a timeout. Return the queue receiving them, then `_STREAM_END` or the
+    exception raised by the stream.
+    """
+    messages = queue.Queue()
+
+    def read():
+        try:
+            for message in request:
+                messages.put(message)
+        except BaseException as e:
+            messages.put(e)
+        else:
+            messages.put(_STREAM_END)
+
+    threading.Thread(target=read, name="grpc-stream-reader", daemon=True).start()
+    return messages
+
+
+def _get_response_class(service, action):
+    """
+    Return the generated class of the response message of `action`, from the pb2 module
+    of the app handler registering `service`.
+    """
+    app_handler = service._app_handler
+    # INFO - The actions of the async mixins are plain functions until registered
+    response_name = getattr(getattr(type(service), action), "response_message_name", None)
+    if app_handler is None or response_name is None:
+        raise ImproperlyConfigured(
+            f"{service.get_service_name()} must be registered by an AppHandlerRegistry "
+            f"to resolve the response message of {action}"
+        )
+    return getattr(import_module(app_handler.get_pb2_module()), response_name)
+
+
+class BulkCreateModelMixin(GRPCActionMixin):
+    @grpc_action(
+        request=SelfSerializer,
+        request_name=StrTemplatePlaceholder(
+            f"{{}}BulkCreate{REQUEST_SUFFIX}", get_serializer_base_name
+        ),
+        response=SelfSerializer,
+        use_request_list=True,
+        use_response_list=True,
+    )
+    def BulkCreate(self, request, context):
+        """
+        Create model instances.
+
+        The request should be a list message of ``serializer.Meta.proto_class``.
+        All the items are validated before creating any instance: if one is invalid
+        the error details hold the errors of each item, in the request order.
+        The instances are created with a single ``bulk_create`` in a transaction and
+        returned in a list message of ``serializer.Meta.proto_class``.
+        """
+        serializer = self.get_serializer(message=request, many=True)
+        serializer.is_valid(raise_exception=True)
+        self.perform_bulk_create(serializer)
+        return serializer.message
+
+    def perform_bulk_create(self, serializer):
+        """Save the new object instances."""
+        with transaction.atomic():
+            serializer.instance = _bulk_create_instances(
+                serializer.child, serializer.validated_data
+            )
+
+
+class BulkUpdateModelMixin(GRPCActionMixin):
+    @grpc_action(
+        request=SelfSerializer,
+        request_name=StrTemplatePlaceholder(
+            f"{{}}BulkUpdate{REQUEST_SUFFIX}", get_serializer_base_name
+        ),
+        response=SelfSerializer,
+        use_request_list=True,
+        use_response_list=True,
+    )
+    def BulkUpdate(self, request, context):
+        """
+        Update model instances.
+
+        The request should be a list message of ``serializer.Meta.proto_class``,
+        each item including a field corresponding to ``lookup_request_field``.
+        The instances are fetched with a single query and all the items are validated
+        before updating any instance: if one is invalid the error details hold the
+        errors of each item, in the request order. The instances are saved with a
+        single ``bulk_update`` in a transaction and returned in a list message of
+        ``serializer.Meta.proto_class``.
+        """
+        data = self.get_serializer(many=True).message_to_data(request)
+        lookup_request_field = self.get_lookup_request_field()
+        instances = self.get_bulk_objects([item.get(lookup_request_field) for item in data])
+        serializers = self.get_bulk_update_serializers(instances, data)
+        self.perform_bulk_update(serializers)
+        return self.get_serializer(instances, many=True).message
+
+    def get_bulk_update_serializers(self, instances, data):
+        """
+        Return a validated serializer by instance and item of data. Raise a
+        ``ValidationError`` with the errors of each item if one of them is invalid.
+        """
+        serializers = [
+            self.get_serializer(instance, data=item) for instance, item in zip(instances, data)
+        ]
+        errors = [
+            {} if serializer.is_valid() else serializer.errors for serializer in serializers
+        ]
+        if any(errors):
+            raise ValidationError(errors)
+        return serializers
+
+    def perform_bulk_update(self, serializers):
+        """Save the existing object instances."""
+        with transaction.atomic():
+            _bulk_update_instances(self.get_serializer_class().Meta.model, serializers)
+
+
+class BulkDestroyModelMixin(GRPCActionMixin):
+    @grpc_action(
+        request=LookupField,
+        request_name=StrTemplatePlaceholder(
+            f"{{}}BulkDestroy{REQUEST_SUFFIX}", get_serializer_base_name
+        ),
+        response=[],
+        use_request_list=True,
+    )
+    def BulkDestroy(self, request, context):
+        """
+        Destroy model instances.
+
+        The request should be a list message of items including a field corresponding
+        to ``lookup_request_field``. The instances are deleted with a single filtered
+        delete in a transaction, or none of them if one can not be found.
+        This returns a proto message of ``google.protobuf.empty_pb2.Empty``.
+        """
+        lookup_request_field = self.get_lookup_request_field()
+        instances = self.get_bulk_objects(
+            [
+                getattr(item, lookup_request_field)
+                for item in getattr(request, DEFAULT_LIST_FIELD_NAME)
+            ]
+        )
+        self.perform_bulk_destroy(instances)
+        return empty_pb2.Empty()
+
+    def perform_bulk_destroy(self, instances):
+        """Delete the object instances."""
+        if not instances:
+            return
+        model = type(instances[0])
+        with transaction.atomic():
+            model._default_manager.filter(
+                pk__in=[instance.pk for instance in instances]
+            ).delete()
+
+
+class StreamCreateModelMixin(GRPCActionMixin):
+    # INFO - Number of streamed messages validated and created at once with ``bulk_create``
+    stream_create_batch_size = 500
+
+    @grpc_action(
+        request=SelfSerializer,
+        request_stream=True,
+        response=[
+            {"name": "count", "type": "int32"},
+            {"name": "batch_count", "type": "int32"},
+        ],
+        response_name=StrTemplatePlaceholder(
+            f"{{}}StreamCreate{RESPONSE_SUFFIX}", get_serializer_base_name
+        ),
+    )
+    def StreamCreate(self, request, context):
+        """
+        Create model instances from a stream of messages.
+
+        The request should be a stream of ``serializer.Meta.proto_class`` messages.
+        They are validated and created with ``bulk_create`` by batches of
+        ``stream_create_batch_size``, each one in its own transaction.
+        This returns the number of created instances and batches.
+
+        .. note::
+
+            This is a client streaming RPC.
+        """
+        count = batch_count = 0
+        batch = []
+        for message in request:
+            batch.append(decode_message(message))
+            if len(batch) >= self.stream_create_batch_size:
+                count += self.create_stream_batch(batch, count)
+                batch_count += 1
+                batch = []
+        if batch:
+            count += self.create_stream_batch(batch, count)
+            batch_count += 1
+        return self.get_stream_create_response_class()(count=count, batch_count=batch_count)
+
+    def create_stream_batch(self, data, offset):
+        """
+        Validate and create a batch of decoded messages. If one is invalid, nothing is
+        created and a ``ValidationError`` is raised with the errors of the first invalid
+        message, keyed by its position in the stream.
+        """
+        serializer = self.get_serializer(data=data, many=True)
+        if not serializer.is_valid():
+            invalid_index, errors = next(
+                (index, errors) for index, errors in enumerate(serializer.errors) if errors
+            )
+            raise ValidationError({str(offset + invalid_index): errors})
+        self.perform_stream_create(serializer.validated_data)
+        return len(data)
+
+    def perform_stream_create(self, validated_data):
+        """Save a batch of new object instances."""
+        with transaction.atomic():
+            _bulk_create_instances(self.get_serializer(), validated_data)
+
+    def get_stream_create_response_class(self):
+        """
+        Return the generated class of the ``StreamCreate`` response message, from the
+        pb2 module of the app registering the service.
+        """
+        return _get_response_class(self, "StreamCreate")
+
+
+class StreamUpsertModelMixin(GRPCActionMixin):
+    # INFO - Maximum number of instances upserted at once with ``bulk_create``
+    stream_upsert_batch_size = 500
+    # INFO - Maximum time in seconds a received message waits before being upserted
+    stream_upsert_batch_delay = 0.1
+
+    @grpc_action(
+        request=SelfSerializer,
+        request_stream=True,
+        response=[
+            {"name": "count", "type": "int32"},
+            {"name": "upsert_count", "type": "int32"},
+        ],
+        response_name=StrTemplatePlaceholder(
+            f"{{}}StreamUpsert{RESPONSE_SUFFIX}", get_serializer_base_name
+        ),
+        response_stream=True,
+    )
+    def StreamUpsert(self, request, context):
+        """
+        Create or update model instances from a stream of messages.
+
+        The request should be a stream of ``serializer.Meta.proto_class`` messages, each
+        one including a field corresponding to ``lookup_request_field``. The messages
+        are coalesced by lookup value, the last one winning, until
+        ``stream_upsert_batch_size`` instances or ``stream_upsert_batch_delay`` seconds
+        are reached. The batch is then validated and upserted with a single
+        ``bulk_create`` in a transaction, and acknowledged with a response message
+        holding the number of messages of the batch and of upserted instances.
+
+        .. note::
+
+            This is a bidirectional streaming RPC. The request stream is read in a
+            thread so that a batch is upserted as soon as its delay expires.
+        """
+        lookup_request_field = self.get_lookup_request_field()
+        messages = _read_stream_in_thread(request)
+        batch = {}
+        message_count = 0
+        batch_deadline = None
+        while True:
+            message = None
+            timeout = None
+            if batch_deadline is not None:
+                timeout = batch_deadline - time.monotonic()
+            if timeout is None or timeout > 0:
+                try:
+                    message = messages.get(timeout=timeout)
+                except queue.Empty:
+                    pass
+            if message is _STREAM_END:
+                break
+            if isinstance(message, BaseException):
+                raise message
+            if message is not None:
+                self.add_stream_upsert_message(batch, message, lookup_request_field)
+                message_count += 1
+                if batch_deadline is None:
+                    batch_deadline = time.monotonic() + self.stream_upsert_batch_delay
+                if len(batch) < self.stream_upsert_batch_size:
+                    continue
+            yield self.upsert_stream_batch(batch, message_count, lookup_request_field)
+            batch = {}
+            message_count = 0
+            batch_deadline = None
+        if batch:
+            yield self.upsert_stream_batch(batch, message_count, lookup_request_field)
+
+    def add_stream_upsert_message(self, batch, message, lookup_request_field):
+        """
+        Decode `message` in `batch`, a dict of the data to upsert by lookup value.
+        """
+        data = decode_message(message)
+        if data.get(lookup_request_field) is None:
+            raise ValidationError({lookup_request_field: ["This field is required."]})
+        batch[data[lookup_request_field]] = data
+
+    def upsert_stream_batch(self, batch, message_count, lookup_request_field):
+        """
+        Validate and upsert a batch of data by lookup value and return its
+        acknowledgement message. If an item is invalid nothing is written and a
+        ``ValidationError`` is raised with the errors of the invalid items, keyed
+        by their lookup value.
+        """
+        serializer = self.get_stream_upsert_serializer(
+            list(batch.values()), lookup_request_field
+        )
+        if not serializer.is_valid():
+            raise ValidationError(
+                {
+                    str(lookup_value): errors
+                    for lookup_value, errors in zip(batch, serializer.errors)
+                    if errors
+                }
+            )
+        unique_field = self.get_stream_upsert_unique_field()
+        # INFO - The lookup field may be read only, as the primary key
+        validated_data = [
+            {**attrs, unique_field: lookup_value}
+            for lookup_value, attrs in zip(batch, serializer.validated_data)
+        ]
+        self.perform_stream_upsert(validated_data, unique_field)
+        return _get_response_class(self, "StreamUpsert")(
+            count=message_count, upsert_count=len(validated_data)
+        )
+
+    def get_stream_upsert_serializer(self, data, lookup_request_field):
+        """
+        Return the serializer validating the data to upsert. The unique validators
+        of the lookup field are removed as the existing instances are updated.
+        """
+        serializer = self.get_serializer(data=data, many=True)
+        lookup_field = serializer.child.fields.get(lookup_request_field)
+        if lookup_field is not None:
+            lookup_field.validators = [
+                validator
+                for validator in lookup_field.validators
+                if not isinstance(validator, UniqueValidator)
+            ]
+        return serializer
+
+    def get_stream_upsert_unique_field(self):
+        """
+        Return the name of the model field holding the lookup values, on which the
+        rows conflict: ``lookup_field``, or the primary key.
+        """
+        model = self.get_serializer_class().Meta.model
+        lookup_field = getattr(self, "lookup_field", None)
+        if lookup_field is None or lookup_field == "pk":
+            return model._meta.pk.name
+        return lookup_field
+
+    def perform_stream_upsert(self, validated_data, unique_field):
+        """Create or update a batch of object instances."""
+        with transaction.atomic():
+            _bulk_upsert_instances(
+                self.get_serializer_class().Meta.model, validated_data, unique_field
+            )
+
+
 ############################################################
 #   Asynchronous mixins                                    #
 ############################################################
@@ -363,13 +887,13 @@ class AsyncCreateModelMixin(CreateModelMixin):
         ``serializer.Meta.proto_class``.
         """
         serializer = await self.aget_serializer(message=request)
-        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        await db_sync_to_async(serializer.is_valid, "serializers")(raise_exception=True)
         await self.aperform_create(serializer)
         return await serializer.amessage
 
     async def aperform_create(self, serializer):
         """Save a new object instance."""
-        await sync_to_async(serializer.save)()
+        await db_sync_to_async(serializer.save, "actions")()
 
 
 class AsyncListModelMixin(ListModelMixin):
@@ -382,30 +906,30 @@ class AsyncListModelMixin(ListModelMixin):
 
             This is a server streaming RPC.
         """
-        queryset = await sync_to_async(self.get_queryset)()
+        queryset = await self.aget_queryset()
         queryset = await self.afilter_queryset(queryset)
-        page = await sync_to_async(self.paginate_queryset)(queryset)
+        page = await self.apaginate_queryset(queryset)
         if page is not None:
             serializer = await self.aget_serializer(page, many=True)
             message = await serializer.amessage
-            if hasattr(message, "count"):
-                message.count = self.paginator.page.paginator.count
-            return message
+            return self.get_paginated_message(message)
         else:
-            serializer = await self.aget_serializer(queryset, many=True)
+            instances = await self.aget_instances(queryset)
+            serializer = await self.aget_serializer(instances, many=True)
             return await serializer.amessage
 
 
 class AsyncStreamModelMixin(StreamModelMixin):
     async def _get_list_data(self):
-        queryset = await sync_to_async(self.get_queryset)()
+        queryset = await self.aget_queryset()
         queryset = await self.afilter_queryset(queryset)
 
-        page = await sync_to_async(self.paginate_queryset)(queryset)
+        page = await self.apaginate_queryset(queryset)
         if page is not None:
             serializer = await self.aget_serializer(page, many=True, stream=True)
         else:
-            serializer = await self.aget_serializer(queryset, many=True, stream=True)
+            instances = await self.aget_instances(queryset)
+            serializer = await self.aget_serializer(instances, many=True, stream=True)
 
         return await serializer.amessage
 
@@ -418,10 +942,35 @@ class AsyncStreamModelMixin(StreamModelMixin):
 
             This is a server streaming RPC.
         """
+        if self.stream_chunk_size:
+            await self._stream_by_chunks(context)
+            return
+
         messages = await self._get_list_data()
         for message in messages:
             await context.write(message)
 
+    async def _stream_by_chunks(self, context):
+        queryset = await self.aget_queryset()
+        queryset = await self.afilter_queryset(queryset)
+
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            serializer = await self.aget_serializer(page, many=True, stream=True)
+            for message in await serializer.amessage:
+                await context.write(message)
+            return
+
+        # INFO - Each chunk is fetched and serialized in a single thread hop.
+        # The generator always run in the same thread so the database cursor stays usable.
+        stream_messages = self.get_stream_messages(queryset)
+        try:
+            while (messages := await sync_to_async(next)(stream_messages, None)) is not None:
+                for message in messages:
+                    await context.write(message)
+        finally:
+            await sync_to_async(stream_messages.close)()
+
 
 class AsyncRetrieveModelMixin(RetrieveModelMixin):
     async def Retrieve(self, request, context):
@@ -448,7 +997,7 @@ class AsyncUpdateModelMixin(UpdateModelMixin):
         """
         instance = await self.aget_object()
         serializer = await self.aget_serializer(instance, message=request)
-        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        await db_sync_to_async(serializer.is_valid, "serializers")(raise_exception=True)
         await self.aperform_update(serializer)
 
         if getattr(instance, "_prefetched_objects_cache", None):
@@ -460,7 +1009,7 @@ class AsyncUpdateModelMixin(UpdateModelMixin):
 
     async def aperform_update(self, serializer):
         """Save an existing object instance."""
-        await sync_to_async(serializer.save)()
+        await db_sync_to_async(serializer.save, "actions")()
 
 
 class AsyncPartialUpdateModelMixin(PartialUpdateModelMixin):
@@ -471,7 +1020,7 @@ class AsyncPartialUpdateModelMixin(PartialUpdateModelMixin):
         Performs a partial update on the given `_partial_update_fields`.
         """
 
-        content = message_to_dict(request)
+        content = decode_message(request)
 
         data = {k: v for k, v in content.items() if k in request._partial_update_fields}
 
@@ -480,7 +1029,7 @@ class AsyncPartialUpdateModelMixin(PartialUpdateModelMixin):
         # INFO - L.G. - 11/07/2022 - We use the data parameter instead of message
         # because we handle a dict not a grpc message.
         serializer = await self.aget_serializer(instance, data=data, partial=True)
-        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        await db_sync_to_async(serializer.is_valid, "serializers")(raise_exception=True)
         await self.aperform_partial_update(serializer)
 
         if getattr(instance, "_prefetched_objects_cache", None):
@@ -492,7 +1041,7 @@ class AsyncPartialUpdateModelMixin(PartialUpdateModelMixin):
 
     async def aperform_partial_update(self, serializer):
         """Save an existing object instance."""
-        await sync_to_async(serializer.save)()
+        await db_sync_to_async(serializer.save, "actions")()
 
 
 class AsyncDestroyModelMixin(DestroyModelMixin):
@@ -510,7 +1059,191 @@ class AsyncDestroyModelMixin(DestroyModelMixin):
 
     async def aperform_destroy(self, instance):
         """Delete an object instance."""
-        await sync_to_async(instance.delete)()
+        await db_sync_to_async(instance.delete, "actions")()
+
+
+class AsyncBulkCreateModelMixin(BulkCreateModelMixin):
+    async def BulkCreate(self, request, context):
+        """
+        Create model instances.
+
+        The request should be a list message of ``serializer.Meta.proto_class``.
+        All the items are validated before creating any instance: if one is invalid
+        the error details hold the errors of each item, in the request order.
+        The instances are created with a single ``bulk_create`` in a transaction and
+        returned in a list message of ``serializer.Meta.proto_class``.
+        """
+        serializer = await self.aget_serializer(message=request, many=True)
+        await db_sync_to_async(serializer.is_valid, "serializers")(raise_exception=True)
+        await self.aperform_bulk_create(serializer)
+        return await serializer.amessage
+
+    async def aperform_bulk_create(self, serializer):
+        """Save the new object instances."""
+        await db_sync_to_async(self.perform_bulk_create, "actions")(serializer)
+
+
+class AsyncBulkUpdateModelMixin(BulkUpdateModelMixin):
+    async def BulkUpdate(self, request, context):
+        """
+        Update model instances.
+
+        The request should be a list message of ``serializer.Meta.proto_class``,
+        each item including a field corresponding to ``lookup_request_field``.
+        The instances are fetched with a single query and all the items are validated
+        before updating any instance: if one is invalid the error details hold the
+        errors of each item, in the request order. The instances are saved with a
+        single ``bulk_update`` in a transaction and returned in a list message of
+        ``serializer.Meta.proto_class``.
+        """
+        list_serializer = await self.aget_serializer(many=True)
+        data = list_serializer.message_to_data(request)
+        lookup_request_field = await self.aget_lookup_request_field()
+        instances = await self.aget_bulk_objects(
+            [item.get(lookup_request_field) for item in data]
+        )
+        serializers = await db_sync_to_async(self.get_bulk_update_serializers, "serializers")(
+            instances, data
+        )
+        await self.aperform_bulk_update(serializers)
+        serializer = await self.aget_serializer(instances, many=True)
+        return await serializer.amessage
+
+    async def aperform_bulk_update(self, serializers):
+        """Save the existing object instances."""
+        await db_sync_to_async(self.perform_bulk_update, "actions")(serializers)
+
+
+class AsyncBulkDestroyModelMixin(BulkDestroyModelMixin):
+    async def BulkDestroy(self, request, context):
+        """
+        Destroy model instances.
+
+        The request should be a list message of items including a field corresponding
+        to ``lookup_request_field``. The instances are deleted with a single filtered
+        delete in a transaction, or none of them if one can not be found.
+        This returns a proto message of ``google.protobuf.empty_pb2.Empty``.
+        """
+        lookup_request_field = await self.aget_lookup_request_field()
+        instances = await self.aget_bulk_objects(
+            [
+                getattr(item, lookup_request_field)
+                for item in getattr(request, DEFAULT_LIST_FIELD_NAME)
+            ]
+        )
+        await self.aperform_bulk_destroy(instances)
+        return empty_pb2.Empty()
+
+    async def aperform_bulk_destroy(self, instances):
+        """Delete the object instances."""
+        await db_sync_to_async(self.perform_bulk_destroy, "actions")(instances)
+
+
+class AsyncStreamCreateModelMixin(StreamCreateModelMixin):
+    async def StreamCreate(self, request, context):
+        """
+        Create model instances from a stream of messages.
+
+        The request should be a stream of ``serializer.Meta.proto_class`` messages.
+        They are validated and created with ``bulk_create`` by batches of
+        ``stream_create_batch_size``, each one in its own transaction.
+        This returns the number of created instances and batches.
+
+        .. note::
+
+            This is a client streaming RPC.
+        """
+        count = batch_count = 0
+        batch = []
+        # INFO - A batch is written while the messages of the next one are received,
+        # only one batch is written at a time to keep the creation order
+        pending_batch = None
+        try:
+            async for message in request:
+                batch.append(decode_message(message))
+                if len(batch) >= self.stream_create_batch_size:
+                    if pending_batch is not None:
+                        count += await pending_batch
+                        batch_count += 1
+                    pending_batch = asyncio.ensure_future(
+                        db_sync_to_async(self.create_stream_batch, "actions")(batch, count)
+                    )
+                    batch = []
+        except BaseException:
+            if pending_batch is not None:
+                await asyncio.gather(pending_batch, return_exceptions=True)
+            raise
+        if pending_batch is not None:
+            count += await pending_batch
+            batch_count += 1
+        if batch:
+            count += await db_sync_to_async(self.create_stream_batch, "actions")(batch, count)
+            batch_count += 1
+        return self.get_stream_create_response_class()(count=count, batch_count=batch_count)
+
+
+class AsyncStreamUpsertModelMixin(StreamUpsertModelMixin):
+    async def StreamUpsert(self, request, context):
+        """
+        Create or update model instances from a stream of messages.
+
+        The request should be a stream of ``serializer.Meta.proto_class`` messages, each
+        one including a field corresponding to ``lookup_request_field``. The messages
+        are coalesced by lookup value, the last one winning, until
+        ``stream_upsert_batch_size`` instances or ``stream_upsert_batch_delay`` seconds
+        are reached. The batch is then validated and upserted with a single
+        ``bulk_create`` in a transaction, and acknowledged with a response message
+        holding the number of messages of the batch and of upserted instances.
+
+        .. note::
+
+            This is a bidirectional streaming RPC.
+        """
+        lookup_request_field = await db_sync_to_async(
+            self.get_lookup_request_field, "serializers"
+        )()
+        loop = asyncio.get_running_loop()
+        messages = request.__aiter__()
+        batch = {}
+        message_count = 0
+        batch_deadline = None
+        # INFO - The read is not cancelled when the delay expires, it is awaited again
+        # after the batch is upserted to not lose the message being received
+        next_message = None
+        try:
+            while True:
+                if next_message is None:
+                    next_message = asyncio.ensure_future(messages.__anext__())
+                timeout = None
+                if batch_deadline is not None:
+                    timeout = max(batch_deadline - loop.time(), 0)
+                done, _ = await asyncio.wait({next_message}, timeout=timeout)
+                if done:
+                    try:
+                        message = next_message.result()
+                    except StopAsyncIteration:
+                        next_message = None
+                        break
+                    next_message = None
+                    self.add_stream_upsert_message(batch, message, lookup_request_field)
+                    message_count += 1
+                    if batch_deadline is None:
+                        batch_deadline = loop.time() + self.stream_upsert_batch_delay
+                    if len(batch) < self.stream_upsert_batch_size:
+                        continue
+                yield await db_sync_to_async(self.upsert_stream_batch, "actions")(
+                    batch, message_count, lookup_request_field
+                )
+                batch = {}
+                message_count = 0
+                batch_deadline = None
+        finally:
+            if next_message is not None:
+                next_message.cancel()
+        if batch:
+            yield await db_sync_to_async(self.upsert_stream_batch, "actions")(
+                batch, message_count, lookup_request_field
+            )
 
 
 ############################################################
@@ -0,0 +1,273 @@
+"""
+gRPC native pagination classes.
+
+Any DRF pagination class can be used as `pagination_class` of a service. The classes
+of this module read their parameters from the `PAGINATION` metadata key and write
+their state in the fields they declare in `response_fields`, which are generated in
+the list response message of the service.
+"""
+import base64
+import binascii
+import json
+from enum import Enum
+from operator import attrgetter
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.core.paginator import Paginator as DjangoPaginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+from django.db.models.query import QuerySet
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.settings import api_settings
+
+from django_socio_grpc.exceptions import InvalidArgument
+
+
+class CountStrategy(str, Enum):
+    """
+    How the `count` of a paginated list response is computed.
+    """
+
+    # INFO - `COUNT(*)` on every page request
+    EXACT = "exact"
+    # INFO - `COUNT(*)` cached for `count_cache_timeout` seconds for each filtered query
+    CACHED = "cached"
+    # INFO - Rows estimated by the query planner (PostgreSQL only, exact count otherwise)
+    ESTIMATE = "estimate"
+    # INFO - No count, the `count` field is not generated in the list response
+    NONE = "none"
+
+
+def estimate_count(queryset):
+    """
+    Return the number of rows of `queryset` estimated by the PostgreSQL planner,
+    without executing it. Fall back to an exact count on other databases.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]["Plan Rows"]
+
+
+class StrategyCountPaginator(DjangoPaginator):
+    """
+    Django paginator getting its count from `count_function`.
+    As the count may be approximated or skipped, pages are sliced without
+    being checked against it: a page after the last one is just empty.
+    """
+
+    def __init__(self, object_list, per_page, *args, count_function, **kwargs):
+        super().__init__(object_list, per_page, *args, **kwargs)
+        self.count_function = count_function
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return len(self.object_list)
+        return self.count_function(self.object_list)
+
+    def validate_number(self, number):
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        return self._get_page(self.object_list[bottom:top], number, self)
+
+
+def _get_model_field(model, path):
+    """
+    Return the model field of the `path` lookup (as "author__name") of `model`.
+    """
+    *relations, name = path.split("__")
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+    if name == "pk":
+        return model._meta.pk
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        # INFO - The column of a foreign key, as "author_id"
+        for field in model._meta.concrete_fields:
+            if field.attname == name:
+                return field
+        raise
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination.
+
+    The page is fetched by filtering on the values of the `ordering` fields of the last
+    instance of the previous page instead of using an OFFSET, and the total number of
+    instances is never counted. Fetching a page costs the same whatever its depth.
+
+    The client sends the `next_cursor` value of the previous response in the `cursor`
+    key of the `PAGINATION` metadata to get the next page. An empty `next_cursor` means
+    there is no page left.
+
+    `ordering` must only contain not nullable fields. The primary key is appended to it
+    if missing so the ordering is always unique, and the foreign keys are ordered by
+    their column. The list response has no `count` field.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = None
+    cursor_query_param = "cursor"
+    ordering = ("pk",)
+
+    response_fields = [
+        {"name": "next_cursor", "type": "string"},
+    ]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_queryset = self.get_page_queryset(queryset, request)
+        if page_queryset is None:
+            return None
+        return self.set_page(list(page_queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        page_queryset = self.get_page_queryset(queryset, request)
+        if page_queryset is None:
+            return None
+        return self.set_page([instance async for instance in page_queryset])
+
+    def get_page_queryset(self, queryset, request):
+        """
+        Return the queryset of the instances of the page, or None if pagination is disabled.
+        """
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.ordering = self.get_ordering(queryset)
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            queryset = queryset.filter(self.get_keyset_filter(cursor, queryset.model))
+
+        # INFO - One more instance than the page size is fetched to know if there is a next page
+        return queryset[: self.page_size + 1]
+
+    def set_page(self, results):
+        self.page = results[: self.page_size]
+        if len(results) > self.page_size:
+            self.next_cursor = self.encode_cursor(self.page[-1])
+        else:
+            self.next_cursor = None
+        return self.page
+
+    def get_paginated_message(self, message):
+        if hasattr(message, "next_cursor"):
+            message.next_cursor = self.next_cursor or ""
+        return message
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size,
+                )
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def get_ordering(self, queryset):
+        ordering = [self.ordering] if isinstance(self.ordering, str) else list(self.ordering)
+        field_names = {field.lstrip("-") for field in ordering}
+        if not field_names & {"pk", queryset.model._meta.pk.name}:
+            ordering.append("pk")
+        return [self.get_ordering_column(queryset.model, field) for field in ordering]
+
+    def get_ordering_column(self, model, field):
+        """
+        Return `field` of `ordering`, with the name of its column for a foreign key: the
+        cursor holds its value and it is ordered by it, not by the related model ordering.
+        """
+        name = field.lstrip("-")
+        if name == "pk":
+            return field
+        model_field = _get_model_field(model, name)
+        if not (model_field.many_to_one or model_field.one_to_one):
+            return field
+        path = name.split("__")
+        path[-1] = model_field.attname
+        return field[: len(field) - len(name)] + "__".join(path)
+
+    def validate_cursor_value(self, model, name, value):
+        """
+        Return the `value` of the `name` ordering field of the cursor converted by its
+        model field, raising InvalidArgument if it is not valid.
+        """
+        if isinstance(value, (dict, list)):
+            raise InvalidArgument(detail="Invalid cursor")
+        try:
+            return _get_model_field(model, name).to_python(value)
+        except (DjangoValidationError, TypeError, ValueError):
+            raise InvalidArgument(detail="Invalid cursor")
+
+    def get_keyset_filter(self, cursor, model):
+        """
+        Build the filter selecting the instances after `cursor` in `ordering`:
+        (a > x) OR (a = x AND b > y) OR ...
+        """
+        if len(cursor) != len(self.ordering):
+            raise InvalidArgument(detail="Invalid cursor")
+        keyset_filter = Q()
+        equal_filter = Q()
+        for field, value in zip(self.ordering, cursor):
+            name = field.lstrip("-")
+            value = self.validate_cursor_value(model, name, value)
+            lookup = "lt" if field.startswith("-") else "gt"
+            keyset_filter |= equal_filter & Q(**{f"{name}__{lookup}": value})
+            equal_filter &= Q(**{name: value})
+        return keyset_filter
+
+    def get_ordering_values(self, instance):
+        return [
+            attrgetter(field.lstrip("-").replace("__", "."))(instance)
+            for field in self.ordering
+        ]
+
+    def encode_cursor(self, instance):
+        values = json.dumps(self.get_ordering_values(instance), cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(values.encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        # INFO - The metadata is JSON, the cursor may not be a string
+        if not isinstance(encoded, str):
+            raise InvalidArgument(detail="Invalid cursor")
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except (TypeError, ValueError, binascii.Error):
+            raise InvalidArgument(detail="Invalid cursor")
+        if not isinstance(cursor, list):
+            raise InvalidArgument(detail="Invalid cursor")
+        return cursor
@@ -1,10 +1,11 @@
+import functools
 from typing import MutableSequence
 
-from asgiref.sync import sync_to_async
 from django.core.validators import MaxLengthValidator
+from django.db.models import Model
 from django.utils.translation import gettext as _
 from rest_framework.exceptions import ValidationError
-from rest_framework.relations import SlugRelatedField
+from rest_framework.relations import ManyRelatedField, RelatedField, SlugRelatedField
 from rest_framework.serializers import (
     LIST_SERIALIZER_KWARGS,
     BaseSerializer,
@@ -12,14 +13,57 @@ from rest_framework.serializers import (
     ListSerializer,
     ModelSerializer,
     Serializer,
+    SerializerMethodField,
 )
 from rest_framework.settings import api_settings
 from rest_framework.utils.formatting import lazy_format
 
-from django_socio_grpc.protobuf.json_format import message_to_dict, parse_dict
+from django_socio_grpc.protobuf import encoder
+from django_socio_grpc.protobuf.decoder import decode_message
+from django_socio_grpc.protobuf.json_format import parse_dict
 from django_socio_grpc.utils.constants import DEFAULT_LIST_FIELD_NAME, LIST_ATTR_MESSAGE_NAME
+from django_socio_grpc.utils.executor import db_sync_to_async
 
 LIST_PROTO_SERIALIZER_KWARGS = (*LIST_SERIALIZER_KWARGS, LIST_ATTR_MESSAGE_NAME, "message")
+# INFO - Modules of the fields whose representation only depends on the attribute value
+PLAIN_FIELD_MODULES = ("rest_framework.fields", __name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_plain_model_field_names(model):
+    return frozenset(
+        field.attname for field in model._meta.concrete_fields if not field.is_relation
+    )
+
+
+def reads_loaded_model_fields(serializer, instances):
+    """
+    Check if `serializer` only reads model fields already loaded in `instances`,
+    so their representation is built without querying the database.
+    """
+    if not encoder.is_encodable(serializer):
+        return False
+    if isinstance(serializer, ListSerializer):
+        serializer = serializer.child
+    sources = []
+    for field in serializer._readable_fields:
+        if (
+            type(field).__module__ not in PLAIN_FIELD_MODULES
+            or isinstance(field, (SerializerMethodField, RelatedField, ManyRelatedField))
+            or len(field.source_attrs) != 1
+        ):
+            return False
+        sources.append(field.source_attrs[0])
+    for instance in instances:
+        if not isinstance(instance, Model):
+            return False
+        field_names = _get_plain_model_field_names(type(instance))
+        # INFO - Deferred fields are missing from the instance dict
+        if not all(
+            source in field_names and source in instance.__dict__ for source in sources
+        ):
+            return False
+    return True
 
 
 class BaseProtoSerializer(BaseSerializer):
@@ -34,7 +78,7 @@ class BaseProtoSerializer(BaseSerializer):
 
     def message_to_data(self, message):
         """Protobuf message -> Dict of python primitive datatypes."""
-        return message_to_dict(message)
+        return decode_message(message)
 
     def data_to_message(self, data):
         """Protobuf message <- Dict of python primitive datatypes."""
@@ -50,32 +94,69 @@ class BaseProtoSerializer(BaseSerializer):
         )
         return parse_dict(data, self.Meta.proto_class())
 
+    def instance_to_message(self, instance):
+        """Protobuf message <- Instance, without building the intermediate dict."""
+        return encoder.encode_instance(self, instance, self.Meta.proto_class())
+
+    def can_encode_instance(self):
+        """
+        Check if the message can be directly encoded from the instance.
+        This is opt-in with the `use_compiled_encoder` Meta attribute.
+        """
+        meta = getattr(self, "Meta", None)
+        return (
+            getattr(meta, "use_compiled_encoder", False)
+            and self.instance is not None
+            and not getattr(self, "_errors", None)
+            and encoder.is_encodable(self)
+        )
+
+    def can_serialize_in_event_loop(self):
+        """
+        Check if the message can be built in the event loop, without a thread hop.
+        """
+        if self.instance is None or getattr(self, "_errors", None):
+            return False
+        return reads_loaded_model_fields(self, [self.instance])
+
     @property
     def message(self):
         if not hasattr(self, "_message"):
-            self._message = self.data_to_message(self.data)
+            if self.can_encode_instance():
+                self._message = self.instance_to_message(self.instance)
+            else:
+                self._message = self.data_to_message(self.data)
         return self._message
 
     async def asave(self, **kwargs):
-        return await sync_to_async(self.save)(**kwargs)
+        return await db_sync_to_async(self.save, "actions")(**kwargs)
 
     async def ais_valid(self, *, raise_exception=False):
-        return await sync_to_async(self.is_valid)(raise_exception=raise_exception)
+        return await db_sync_to_async(self.is_valid, "serializers")(
+            raise_exception=raise_exception
+        )
 
     async def acreate(self, validated_data):
-        return await sync_to_async(self.create)(validated_data)
+        return await db_sync_to_async(self.create, "actions")(validated_data)
 
     async def aupdate(self, instance, validated_data):
-        return await sync_to_async(self.update)(instance, validated_data)
+        return await db_sync_to_async(self.update, "actions")(instance, validated_data)
 
     @property
     async def adata(self):
-        return await sync_to_async(getattr)(self, "data")
+        return await db_sync_to_async(getattr, "serializers")(self, "data")
 
     @property
     async def amessage(self):
         if not hasattr(self, "_message"):
-            self._message = self.data_to_message(await self.adata)
+            if self.can_serialize_in_event_loop():
+                self._message = self.message
+            elif self.can_encode_instance():
+                self._message = await db_sync_to_async(
+                    self.instance_to_message, "serializers"
+                )(self.instance)
+            else:
+                self._message = self.data_to_message(await self.adata)
         return self._message
 
     @classmethod
@@ -163,6 +244,35 @@ class ListProtoSerializer(ListSerializer, BaseProtoSerializer):
             )
             return response
 
+    def instance_to_message(self, instance):
+        """
+        List of protobuf messages <- Iterable of instances, without building the intermediate dicts.
+        """
+        if getattr(self.child, "stream", False):
+            return encoder.encode_list(self, instance, self.child.Meta.proto_class)
+
+        response = self.child.Meta.proto_class_list()
+        response_result_attr = getattr(
+            self.child.Meta, LIST_ATTR_MESSAGE_NAME, DEFAULT_LIST_FIELD_NAME
+        )
+        encoder.encode_list_into(self, instance, getattr(response, response_result_attr))
+        return response
+
+    def can_serialize_in_event_loop(self):
+        # INFO - A queryset is evaluated by the serialization
+        if not isinstance(self.instance, (list, tuple)) or getattr(self, "_errors", None):
+            return False
+        return reads_loaded_model_fields(self, self.instance)
+
+    def can_encode_instance(self):
+        meta = getattr(self.child, "Meta", None)
+        return (
+            getattr(meta, "use_compiled_encoder", False)
+            and self.instance is not None
+            and not getattr(self, "_errors", None)
+            and encoder.is_encodable(self)
+        )
+
 
 class ModelProtoSerializer(ProtoSerializer, ModelSerializer):
     pass
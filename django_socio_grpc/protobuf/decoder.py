@@ -0,0 +1,184 @@
+"""
+Descriptor driven decoding of protobuf messages into python primitive datatypes.
+
+`decode_message` returns the same dict as `json_format.message_to_dict` but reads the
+fields directly from the message with a list of getters compiled once per descriptor,
+instead of going through `google.protobuf.json_format.MessageToDict` and
+scanning the descriptor for optional fields on every call.
+"""
+import base64
+import math
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.internal import type_checkers
+from google.protobuf.json_format import MessageToDict
+
+from django_socio_grpc.protobuf.json_format import _is_field_optional, message_to_dict
+
+_INT64_TYPES = (FieldDescriptor.CPPTYPE_INT64, FieldDescriptor.CPPTYPE_UINT64)
+
+_decoders = {}
+
+
+def _convert_float(value):
+    if math.isinf(value):
+        return "-Infinity" if value < 0.0 else "Infinity"
+    if math.isnan(value):
+        return "NaN"
+    return type_checkers.ToShortestFloat(value)
+
+
+def _convert_double(value):
+    if math.isinf(value):
+        return "-Infinity" if value < 0.0 else "Infinity"
+    if math.isnan(value):
+        return "NaN"
+    return value
+
+
+def _convert_bytes(value):
+    return base64.b64encode(value).decode("utf-8")
+
+
+def _get_enum_converter(enum_type):
+    if enum_type.full_name == "google.protobuf.NullValue":
+        return lambda value: None
+
+    def convert(value):
+        enum_value = enum_type.values_by_number.get(value, None)
+        return enum_value.name if enum_value is not None else value
+
+    return convert
+
+
+def _message_to_json_object(message):
+    return MessageToDict(
+        message, including_default_value_fields=True, preserving_proto_field_name=True
+    )
+
+
+def _get_message_converter(message_type):
+    # INFO - Well known types (Struct, Timestamp, wrappers, ...) have a specific json representation
+    if message_type.full_name.startswith("google.protobuf."):
+        return _message_to_json_object
+
+    return lambda value: decode_message(value, is_root=False)
+
+
+def _get_converter(field):
+    """
+    Return the function converting a value of `field` into its python representation,
+    or None if the value is already a python primitive datatype.
+    """
+    if field.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE:
+        return _get_message_converter(field.message_type)
+    if field.cpp_type == FieldDescriptor.CPPTYPE_ENUM:
+        return _get_enum_converter(field.enum_type)
+    if field.type == FieldDescriptor.TYPE_BYTES:
+        return _convert_bytes
+    if field.cpp_type in _INT64_TYPES:
+        return str
+    if field.cpp_type == FieldDescriptor.CPPTYPE_FLOAT:
+        return _convert_float
+    if field.cpp_type == FieldDescriptor.CPPTYPE_DOUBLE:
+        return _convert_double
+    return None
+
+
+def _convert_map_key(key):
+    if isinstance(key, bool):
+        return "true" if key else "false"
+    return str(key)
+
+
+def _compile_field(field):
+    name = field.name
+
+    if field.message_type is not None and field.message_type.GetOptions().map_entry:
+        convert_value = _get_converter(field.message_type.fields_by_name["value"])
+        if convert_value is None:
+
+            def getter(message, data, is_root):
+                data[name] = {
+                    _convert_map_key(key): value
+                    for key, value in getattr(message, name).items()
+                }
+
+        else:
+
+            def getter(message, data, is_root):
+                data[name] = {
+                    _convert_map_key(key): convert_value(value)
+                    for key, value in getattr(message, name).items()
+                }
+
+        return getter
+
+    convert = _get_converter(field)
+
+    if field.label == FieldDescriptor.LABEL_REPEATED:
+        if convert is None:
+
+            def getter(message, data, is_root):
+                data[name] = list(getattr(message, name))
+
+        else:
+
+            def getter(message, data, is_root):
+                data[name] = [convert(value) for value in getattr(message, name)]
+
+        return getter
+
+    convert = convert or (lambda value: value)
+
+    if _is_field_optional(field):
+        # INFO - Optional fields not set are None, only for the root message as `message_to_dict`
+        def getter(message, data, is_root):
+            if message.HasField(name):
+                data[name] = convert(getattr(message, name))
+            elif is_root:
+                data[name] = None
+
+    elif field.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE or field.containing_oneof:
+        # INFO - Singular message fields and oneof fields are only present if set
+        def getter(message, data, is_root):
+            if message.HasField(name):
+                data[name] = convert(getattr(message, name))
+
+    else:
+
+        def getter(message, data, is_root):
+            data[name] = convert(getattr(message, name))
+
+    return getter
+
+
+def get_decoder(descriptor):
+    """
+    Return the getters used to decode messages of `descriptor`, or None if the
+    message can not be decoded directly. The getters are compiled once and then cached.
+    """
+    try:
+        return _decoders[descriptor]
+    except KeyError:
+        pass
+    if descriptor.is_extendable or descriptor.full_name.startswith("google.protobuf."):
+        getters = None
+    else:
+        getters = [_compile_field(field) for field in descriptor.fields]
+    _decoders[descriptor] = getters
+    return getters
+
+
+def decode_message(message, is_root=True):
+    """
+    Protobuf message -> Dict of python primitive datatypes.
+    Equivalent to `json_format.message_to_dict(message)`.
+    """
+    getters = get_decoder(message.DESCRIPTOR)
+    if getters is None:
+        return message_to_dict(message) if is_root else _message_to_json_object(message)
+    data = {}
+    for getter in getters:
+        getter(message, data, is_root)
+    return data
@@ -0,0 +1,187 @@
+"""
+Descriptor driven encoding of serializer instances into protobuf messages.
+
+The default `BaseProtoSerializer.message` path builds `serializer.data` with
+`to_representation` and then converts this dict with `parse_dict`, walking the
+message descriptor a second time. The encoder compiles, once per serializer class
+and message descriptor, a plan of setters and writes the representation of each
+readable field directly into the message.
+
+Values that can not be safely written with a plain setter (bytes, enums, maps,
+well known types, ...) are collected and converted with `parse_dict` so the
+result is always identical to the dict path.
+"""
+from django.db import models
+from google.protobuf.descriptor import FieldDescriptor
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+from rest_framework.serializers import ListSerializer, Serializer
+
+from django_socio_grpc.protobuf.json_format import parse_dict
+
+_FALLBACK_TYPES = (FieldDescriptor.TYPE_BYTES, FieldDescriptor.TYPE_ENUM)
+
+_encoding_plans = {}
+
+
+def is_encodable(serializer):
+    """
+    A serializer can be encoded without the intermediate dict only if it rely on
+    the default `to_representation` of DRF.
+    """
+    if isinstance(serializer, ListSerializer):
+        return type(
+            serializer
+        ).to_representation is ListSerializer.to_representation and is_encodable(
+            serializer.child
+        )
+    return (
+        isinstance(serializer, Serializer)
+        and type(serializer).to_representation is Serializer.to_representation
+    )
+
+
+def _fallback_setter(name):
+    def setter(field, attribute, message, fallback):
+        fallback[name] = field.to_representation(attribute)
+
+    # INFO - None values are only meaningful for fields converted by `parse_dict`
+    # (google.protobuf.Value for example), on a fresh message they are a no-op otherwise
+    setter.is_fallback = True
+    return setter
+
+
+def _scalar_setter(name):
+    def setter(field, attribute, message, fallback):
+        value = field.to_representation(attribute)
+        try:
+            setattr(message, name, value)
+        except (TypeError, ValueError):
+            fallback[name] = value
+
+    return setter
+
+
+def _repeated_scalar_setter(name):
+    def setter(field, attribute, message, fallback):
+        value = field.to_representation(attribute)
+        try:
+            getattr(message, name).extend(value)
+        except (TypeError, ValueError):
+            fallback[name] = value
+
+    return setter
+
+
+def _message_setter(name):
+    def setter(field, attribute, message, fallback):
+        if not is_encodable(field) or isinstance(field, ListSerializer):
+            fallback[name] = field.to_representation(attribute)
+            return
+        sub_message = getattr(message, name)
+        sub_message.SetInParent()
+        encode_instance(field, attribute, sub_message)
+
+    return setter
+
+
+def _repeated_message_setter(name):
+    def setter(field, attribute, message, fallback):
+        if not isinstance(field, ListSerializer) or not is_encodable(field):
+            fallback[name] = field.to_representation(attribute)
+            return
+        container = getattr(message, name)
+        for item in _iterate(attribute):
+            encode_instance(field.child, item, container.add())
+
+    return setter
+
+
+def _compile_field(field_descriptor):
+    name = field_descriptor.name
+    is_repeated = field_descriptor.label == FieldDescriptor.LABEL_REPEATED
+    if field_descriptor.type == FieldDescriptor.TYPE_MESSAGE:
+        if field_descriptor.message_type.GetOptions().map_entry:
+            return _fallback_setter(name)
+        if field_descriptor.message_type.full_name.startswith("google.protobuf."):
+            return _fallback_setter(name)
+        if is_repeated:
+            return _repeated_message_setter(name)
+        return _message_setter(name)
+    if field_descriptor.type in _FALLBACK_TYPES:
+        return _fallback_setter(name)
+    if is_repeated:
+        return _repeated_scalar_setter(name)
+    return _scalar_setter(name)
+
+
+def get_encoding_plan(serializer_class, descriptor):
+    """
+    Return the setters, by field name, used to encode `serializer_class` into
+    messages of `descriptor`. The plan is compiled once and then cached.
+    """
+    key = (serializer_class, descriptor)
+    try:
+        return _encoding_plans[key]
+    except KeyError:
+        pass
+    plan = {}
+    for field_descriptor in descriptor.fields:
+        setter = _compile_field(field_descriptor)
+        # INFO - `parse_dict` look for the json name first so both are supported here
+        plan[field_descriptor.json_name] = setter
+        plan[field_descriptor.name] = setter
+    _encoding_plans[key] = plan
+    return plan
+
+
+def _iterate(data):
+    return data.all() if isinstance(data, models.manager.BaseManager) else data
+
+
+def encode_instance(serializer, instance, message):
+    """
+    Write the representation of `instance` by `serializer` into `message`.
+    Equivalent to `parse_dict(serializer.to_representation(instance), message)`.
+    """
+    plan = get_encoding_plan(type(serializer), message.DESCRIPTOR)
+    fallback = {}
+    for field in serializer._readable_fields:
+        setter = plan.get(field.field_name)
+        if setter is None:
+            continue
+        try:
+            attribute = field.get_attribute(instance)
+        except SkipField:
+            continue
+
+        check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+        if check_for_none is None:
+            if getattr(setter, "is_fallback", False):
+                fallback[field.field_name] = None
+            continue
+        setter(field, attribute, message, fallback)
+
+    if fallback:
+        parse_dict(fallback, message)
+    return message
+
+
+def encode_list(list_serializer, instances, message_class):
+    """
+    Encode each instance with the child serializer of `list_serializer` into a new
+    `message_class` message.
+    """
+    child = list_serializer.child
+    return [encode_instance(child, item, message_class()) for item in _iterate(instances)]
+
+
+def encode_list_into(list_serializer, instances, container):
+    """
+    Encode each instance with the child serializer of `list_serializer` into the
+    repeated message field `container`.
+    """
+    child = list_serializer.child
+    for item in _iterate(instances):
+        encode_instance(child, item, container.add())
+    return container
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from google.protobuf.json_format import MessageToDict, ParseDict
 
 
@@ -15,6 +17,15 @@ def _is_field_optional(field):
     return len(co.fields) == 1 and co.name == f"_{field.name}"
 
 
+@lru_cache(maxsize=None)
+def get_optional_field_names(descriptor):
+    """
+    Returns the names of the optional fields of a message descriptor.
+    Cached as descriptors never change at runtime.
+    """
+    return tuple(field.name for field in descriptor.fields if _is_field_optional(field))
+
+
 def message_to_dict(message, **kwargs):
     """
     Converts a protobuf message to a dictionary.
@@ -26,9 +37,7 @@ def message_to_dict(message, **kwargs):
     kwargs.setdefault("preserving_proto_field_name", True)
 
     result_dict = MessageToDict(message, **kwargs)
-    optional_fields = {
-        field.name: None for field in message.DESCRIPTOR.fields if _is_field_optional(field)
-    }
+    optional_fields = dict.fromkeys(get_optional_field_names(message.DESCRIPTOR))
 
     return {**optional_fields, **result_dict}
 
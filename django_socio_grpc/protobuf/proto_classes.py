@@ -1,6 +1,5 @@
 import logging
 import traceback
-from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
@@ -21,7 +20,6 @@ from django.core.exceptions import FieldDoesNotExist
 from django.db import models
 from rest_framework import serializers
 from rest_framework.fields import HiddenField
-from rest_framework.utils.model_meta import RelationInfo, get_field_info
 
 from django_socio_grpc.utils.constants import (
     DEFAULT_LIST_FIELD_NAME,
@@ -29,7 +27,7 @@ from django_socio_grpc.utils.constants import (
     REQUEST_SUFFIX,
     RESPONSE_SUFFIX,
 )
-from django_socio_grpc.utils.model_meta import get_model_pk
+from django_socio_grpc.utils.model_meta import get_model_pk, get_relations
 from django_socio_grpc.utils.tools import rreplace
 
 from .exceptions import ProtoRegistrationError
@@ -237,11 +235,8 @@ class ProtoField:
                     f"related to field {field.field_name}"
                 )
 
-        for source in source_attrs:
-            relationships: OrderedDict[str, RelationInfo] = get_field_info(model).relations
-            if not (relation := relationships.get(source)):
-                break
-            model = relation.related_model
+        if relations := get_relations(model, source_attrs):
+            model = relations[-1][1].related_model
 
         if isinstance(field, serializers.PrimaryKeyRelatedField):
             field_type = get_proto_type(
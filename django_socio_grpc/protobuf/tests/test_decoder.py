@@ -0,0 +1,73 @@
+from fakeapp.grpc import fakeapp_pb2
+from google.protobuf.struct_pb2 import Struct
+
+from django_socio_grpc.protobuf.decoder import decode_message, get_decoder
+from django_socio_grpc.protobuf.json_format import message_to_dict
+from django_socio_grpc.protobuf.tests.protos import test_proto_pb2
+from django_socio_grpc.tests.benchmarks.utils import report, run_benchmark
+
+
+def _struct(data):
+    struct = Struct()
+    struct.update(data)
+    return struct
+
+
+MESSAGES = [
+    test_proto_pb2.MyMessage(),
+    test_proto_pb2.MyMessage(string_field="test"),
+    test_proto_pb2.MyMessage(optional_string_field=""),
+    test_proto_pb2.MyMessage(field1="test", field3="test"),
+    fakeapp_pb2.UnitTestModelRequest(title="title"),
+    fakeapp_pb2.UnitTestModelRequest(id=1, title="title", text="text"),
+    fakeapp_pb2.SpecialFieldsModelResponse(
+        uuid="uuid",
+        meta_datas=_struct({"foo": "bar", "nested": {"list": [1, 2]}}),
+        list_datas=[1, 2, 3],
+        binary=b"bytes",
+    ),
+    fakeapp_pb2.RelatedFieldModelResponse(
+        uuid="uuid",
+        foreign=fakeapp_pb2.ForeignModelResponse(uuid="foreign"),
+        many_many=[fakeapp_pb2.ManyManyModelResponse(name="name")],
+        slug_reverse_test_model=[True, False],
+    ),
+    fakeapp_pb2.BasicServiceRequest(
+        user_name="user",
+        user_data=_struct({"foo": 1}),
+        list_of_dict=[_struct({"foo": "bar"})],
+    ),
+]
+
+
+def test_decode_message_equals_message_to_dict():
+    for message in MESSAGES:
+        assert decode_message(message) == message_to_dict(message), message
+
+
+def test_decode_message_optional_fields():
+    result = decode_message(test_proto_pb2.MyMessage(string_field="test"))
+    assert result == {"string_field": "test", "optional_string_field": None}
+
+    result = decode_message(test_proto_pb2.MyMessage(optional_string_field=""))
+    assert result == {"string_field": "", "optional_string_field": ""}
+
+
+def test_decoder_is_cached_per_descriptor():
+    assert get_decoder(test_proto_pb2.MyMessage.DESCRIPTOR) is get_decoder(
+        test_proto_pb2.MyMessage.DESCRIPTOR
+    )
+
+
+def test_benchmark_decode_message():
+    message = fakeapp_pb2.RelatedFieldModelResponse(
+        uuid="uuid",
+        foreign=fakeapp_pb2.ForeignModelResponse(uuid="foreign", name="name"),
+        many_many=[fakeapp_pb2.ManyManyModelResponse(name=str(i)) for i in range(10)],
+        custom_field_name="custom",
+    )
+    results = {
+        "message_to_dict": run_benchmark(lambda: message_to_dict(message)),
+        "decode_message": run_benchmark(lambda: decode_message(message)),
+    }
+    report("Decoding of RelatedFieldModelResponse", results)
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict
 
 from google.protobuf.message import Message
 
@@ -23,6 +23,8 @@ class GRPCRequestContainer:
     context: GRPCInternalProxyContext
     action: str
     service: "Service"
+    # INFO - Added by the middlewares to the extra of the response log record
+    log_extra: Dict[str, Any] = field(default_factory=dict)
 
     def __getattr__(self, attr):
         """
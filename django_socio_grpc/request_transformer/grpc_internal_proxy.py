@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from django.utils.functional import cached_property
 from grpc.aio import ServicerContext
 from grpc.aio._typing import ResponseType
 
@@ -16,10 +17,11 @@ class GRPCInternalProxyContext:
 
     grpc_context: ServicerContext
     grpc_action: str
-    http_request: InternalHttpRequest = None
 
-    def __post_init__(self):
-        self.http_request = InternalHttpRequest(self, self.grpc_action)
+    @cached_property
+    def http_request(self) -> InternalHttpRequest:
+        # INFO - Only built when an attribute not provided by the grpc context is needed
+        return InternalHttpRequest(self, self.grpc_action)
 
     def __getattr__(self, attr):
         if hasattr(self.grpc_context, attr):
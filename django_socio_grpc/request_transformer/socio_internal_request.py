@@ -3,6 +3,7 @@ import json
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.encoding import escape_uri_path, iri_to_uri
+from django.utils.functional import cached_property
 
 from django_socio_grpc.settings import grpc_settings
 
@@ -20,6 +21,7 @@ class InternalHttpRequest:
     }
     FILTERS_KEY = "FILTERS"
     PAGINATION_KEY = "PAGINATION"
+    FIELD_MASK_KEY = "FIELD_MASK"
 
     #  Map http method to use DjangoModelPermission
     METHOD_MAP = {
@@ -32,47 +34,106 @@ class InternalHttpRequest:
     }
 
     def __init__(self, grpc_context, grpc_action):
+        self.grpc_context = grpc_context
         self.user = None
         self.auth = None
 
-        self.grpc_request_metadata = self.convert_metadata_to_dict(
-            grpc_context.invocation_metadata()
-        )
-        self.headers = self.get_from_metadata(self.HEADERS_KEY)
-        self.META = {
-            self.MAP_HEADERS.get(key.upper(), key.upper()): value
-            for key, value in self.headers.items()
-        }
-
         # INFO - A.D.B - 04/01/2021 - Not implemented for now
         self.POST = {}
         self.COOKIES = {}
         self.FILES = {}
 
-        #  Grpc action to http method name
+        #  Grpc action to http method name
         self.method = self.grpc_action_to_http_method_name(grpc_action)
 
-        # Computed params
-        self.query_params = self.get_query_params()
-        # INFO - AM - 10/02/2021 - Only implementing GET because it's easier as we have metadata here. For post we will have to pass the request and transform it to python dict.
-        # It's possible but it will be slow the all thing so we hava to param this behavior with settings.
-        # So we are waiting for the need to implement it
-        self.GET = self.query_params
+        # INFO - Each metadata key is JSON decoded at most once, when first needed
+        self._parsed_metadata = {}
 
         # TODO - AM - 26/04/2023 - Find a way to populate this from context or request ? It is really needed ?
         self.path = ""
         self.path_info = ""
 
+    # INFO - Metadata based attributes are computed on first access only, so actions not using
+    # headers, filters, pagination or field mask do not pay for them
+
+    @cached_property
+    def _metadata(self):
+        return self.convert_metadata_to_dict(self.grpc_context.invocation_metadata())
+
+    @cached_property
+    def grpc_request_metadata(self):
+        """
+        Request metadata without the keys holding headers, filters, pagination and field mask data.
+        """
+        map_metadata_keys = grpc_settings.MAP_METADATA_KEYS
+        mapped_keys = (
+            map_metadata_keys.get(self.HEADERS_KEY, None),
+            map_metadata_keys.get(self.FILTERS_KEY, None),
+            map_metadata_keys.get(self.PAGINATION_KEY, None),
+            map_metadata_keys.get(self.FIELD_MASK_KEY, None),
+        )
+        return {key: value for key, value in self._metadata.items() if key not in mapped_keys}
+
+    @cached_property
+    def headers(self):
+        return self.get_from_metadata(self.HEADERS_KEY)
+
+    @cached_property
+    def field_mask(self):
+        """
+        Paths of the `FIELD_MASK` metadata, comma separated as in the text format of
+        `google.protobuf.FieldMask`, or None if the request has no field mask.
+        """
+        metadata_key = grpc_settings.MAP_METADATA_KEYS.get(self.FIELD_MASK_KEY, None)
+        if not metadata_key or metadata_key not in self._metadata:
+            return None
+        return [
+            path.strip() for path in self._metadata[metadata_key].split(",") if path.strip()
+        ]
+
+    @cached_property
+    def META(self):
+        return {
+            self.MAP_HEADERS.get(key.upper(), key.upper()): value
+            for key, value in self.headers.items()
+        }
+
+    @cached_property
+    def query_params(self):
+        return self.get_query_params()
+
+    # INFO - AM - 10/02/2021 - Only implementing GET because it's easier as we have metadata here. For post we will have to pass the request and transform it to python dict.
+    # It's possible but it will be slow the all thing so we hava to param this behavior with settings.
+    # So we are waiting for the need to implement it
+    @property
+    def GET(self):
+        return self.query_params
+
+    @GET.setter
+    def GET(self, value):
+        self.query_params = value
+
     def get_from_metadata(self, metadata_key):
         metadata_key = grpc_settings.MAP_METADATA_KEYS.get(metadata_key, None)
         if not metadata_key:
             return self.grpc_request_metadata
-        user_custom_headers = self.grpc_request_metadata.pop(metadata_key, "{}")
         return {
             **self.grpc_request_metadata,
-            **json.loads(user_custom_headers),
+            **self.get_parsed_metadata(metadata_key),
         }
 
+    def get_parsed_metadata(self, metadata_key):
+        """
+        Return the JSON decoded value of the `metadata_key` metadata, decoded once per request.
+        """
+        try:
+            return self._parsed_metadata[metadata_key]
+        except KeyError:
+            pass
+        parsed = json.loads(self._metadata.get(metadata_key, "{}"))
+        self._parsed_metadata[metadata_key] = parsed
+        return parsed
+
     def convert_metadata_to_dict(self, invocation_metadata):
         grpc_request_metadata = {}
         for key, value in dict(invocation_metadata).items():
@@ -131,7 +131,8 @@ class AppHandlerRegistry:
             controller_name = service_class.get_controller_name()
             add_server = getattr(pb2_grpc, f"add_{controller_name}Servicer_to_server")
 
-            add_server(service_class.as_servicer(), self.server)
+            servicer = service_class.as_servicer()
+            add_server(servicer, servicer.wrap_server(self.server))
         except ModuleNotFoundError:
             logger.error(
                 f"PB2 module {path} not found. Please generate proto before launching server"
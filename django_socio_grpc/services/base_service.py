@@ -1,16 +1,21 @@
 import asyncio
-from typing import TYPE_CHECKING, List, Type
+from typing import TYPE_CHECKING, List, Tuple, Type
 
-from asgiref.sync import sync_to_async
 from django.db.models.query import QuerySet
 from google.protobuf.message import Message
 from rest_framework.permissions import BasePermission
 
+from django_socio_grpc.authentication_cache import (
+    get_cached_authentication,
+    get_request_credential,
+    set_cached_authentication,
+)
 from django_socio_grpc.exceptions import PermissionDenied, Unauthenticated
 from django_socio_grpc.grpc_actions.actions import GRPCActionMixin
 from django_socio_grpc.request_transformer.grpc_internal_proxy import GRPCInternalProxyContext
 from django_socio_grpc.services.servicer_proxy import ServicerProxy
 from django_socio_grpc.settings import grpc_settings
+from django_socio_grpc.utils.executor import db_sync_to_async
 
 if TYPE_CHECKING:
     from django_socio_grpc.protobuf import AppHandlerRegistry
@@ -20,9 +25,66 @@ from logging import getLogger
 logger = getLogger(__name__)
 
 
+def _get_denying_permission(permissions, method_name, *args):
+    for permission in permissions:
+        if not getattr(permission, method_name)(*args):
+            return permission
+    return None
+
+
+async def _aget_denying_permission(permission, has_permission):
+    return None if await has_permission else permission
+
+
+def _group_permissions(permissions, method_name):
+    """
+    Split `permissions` in the groups evaluated one after the other: the consecutive
+    sync permissions, the consecutive async permissions whose ``concurrent`` attribute
+    is true, and each other async permission.
+    """
+    groups = []
+    for permission in permissions:
+        if not asyncio.iscoroutinefunction(getattr(permission, method_name)):
+            kind = "sync"
+        elif getattr(permission, "concurrent", False):
+            kind = "concurrent"
+        else:
+            kind = None
+        if kind is not None and groups and groups[-1][0] == kind:
+            groups[-1][1].append(permission)
+        else:
+            groups.append((kind, [permission]))
+    return groups
+
+
+def _retrieve_exception(task):
+    if not task.cancelled():
+        task.exception()
+
+
+async def _afirst_denying_permission(checks):
+    tasks = [asyncio.ensure_future(check) for check in checks]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            denying_permission = await next_done
+            if denying_permission is not None:
+                return denying_permission
+        return None
+    finally:
+        for task in tasks:
+            if not task.done():
+                # INFO - The exceptions raised after the first denial are ignored
+                task.add_done_callback(_retrieve_exception)
+                task.cancel()
+
+
 class Service(GRPCActionMixin):
     authentication_classes = grpc_settings.DEFAULT_AUTHENTICATION_CLASSES
     permission_classes = grpc_settings.DEFAULT_PERMISSION_CLASSES
+    # INFO - Maximum number of queries of an RPC, or of each action in a dict by action name
+    query_budget = grpc_settings.QUERY_BUDGET
+    # INFO - Actions that can return `EncodedMessage` responses, sent without being serialized
+    encoded_response_actions: Tuple[str, ...] = ()
 
     action: str = None
     request: Message = None
@@ -67,11 +129,26 @@ class Service(GRPCActionMixin):
         self._is_auth_performed = True
 
     def resolve_user(self):
-        auth_responses = [
-            auth().authenticate(self.context) for auth in self.authentication_classes
-        ]
-        if auth_responses:
-            return auth_responses[0]
+        """
+        Return the user and auth of the first authentication class authenticating the
+        request, or None. The result is cached by credential when the
+        `AUTHENTICATION_CACHE_TIMEOUT` setting is set.
+        """
+        credential = get_request_credential(self.context)
+        if credential is not None:
+            user_auth_tuple = get_cached_authentication(
+                credential, self.authentication_classes
+            )
+            if user_auth_tuple is not None:
+                return user_auth_tuple
+        for auth in self.authentication_classes:
+            user_auth_tuple = auth().authenticate(self.context)
+            if user_auth_tuple is not None:
+                if credential is not None:
+                    set_cached_authentication(
+                        credential, self.authentication_classes, user_auth_tuple
+                    )
+                return user_auth_tuple
         return None
 
     def _check_permissions(self):
@@ -80,12 +157,7 @@ class Service(GRPCActionMixin):
                 raise PermissionDenied(detail=getattr(permission, "message", None))
 
     async def _async_check_permissions(self):
-        for permission in self.get_permissions():
-            has_permission = permission.has_permission
-            if not asyncio.iscoroutinefunction(permission.has_permission):
-                has_permission = sync_to_async(permission.has_permission)
-            if not await has_permission(self.context, self):
-                raise PermissionDenied(detail=getattr(permission, "message", None))
+        await self._aevaluate_permissions("has_permission", self.context, self)
 
     def check_permissions(self):
         if grpc_settings.GRPC_ASYNC:
@@ -93,12 +165,35 @@ class Service(GRPCActionMixin):
         return self._check_permissions()
 
     async def acheck_object_permissions(self, obj):
-        for permission in self.get_permissions():
-            has_object_permission = permission.has_object_permission
-            if not asyncio.iscoroutinefunction(permission.has_object_permission):
-                has_object_permission = sync_to_async(permission.has_object_permission)
-            if not await has_object_permission(self.context, self, obj):
-                raise PermissionDenied(detail=getattr(permission, "message", None))
+        await self._aevaluate_permissions("has_object_permission", self.context, self, obj)
+
+    async def _aevaluate_permissions(self, method_name, *args):
+        """
+        Raise PermissionDenied if one of the permissions denies the request, evaluating
+        them in order. The consecutive sync permissions are evaluated in a single thread
+        hop and the consecutive async permissions with ``concurrent = True`` concurrently,
+        their first denial cancelling the pending evaluations.
+        """
+        for kind, permissions in _group_permissions(self.get_permissions(), method_name):
+            if kind == "sync":
+                denying_permission = await db_sync_to_async(
+                    _get_denying_permission, "permissions"
+                )(permissions, method_name, *args)
+            elif len(permissions) == 1:
+                denying_permission = await _aget_denying_permission(
+                    permissions[0], getattr(permissions[0], method_name)(*args)
+                )
+            else:
+                denying_permission = await _afirst_denying_permission(
+                    [
+                        _aget_denying_permission(
+                            permission, getattr(permission, method_name)(*args)
+                        )
+                        for permission in permissions
+                    ]
+                )
+            if denying_permission is not None:
+                raise PermissionDenied(detail=getattr(denying_permission, "message", None))
 
     def check_object_permissions(self, obj):
         for permission in self.get_permissions():
@@ -106,14 +201,37 @@ class Service(GRPCActionMixin):
                 raise PermissionDenied(detail=getattr(permission, "message", None))
 
     def get_permissions(self) -> List[BasePermission]:
-        return [permission() for permission in self.permission_classes]
+        """
+        Return the instances of ``permission_classes``. The ones of the permission classes
+        declaring ``stateless = True`` are built once by service class and shared by its
+        requests, unless ``permission_classes`` is set on the instance. The others are
+        built by call.
+        """
+        if "permission_classes" in self.__dict__:
+            return [permission() for permission in self.permission_classes]
+        service_class = type(self)
+        permission_classes = tuple(service_class.permission_classes)
+        cached = service_class.__dict__.get("_permissions")
+        if cached is None or cached[0] != permission_classes:
+            cached = (
+                permission_classes,
+                [
+                    permission() if getattr(permission, "stateless", False) else None
+                    for permission in permission_classes
+                ],
+            )
+            service_class._permissions = cached
+        return [
+            permission if permission is not None else permission_class()
+            for permission_class, permission in zip(*cached)
+        ]
 
     def _before_action(self):
         self.perform_authentication()
         self.check_permissions()
 
     async def _async_before_action(self):
-        await sync_to_async(self.perform_authentication)()
+        await db_sync_to_async(self.perform_authentication, "authentication")()
         await self.check_permissions()
 
     def before_action(self):
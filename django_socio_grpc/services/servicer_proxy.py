@@ -1,7 +1,20 @@
 import abc
 import asyncio
 import logging
-from typing import TYPE_CHECKING, AsyncIterable, Awaitable, Callable, Optional, Type
+import threading
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Type,
+)
 
 import grpc
 from asgiref.local import Local
@@ -18,6 +31,7 @@ from django_socio_grpc.exceptions import (
     Unimplemented,
     get_exception_status_code_and_details,
 )
+from django_socio_grpc.metrics import ActionMetrics, metrics_registry
 from django_socio_grpc.request_transformer import (
     GRPCInternalProxyResponse,
     GRPCRequestContainer,
@@ -42,6 +56,129 @@ def get_servicer_context():
     return _ServicerCtx
 
 
+class InFlightRPCs:
+    """
+    Number of RPCs being handled by the servicer proxies of the process.
+    Used by the run commands to drain them on shutdown.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._condition = threading.Condition()
+
+    def __enter__(self):
+        with self._condition:
+            self.count += 1
+
+    def __exit__(self, *exc_info):
+        with self._condition:
+            self.count -= 1
+            if not self.count:
+                self._condition.notify_all()
+
+    def wait(self, timeout=None) -> bool:
+        """
+        Wait until no RPC is in flight. Return False if some still are after `timeout` seconds.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self.count, timeout)
+
+
+in_flight_rpcs = InFlightRPCs()
+
+
+class EncodedMessage:
+    """
+    Response message already serialized, returned by an action of the
+    `encoded_response_actions` of its service to send `data` without parsing and
+    serializing it again.
+    """
+
+    __slots__ = ("data", "message_class")
+
+    def __init__(self, data: bytes, message_class: Optional[Type[Message]] = None):
+        self.data = data
+        self.message_class = message_class
+
+    def decode(self) -> Message:
+        """
+        Parse the message. Only used when the message itself is needed, as by middlewares.
+        """
+        if self.message_class is None:
+            raise TypeError("The message class of the encoded message is unknown")
+        return self.message_class.FromString(self.data)
+
+    def __repr__(self):
+        return f"<EncodedMessage: {len(self.data)} bytes>"
+
+
+def _encoded_response_serializer(response_serializer: Callable) -> Callable:
+    def serializer(response):
+        if isinstance(response, EncodedMessage):
+            return response.data
+        return response_serializer(response)
+
+    return serializer
+
+
+class EncodedResponseServer:
+    """
+    Proxy of a grpc server given to the generated `add_<Controller>Servicer_to_server`
+    functions. The handlers of `actions` are registered with a response serializer
+    sending the data of the `EncodedMessage` responses as is.
+    """
+
+    def __init__(self, server, actions: Iterable[str]):
+        self.server = server
+        self.actions = frozenset(actions)
+
+    def wrap_method_handlers(
+        self, method_handlers: Dict[str, grpc.RpcMethodHandler]
+    ) -> Dict[str, grpc.RpcMethodHandler]:
+        """
+        Replace the response serializer of the method handlers, by method name, of `actions`.
+        """
+        return {
+            method: (
+                handler._replace(
+                    response_serializer=_encoded_response_serializer(
+                        handler.response_serializer
+                    )
+                )
+                if method in self.actions and handler.response_serializer is not None
+                else handler
+            )
+            for method, handler in method_handlers.items()
+        }
+
+    def wrap_generic_handler(self, generic_handler: grpc.GenericRpcHandler):
+        # INFO - The generated code builds its generic handlers with
+        # `grpc.method_handlers_generic_handler`, the others are left as is
+        method_handlers = getattr(generic_handler, "_method_handlers", None)
+        if method_handlers is None or not isinstance(generic_handler, grpc.ServiceRpcHandler):
+            return generic_handler
+        service_name = generic_handler.service_name()
+        return grpc.method_handlers_generic_handler(
+            service_name,
+            self.wrap_method_handlers(
+                {path.rsplit("/", 1)[-1]: handler for path, handler in method_handlers.items()}
+            ),
+        )
+
+    def add_generic_rpc_handlers(self, generic_rpc_handlers):
+        self.server.add_generic_rpc_handlers(
+            tuple(self.wrap_generic_handler(handler) for handler in generic_rpc_handlers)
+        )
+
+    def add_registered_method_handlers(self, service_name, method_handlers):
+        self.server.add_registered_method_handlers(
+            service_name, self.wrap_method_handlers(method_handlers)
+        )
+
+    def __getattr__(self, attr):
+        return getattr(self.server, attr)
+
+
 class MiddlewareCapable(metaclass=abc.ABCMeta):
     """
     Allows to define middlewares that can be used in sync and async mode.
@@ -139,11 +276,17 @@ class ServicerProxy(MiddlewareCapable):
 
     """
 
+    # INFO - Handlers of the service actions, by action name, built once by `compile_handlers`
+    _handlers: Mapping[str, Callable] = MappingProxyType({})
+
     def __init__(self, service_class: Type["Service"], **initkwargs):
         self.service_class = service_class
         self.initkwargs = initkwargs
+        self.is_async = grpc_settings.GRPC_ASYNC
+        self.log_ok_response = grpc_settings.LOG_OK_RESPONSE or settings.DEBUG
 
-        self.load_middleware(is_async=grpc_settings.GRPC_ASYNC)
+        self.load_middleware(is_async=self.is_async)
+        self._handlers = MappingProxyType(self.compile_handlers())
 
     def _get_response(self, request_container: GRPCRequestContainer) -> GRPCResponseContainer:
         action = getattr(request_container.service, request_container.action)
@@ -176,95 +319,172 @@ class ServicerProxy(MiddlewareCapable):
             await request_container.service.after_action()
 
     def _get_async_stream_handler(self, action: str) -> Awaitable[Callable]:
+        metrics = self.get_action_metrics(action)
+
         async def handler(request: Message, context) -> AsyncIterable[Message]:
-            proxy_context = GRPCInternalProxyContext(context, action)
-            service_instance = self.create_service(
-                request=request, context=proxy_context, action=action
-            )
-            request_container = GRPCRequestContainer(
-                request, proxy_context, action, service_instance
-            )
-            try:
-                exc = None
-                async for response in await safe_async_response(
-                    self._middleware_chain, request_container
-                ):
-                    yield response.grpc_response
-            except Exception as e:
-                exc = e
-                await self.async_process_exception(e, context)
-            finally:
-                self.log_response(exc, request_container)
+            with in_flight_rpcs:
+                started_at = metrics.start() if metrics else None
+                messages_sent = 0
+                proxy_context = GRPCInternalProxyContext(context, action)
+                service_instance = self.create_service(
+                    request=request, context=proxy_context, action=action
+                )
+                request_container = GRPCRequestContainer(
+                    request, proxy_context, action, service_instance
+                )
+                try:
+                    exc = None
+                    cancelled = False
+                    async for response in await safe_async_response(
+                        self._middleware_chain, request_container
+                    ):
+                        messages_sent += 1
+                        yield response.grpc_response
+                except Exception as e:
+                    exc = e
+                    await self.async_process_exception(e, context)
+                except (GeneratorExit, asyncio.CancelledError):
+                    # INFO - The client cancelled the RPC or closed the stream
+                    cancelled = True
+                    raise
+                finally:
+                    self.log_response(exc, request_container)
+                    if metrics:
+                        metrics.observe(exc, started_at, messages_sent, cancelled)
 
         return handler
 
     def _get_async_handler(self, action: str) -> Awaitable[Callable]:
+        metrics = self.get_action_metrics(action)
+
         async def handler(request: Message, context) -> Awaitable[Message]:
-            proxy_context = GRPCInternalProxyContext(context, action)
-            service_instance = self.create_service(
-                request=request, context=proxy_context, action=action
-            )
-            request_container = GRPCRequestContainer(
-                request, proxy_context, action, service_instance
-            )
-            try:
-                exc = None
-                response = await safe_async_response(self._middleware_chain, request_container)
-                return response.grpc_response
-            except Exception as e:
-                exc = e
-                await self.async_process_exception(e, context)
-            finally:
-                self.log_response(exc, request_container)
+            with in_flight_rpcs:
+                started_at = metrics.start() if metrics else None
+                proxy_context = GRPCInternalProxyContext(context, action)
+                service_instance = self.create_service(
+                    request=request, context=proxy_context, action=action
+                )
+                request_container = GRPCRequestContainer(
+                    request, proxy_context, action, service_instance
+                )
+                try:
+                    exc = None
+                    cancelled = False
+                    response = await safe_async_response(
+                        self._middleware_chain, request_container
+                    )
+                    return response.grpc_response
+                except Exception as e:
+                    exc = e
+                    await self.async_process_exception(e, context)
+                except asyncio.CancelledError:
+                    cancelled = True
+                    raise
+                finally:
+                    self.log_response(exc, request_container)
+                    if metrics:
+                        metrics.observe(
+                            exc, started_at, int(exc is None and not cancelled), cancelled
+                        )
 
         return handler
 
     def _get_handler(self, action: str) -> Callable:
+        metrics = self.get_action_metrics(action)
+
         def handler(request: Message, context) -> Message:
-            proxy_context = GRPCInternalProxyContext(context, action)
-            service_instance = self.create_service(
-                request=request, context=proxy_context, action=action
-            )
-            request_container = GRPCRequestContainer(
-                request, proxy_context, action, service_instance
-            )
-            try:
-                exc = None
-                response = self._middleware_chain(request_container)
-                return response.grpc_response
-            except Exception as e:
-                exc = e
-                self.process_exception(e, context)
-            finally:
-                self.log_response(exc, request_container)
+            with in_flight_rpcs:
+                started_at = metrics.start() if metrics else None
+                proxy_context = GRPCInternalProxyContext(context, action)
+                service_instance = self.create_service(
+                    request=request, context=proxy_context, action=action
+                )
+                request_container = GRPCRequestContainer(
+                    request, proxy_context, action, service_instance
+                )
+                try:
+                    exc = None
+                    response = self._middleware_chain(request_container)
+                    return response.grpc_response
+                except Exception as e:
+                    exc = e
+                    self.process_exception(e, context)
+                finally:
+                    self.log_response(exc, request_container)
+                    if metrics:
+                        metrics.observe(exc, started_at, int(exc is None))
 
         return handler
 
     def _get_stream_handler(self, action: str) -> Callable:
+        metrics = self.get_action_metrics(action)
+
         def handler(request: Message, context) -> AsyncIterable[Message]:
-            proxy_context = GRPCInternalProxyContext(context, action)
-            service_instance = self.create_service(
-                request=request, context=proxy_context, action=action
-            )
-            request_container = GRPCRequestContainer(
-                request, proxy_context, action, service_instance
-            )
-            try:
-                exc = None
-                for response in self._middleware_chain(request_container):
-                    yield response.grpc_response
-            except Exception as e:
-                exc = e
-                self.process_exception(e, context)
-            finally:
-                self.log_response(exc, request_container)
+            with in_flight_rpcs:
+                started_at = metrics.start() if metrics else None
+                messages_sent = 0
+                proxy_context = GRPCInternalProxyContext(context, action)
+                service_instance = self.create_service(
+                    request=request, context=proxy_context, action=action
+                )
+                request_container = GRPCRequestContainer(
+                    request, proxy_context, action, service_instance
+                )
+                try:
+                    exc = None
+                    cancelled = False
+                    for response in self._middleware_chain(request_container):
+                        messages_sent += 1
+                        yield response.grpc_response
+                except Exception as e:
+                    exc = e
+                    self.process_exception(e, context)
+                except GeneratorExit:
+                    # INFO - The client cancelled the RPC or closed the stream
+                    cancelled = True
+                    raise
+                finally:
+                    self.log_response(exc, request_container)
+                    if metrics:
+                        metrics.observe(exc, started_at, messages_sent, cancelled)
 
         return handler
 
+    def wrap_server(self, server):
+        """
+        Return the server to give to the generated `add_<Controller>Servicer_to_server`
+        function, so that the `encoded_response_actions` of the service can return
+        `EncodedMessage` responses.
+        """
+        actions = getattr(self.service_class, "encoded_response_actions", ())
+        if not actions:
+            return server
+        return EncodedResponseServer(server, actions)
+
+    def get_action_metrics(self, action: str) -> Optional[ActionMetrics]:
+        if not grpc_settings.ENABLE_METRICS:
+            return None
+        return metrics_registry.get_action_metrics(
+            self.service_class.get_service_name(), action
+        )
+
+    def get_action_names(self) -> List[str]:
+        """
+        Names of the actions the handlers are compiled for: the registered rpcs
+        and the grpc actions declared in the service and its mixins.
+        """
+        proto_service = getattr(self.service_class, "proto_service", None)
+        names = [rpc.name for rpc in proto_service.rpcs] if proto_service else []
+        for parent in self.service_class.mro():
+            names += parent.__dict__.get("_decorated_grpc_action_registry", {})
+        return [name for name in dict.fromkeys(names) if hasattr(self.service_class, name)]
+
+    def compile_handlers(self) -> Dict[str, Callable]:
+        return {action: self.get_handler(action) for action in self.get_action_names()}
+
     def get_handler(self, action: str) -> Message:
         service_action = getattr(self.service_class, action)
-
-        if grpc_settings.GRPC_ASYNC:
+        if self.is_async:
             if isgeneratorfunction(service_action):
                 return self._get_async_stream_handler(action)
             return self._get_async_handler(action)
@@ -280,6 +500,12 @@ class ServicerProxy(MiddlewareCapable):
         return service
 
     def __getattr__(self, action):
+        try:
+            return self._handlers[action]
+        except KeyError:
+            pass
+
+        # INFO - Attributes not known at `as_servicer` time (not registered yet or added later)
         if not hasattr(self.service_class, action):
             raise Unimplemented()
 
@@ -319,16 +545,19 @@ class ServicerProxy(MiddlewareCapable):
     def log_response(
         self, exception: Optional[Exception], request_container: GRPCRequestContainer
     ):
+        if not exception and not self.log_ok_response:
+            return
+
         extra = {
             "request": request_container,
             "status_code": request_container.context.code(),
+            **request_container.log_extra,
         }
         path = f"{self.service_class.get_service_name()}/{request_container.action}"
 
         if not exception:
-            if grpc_settings.LOG_OK_RESPONSE or settings.DEBUG:
-                message = f"OK : {path}"
-                request_logger.info(message, extra=extra)
+            message = f"OK : {path}"
+            request_logger.info(message, extra=extra)
         else:
             message = f"{type(exception).__name__} : {path}"
             self.log_exception(exception, message, extra=extra)
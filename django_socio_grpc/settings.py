@@ -44,14 +44,39 @@ DEFAULTS = {
     "SERVER_OPTIONS": None,
     # Default servicer authentication classes
     "DEFAULT_AUTHENTICATION_CLASSES": [],
+    # Seconds the authentication result of a credential is cached, None to disable the cache
+    "AUTHENTICATION_CACHE_TIMEOUT": None,
+    # Django cache storing the authentication results
+    "AUTHENTICATION_CACHE_ALIAS": "default",
+    # Key of the request META holding the credential the authentication results are cached by
+    "AUTHENTICATION_CACHE_HEADER": "HTTP_AUTHORIZATION",
+    # Django cache storing the model versions of the cached responses, and the responses by default
+    "RESPONSE_CACHE_ALIAS": "default",
     # Default filter class
     "DEFAULT_FILTER_BACKENDS": [],
     # default pagination class
     "DEFAULT_PAGINATION_CLASS": None,
+    # How the count of paginated list responses is computed: "exact", "cached", "estimate" or "none"
+    "DEFAULT_COUNT_STRATEGY": "exact",
+    # Number of seconds the count of paginated list responses is cached with the "cached" count strategy
+    "COUNT_CACHE_TIMEOUT": 60,
+    # Apply select_related/prefetch_related derived from the serializer relations to GenericService querysets
+    "OPTIMIZE_RELATED_QUERIES": False,
+    # Use the async queryset API of Django in the async generic mixins, see GenericService.async_orm
+    "ASYNC_ORM": False,
     # Default permission classes
     "DEFAULT_PERMISSION_CLASSES": [],
     # gRPC running mode
     "GRPC_ASYNC": False,
+    # Run the sync code of the async services in the thread-sensitive thread (True) or in a thread pool (False).
+    # Either a boolean or a dict by call site. See django_socio_grpc.utils.executor
+    "SYNC_TO_ASYNC_THREAD_SENSITIVE": True,
+    # Number of threads of the pool running the sync code that is not thread sensitive, None for the ThreadPoolExecutor default
+    "SYNC_TO_ASYNC_MAX_WORKERS": None,
+    # Event loop of the async server: "asyncio" or "uvloop" (asyncio if uvloop is not installed)
+    "EVENT_LOOP": "asyncio",
+    # Seconds given to in-flight RPCs to finish when the run commands receive SIGTERM or SIGINT
+    "SHUTDOWN_GRACE_PERIOD": 10,
     # Default grpc channel port
     "GRPC_CHANNEL_PORT": 50051,
     # Default logging action
@@ -67,16 +92,29 @@ DEFAULTS = {
     ],
     # Root GRPC folder for external grpc handlers
     "ROOT_GRPC_FOLDER": "grpc_folder",
-    # Default places where to search headers, pagination and filter data
+    # Default places where to search headers, pagination, filter and field mask data
     "MAP_METADATA_KEYS": {
         "HEADERS": "HEADERS",
         "PAGINATION": "PAGINATION",
         "FILTERS": "FILTERS",
+        "FIELD_MASK": "FIELD_MASK",
     },
     # Get extra data from service when using log middleware or processing exception in django-socio-grpc
     "LOG_EXTRA_CONTEXT_FUNCTION": "django_socio_grpc.log.default_get_log_extra_context",
     # Log requests even for response OK
     "LOG_OK_RESPONSE": False,
+    # Maximum number of database queries of an RPC recorded by query_count_middleware, None for no limit
+    "QUERY_BUDGET": None,
+    # Raise QueryBudgetExceeded instead of logging a warning when an RPC exceeds its query budget
+    "RAISE_ON_QUERY_BUDGET_EXCEEDED": False,
+    # Record per action metrics. See django_socio_grpc.metrics
+    "ENABLE_METRICS": False,
+    # Local port where the run commands serve the metrics in Prometheus text format, None to disable
+    "METRICS_PORT": None,
+    # Address the metrics port is bound to, "" or "0.0.0.0" to serve them on every interface
+    "METRICS_ADDRESS": "127.0.0.1",
+    # Upper bounds in seconds of the buckets of the action latency histogram
+    "METRICS_HISTOGRAM_BUCKETS": (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
 }
 
 
@@ -0,0 +1,51 @@
+"""
+Small helpers to measure and report the cost of a code path in the test suite.
+
+Benchmarks run with few iterations by default to keep the suite fast.
+Set the `BENCHMARK_ITERATIONS` environment variable and run pytest with `-s`
+to get meaningful numbers.
+"""
+import os
+import statistics
+import time
+
+BENCHMARK_ITERATIONS = int(os.environ.get("BENCHMARK_ITERATIONS", 20))
+
+
+def run_benchmark(fn, iterations=None):
+    """
+    Call `fn` `iterations` times and return the timing of each call in seconds.
+    """
+    iterations = iterations or BENCHMARK_ITERATIONS
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def arun_benchmark(fn, iterations=None):
+    """
+    Await `fn()` `iterations` times and return the timing of each call in seconds.
+    """
+    iterations = iterations or BENCHMARK_ITERATIONS
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(title, results):
+    """
+    Print the median and mean timing of each named result of `results`.
+    """
+    lines = [f"\n{title}"]
+    for name, timings in results.items():
+        lines.append(
+            f"  {name:<30} median: {statistics.median(timings) * 1e6:10.1f}us"
+            f"  mean: {statistics.mean(timings) * 1e6:10.1f}us"
+        )
+    print("\n".join(lines))
@@ -15,7 +15,7 @@ from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n2django_socio_grpc/tests/fakeapp/grpc/fakeapp.proto\x12\x11myproject.fakeapp\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1cgoogle/protobuf/struct.proto\"k\n\x1c\x42\x61seProtoExampleListResponse\x12<\n\x07results\x18\x01 \x03(\x0b\x32+.myproject.fakeapp.BaseProtoExampleResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"X\n\x17\x42\x61seProtoExampleRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1a\n\x12number_of_elements\x18\x02 \x01(\x05\x12\x13\n\x0bis_archived\x18\x03 \x01(\x08\"Y\n\x18\x42\x61seProtoExampleResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1a\n\x12number_of_elements\x18\x02 \x01(\x05\x12\x13\n\x0bis_archived\x18\x03 \x01(\x08\"1\n\x1c\x42\x61sicFetchDataForUserRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\"/\n\x1f\x42\x61sicFetchTranslatedKeyResponse\x12\x0c\n\x04text\x18\x01 \x01(\t\"#\n\x14\x42\x61sicListIdsResponse\x12\x0b\n\x03ids\x18\x01 \x03(\x05\"%\n\x15\x42\x61sicListNameResponse\x12\x0c\n\x04name\x18\x01 \x03(\t\"e\n\x19\x42\x61sicMixParamListResponse\x12\x39\n\x07results\x18\x01 \x03(\x0b\x32(.myproject.fakeapp.BasicMixParamResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"*\n\x15\x42\x61sicMixParamResponse\x12\x11\n\tuser_name\x18\x01 \x01(\t\"b\n\'BasicMixParamWithSerializerListResponse\x12(\n\x07results\x18\x01 \x03(\x0b\x32\x17.google.protobuf.Struct\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"y\n#BasicParamWithSerializerListRequest\x12\x43\n\x07results\x18\x01 \x03(\x0b\x32\x32.myproject.fakeapp.BasicParamWithSerializerRequest\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xbd\x01\n\x1f\x42\x61sicParamWithSerializerRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12*\n\tuser_data\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x15\n\ruser_password\x18\x03 \x01(\t\x12\x15\n\rbytes_example\x18\x04 \x01(\x0c\x12-\n\x0clist_of_dict\x18\x05 \x03(\x0b\x32\x17.google.protobuf.Struct\"o\n\x1e\x42\x61sicProtoListChildListRequest\x12>\n\x07results\x18\x01 \x03(\x0b\x32-.myproject.fakeapp.BasicProtoListChildRequest\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"q\n\x1f\x42\x61sicProtoListChildListResponse\x12?\n\x07results\x18\x01 \x03(\x0b\x32..myproject.fakeapp.BasicProtoListChildResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"S\n\x1a\x42\x61sicProtoListChildRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_text\"T\n\x1b\x42\x61sicProtoListChildResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_text\"c\n\x18\x42\x61sicServiceListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.myproject.fakeapp.BasicServiceResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xb1\x01\n\x13\x42\x61sicServiceRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12*\n\tuser_data\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x15\n\ruser_password\x18\x03 \x01(\t\x12\x15\n\rbytes_example\x18\x04 \x01(\x0c\x12-\n\x0clist_of_dict\x18\x05 \x03(\x0b\x32\x17.google.protobuf.Struct\"\x9b\x01\n\x14\x42\x61sicServiceResponse\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12*\n\tuser_data\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x15\n\rbytes_example\x18\x03 \x01(\x0c\x12-\n\x0clist_of_dict\x18\x04 \x03(\x0b\x32\x17.google.protobuf.Struct\"k\n\x1c\x43ustomMixParamForListRequest\x12<\n\x07results\x18\x01 \x03(\x0b\x32+.myproject.fakeapp.CustomMixParamForRequest\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"-\n\x18\x43ustomMixParamForRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\")\n\x14\x43ustomNameForRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\"*\n\x15\x43ustomNameForResponse\x12\x11\n\tuser_name\x18\x01 \x01(\t\"\x94\x01\n0CustomRetrieveResponseSpecialFieldsModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1c\n\x14\x64\x65\x66\x61ult_method_field\x18\x02 \x01(\x05\x12\x34\n\x13\x63ustom_method_field\x18\x03 \x03(\x0b\x32\x17.google.protobuf.Struct\"3\n%ExceptionStreamRaiseExceptionResponse\x12\n\n\x02id\x18\x01 \x01(\t\"\x19\n\x17\x46oreignModelListRequest\"c\n\x18\x46oreignModelListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.myproject.fakeapp.ForeignModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"2\n\x14\x46oreignModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"B\n\"ForeignModelRetrieveCustomResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06\x63ustom\x18\x02 \x01(\t\"9\n)ForeignModelRetrieveCustomRetrieveRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"c\n#ImportStructEvenInArrayModelRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12.\n\rthis_is_crazy\x18\x02 \x03(\x0b\x32\x17.google.protobuf.Struct\"d\n$ImportStructEvenInArrayModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12.\n\rthis_is_crazy\x18\x02 \x03(\x0b\x32\x17.google.protobuf.Struct\"U\n\x14ManyManyModelRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12!\n\x19test_write_only_on_nested\x18\x03 \x01(\t\"3\n\x15ManyManyModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"0\n RecursiveTestModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"\x1f\n\x1dRecursiveTestModelListRequest\"o\n\x1eRecursiveTestModelListResponse\x12>\n\x07results\x18\x01 \x03(\x0b\x32-.myproject.fakeapp.RecursiveTestModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xd4\x01\n&RecursiveTestModelPartialUpdateRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12<\n\x06parent\x18\x03 \x01(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequest\x12>\n\x08\x63hildren\x18\x04 \x03(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequest\"\xa7\x01\n\x19RecursiveTestModelRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12<\n\x06parent\x18\x02 \x01(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequest\x12>\n\x08\x63hildren\x18\x03 \x03(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequest\"\xaa\x01\n\x1aRecursiveTestModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12=\n\x06parent\x18\x02 \x01(\x0b\x32-.myproject.fakeapp.RecursiveTestModelResponse\x12?\n\x08\x63hildren\x18\x03 \x03(\x0b\x32-.myproject.fakeapp.RecursiveTestModelResponse\"1\n!RecursiveTestModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"/\n\x1fRelatedFieldModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"\x1e\n\x1cRelatedFieldModelListRequest\"|\n\x1dRelatedFieldModelListResponse\x12L\n\x16list_custom_field_name\x18\x01 \x03(\x0b\x32,.myproject.fakeapp.RelatedFieldModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xc8\x01\n%RelatedFieldModelPartialUpdateRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12:\n\tmany_many\x18\x02 \x03(\x0b\x32\'.myproject.fakeapp.ManyManyModelRequest\x12\x19\n\x11\x63ustom_field_name\x18\x03 \x01(\t\x12\x1e\n\x16_partial_update_fields\x18\x04 \x03(\t\x12\x1a\n\x12many_many_foreigns\x18\x05 \x03(\t\"\x9b\x01\n\x18RelatedFieldModelRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12:\n\tmany_many\x18\x02 \x03(\x0b\x32\'.myproject.fakeapp.ManyManyModelRequest\x12\x19\n\x11\x63ustom_field_name\x18\x03 \x01(\t\x12\x1a\n\x12many_many_foreigns\x18\x04 \x03(\t\"\xcb\x02\n\x19RelatedFieldModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x38\n\x07\x66oreign\x18\x02 \x01(\x0b\x32\'.myproject.fakeapp.ForeignModelResponse\x12;\n\tmany_many\x18\x03 \x03(\x0b\x32(.myproject.fakeapp.ManyManyModelResponse\x12\x17\n\x0fslug_test_model\x18\x04 \x01(\x05\x12\x1f\n\x17slug_reverse_test_model\x18\x05 \x03(\x08\x12\x16\n\x0eslug_many_many\x18\x06 \x03(\t\x12 \n\x18proto_slug_related_field\x18\x07 \x01(\t\x12\x19\n\x11\x63ustom_field_name\x18\x08 \x01(\t\x12\x1a\n\x12many_many_foreigns\x18\t \x03(\t\"0\n RelatedFieldModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"0\n SpecialFieldsModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"\x1f\n\x1dSpecialFieldsModelListRequest\"o\n\x1eSpecialFieldsModelListResponse\x12>\n\x07results\x18\x01 \x03(\x0b\x32-.myproject.fakeapp.SpecialFieldsModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\x97\x01\n&SpecialFieldsModelPartialUpdateRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12+\n\nmeta_datas\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x12\n\nlist_datas\x18\x04 \x03(\x05\"j\n\x19SpecialFieldsModelRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12+\n\nmeta_datas\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x12\n\nlist_datas\x18\x03 \x03(\x05\"{\n\x1aSpecialFieldsModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12+\n\nmeta_datas\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x12\n\nlist_datas\x18\x03 \x03(\x05\x12\x0e\n\x06\x62inary\x18\x04 \x01(\x0c\"1\n!SpecialFieldsModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"k\n\x1cStreamInStreamInListResponse\x12<\n\x07results\x18\x01 \x03(\x0b\x32+.myproject.fakeapp.StreamInStreamInResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\'\n\x17StreamInStreamInRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\")\n\x18StreamInStreamInResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\"-\n\x1dStreamInStreamToStreamRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\".\n\x1eStreamInStreamToStreamResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\"=\n)SyncUnitTestModelListWithExtraArgsRequest\x12\x10\n\x08\x61rchived\x18\x01 \x01(\x08\")\n\x1bUnitTestModelDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\x8e\x01\n\"UnitTestModelListExtraArgsResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\x1e\n\x16query_fetched_datetime\x18\x02 \x01(\t\x12\x39\n\x07results\x18\x03 \x03(\x0b\x32(.myproject.fakeapp.UnitTestModelResponse\"\x1a\n\x18UnitTestModelListRequest\"e\n\x19UnitTestModelListResponse\x12\x39\n\x07results\x18\x01 \x03(\x0b\x32(.myproject.fakeapp.UnitTestModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"9\n%UnitTestModelListWithExtraArgsRequest\x12\x10\n\x08\x61rchived\x18\x01 \x01(\x08\"z\n!UnitTestModelPartialUpdateRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x04 \x03(\tB\x07\n\x05_text\"M\n\x14UnitTestModelRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_text\"N\n\x15UnitTestModelResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x11\n\x04text\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\r\n\x05title\x18\x03 \x01(\tB\x07\n\x05_text\"*\n\x1cUnitTestModelRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\x1c\n\x1aUnitTestModelStreamRequest2\xca\t\n\x0f\x42\x61sicController\x12t\n\tBasicList\x12\x31.myproject.fakeapp.BasicProtoListChildListRequest\x1a\x32.myproject.fakeapp.BasicProtoListChildListResponse\"\x00\x12[\n\x06\x43reate\x12&.myproject.fakeapp.BasicServiceRequest\x1a\'.myproject.fakeapp.BasicServiceResponse\"\x00\x12n\n\x10\x46\x65tchDataForUser\x12/.myproject.fakeapp.BasicFetchDataForUserRequest\x1a\'.myproject.fakeapp.BasicServiceResponse\"\x00\x12\x62\n\x12\x46\x65tchTranslatedKey\x12\x16.google.protobuf.Empty\x1a\x32.myproject.fakeapp.BasicFetchTranslatedKeyResponse\"\x00\x12T\n\x0bGetMultiple\x12\x16.google.protobuf.Empty\x1a+.myproject.fakeapp.BasicServiceListResponse\"\x00\x12L\n\x07ListIds\x12\x16.google.protobuf.Empty\x1a\'.myproject.fakeapp.BasicListIdsResponse\"\x00\x12N\n\x08ListName\x12\x16.google.protobuf.Empty\x1a(.myproject.fakeapp.BasicListNameResponse\"\x00\x12k\n\x08MixParam\x12/.myproject.fakeapp.CustomMixParamForListRequest\x1a,.myproject.fakeapp.BasicMixParamListResponse\"\x00\x12\x8e\x01\n\x16MixParamWithSerializer\x12\x36.myproject.fakeapp.BasicParamWithSerializerListRequest\x1a:.myproject.fakeapp.BasicMixParamWithSerializerListResponse\"\x00\x12_\n\x08MyMethod\x12\'.myproject.fakeapp.CustomNameForRequest\x1a(.myproject.fakeapp.CustomNameForResponse\"\x00\x12x\n\x17TestBaseProtoSerializer\x12*.myproject.fakeapp.BaseProtoExampleRequest\x1a/.myproject.fakeapp.BaseProtoExampleListResponse\"\x00\x12\x43\n\x0fTestEmptyMethod\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x32\xd1\x02\n\x13\x45xceptionController\x12@\n\x0c\x41PIException\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12\x41\n\rGRPCException\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12l\n\x14StreamRaiseException\x12\x16.google.protobuf.Empty\x1a\x38.myproject.fakeapp.ExceptionStreamRaiseExceptionResponse\"\x00\x30\x01\x12G\n\x13UnaryRaiseException\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x32\xff\x01\n\x16\x46oreignModelController\x12\x61\n\x04List\x12*.myproject.fakeapp.ForeignModelListRequest\x1a+.myproject.fakeapp.ForeignModelListResponse\"\x00\x12\x81\x01\n\x08Retrieve\x12<.myproject.fakeapp.ForeignModelRetrieveCustomRetrieveRequest\x1a\x35.myproject.fakeapp.ForeignModelRetrieveCustomResponse\"\x00\x32\xa5\x01\n&ImportStructEvenInArrayModelController\x12{\n\x06\x43reate\x12\x36.myproject.fakeapp.ImportStructEvenInArrayModelRequest\x1a\x37.myproject.fakeapp.ImportStructEvenInArrayModelResponse\"\x00\x32\xa9\x05\n\x1cRecursiveTestModelController\x12g\n\x06\x43reate\x12,.myproject.fakeapp.RecursiveTestModelRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x12X\n\x07\x44\x65stroy\x12\x33.myproject.fakeapp.RecursiveTestModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12m\n\x04List\x12\x30.myproject.fakeapp.RecursiveTestModelListRequest\x1a\x31.myproject.fakeapp.RecursiveTestModelListResponse\"\x00\x12{\n\rPartialUpdate\x12\x39.myproject.fakeapp.RecursiveTestModelPartialUpdateRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x12q\n\x08Retrieve\x12\x34.myproject.fakeapp.RecursiveTestModelRetrieveRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x12g\n\x06Update\x12,.myproject.fakeapp.RecursiveTestModelRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x32\x9d\x05\n\x1bRelatedFieldModelController\x12\x65\n\x06\x43reate\x12+.myproject.fakeapp.RelatedFieldModelRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x12W\n\x07\x44\x65stroy\x12\x32.myproject.fakeapp.RelatedFieldModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12k\n\x04List\x12/.myproject.fakeapp.RelatedFieldModelListRequest\x1a\x30.myproject.fakeapp.RelatedFieldModelListResponse\"\x00\x12y\n\rPartialUpdate\x12\x38.myproject.fakeapp.RelatedFieldModelPartialUpdateRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x12o\n\x08Retrieve\x12\x33.myproject.fakeapp.RelatedFieldModelRetrieveRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x12\x65\n\x06Update\x12+.myproject.fakeapp.RelatedFieldModelRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x32\xc0\x05\n\x1cSpecialFieldsModelController\x12g\n\x06\x43reate\x12,.myproject.fakeapp.SpecialFieldsModelRequest\x1a-.myproject.fakeapp.SpecialFieldsModelResponse\"\x00\x12X\n\x07\x44\x65stroy\x12\x33.myproject.fakeapp.SpecialFieldsModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12m\n\x04List\x12\x30.myproject.fakeapp.SpecialFieldsModelListRequest\x1a\x31.myproject.fakeapp.SpecialFieldsModelListResponse\"\x00\x12{\n\rPartialUpdate\x12\x39.myproject.fakeapp.SpecialFieldsModelPartialUpdateRequest\x1a-.myproject.fakeapp.SpecialFieldsModelResponse\"\x00\x12\x87\x01\n\x08Retrieve\x12\x34.myproject.fakeapp.SpecialFieldsModelRetrieveRequest\x1a\x43.myproject.fakeapp.CustomRetrieveResponseSpecialFieldsModelResponse\"\x00\x12g\n\x06Update\x12,.myproject.fakeapp.SpecialFieldsModelRequest\x1a-.myproject.fakeapp.SpecialFieldsModelResponse\"\x00\x32\xfe\x01\n\x12StreamInController\x12k\n\x08StreamIn\x12*.myproject.fakeapp.StreamInStreamInRequest\x1a/.myproject.fakeapp.StreamInStreamInListResponse\"\x00(\x01\x12{\n\x0eStreamToStream\x12\x30.myproject.fakeapp.StreamInStreamToStreamRequest\x1a\x31.myproject.fakeapp.StreamInStreamToStreamResponse\"\x00(\x01\x30\x01\x32\xe5\x06\n\x1bSyncUnitTestModelController\x12]\n\x06\x43reate\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12S\n\x07\x44\x65stroy\x12..myproject.fakeapp.UnitTestModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x63\n\x04List\x12+.myproject.fakeapp.UnitTestModelListRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x12\x8a\x01\n\x11ListWithExtraArgs\x12<.myproject.fakeapp.SyncUnitTestModelListWithExtraArgsRequest\x1a\x35.myproject.fakeapp.UnitTestModelListExtraArgsResponse\"\x00\x12q\n\rPartialUpdate\x12\x34.myproject.fakeapp.UnitTestModelPartialUpdateRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12g\n\x08Retrieve\x12/.myproject.fakeapp.UnitTestModelRetrieveRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12\x65\n\x06Stream\x12-.myproject.fakeapp.UnitTestModelStreamRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x30\x01\x12]\n\x06Update\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x32\xdd\x06\n\x17UnitTestModelController\x12]\n\x06\x43reate\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12S\n\x07\x44\x65stroy\x12..myproject.fakeapp.UnitTestModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x63\n\x04List\x12+.myproject.fakeapp.UnitTestModelListRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x12\x86\x01\n\x11ListWithExtraArgs\x12\x38.myproject.fakeapp.UnitTestModelListWithExtraArgsRequest\x1a\x35.myproject.fakeapp.UnitTestModelListExtraArgsResponse\"\x00\x12q\n\rPartialUpdate\x12\x34.myproject.fakeapp.UnitTestModelPartialUpdateRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12g\n\x08Retrieve\x12/.myproject.fakeapp.UnitTestModelRetrieveRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12\x65\n\x06Stream\x12-.myproject.fakeapp.UnitTestModelStreamRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x30\x01\x12]\n\x06Update\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n2django_socio_grpc/tests/fakeapp/grpc/fakeapp.proto\x12\x11myproject.fakeapp\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1cgoogle/protobuf/struct.proto\"k\n\x1c\x42\x61seProtoExampleListResponse\x12<\n\x07results\x18\x01 \x03(\x0b\x32+.myproject.fakeapp.BaseProtoExampleResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"X\n\x17\x42\x61seProtoExampleRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1a\n\x12number_of_elements\x18\x02 \x01(\x05\x12\x13\n\x0bis_archived\x18\x03 \x01(\x08\"Y\n\x18\x42\x61seProtoExampleResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1a\n\x12number_of_elements\x18\x02 \x01(\x05\x12\x13\n\x0bis_archived\x18\x03 \x01(\x08\"1\n\x1c\x42\x61sicFetchDataForUserRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\"/\n\x1f\x42\x61sicFetchTranslatedKeyResponse\x12\x0c\n\x04text\x18\x01 \x01(\t\"#\n\x14\x42\x61sicListIdsResponse\x12\x0b\n\x03ids\x18\x01 \x03(\x05\"%\n\x15\x42\x61sicListNameResponse\x12\x0c\n\x04name\x18\x01 \x03(\t\"e\n\x19\x42\x61sicMixParamListResponse\x12\x39\n\x07results\x18\x01 \x03(\x0b\x32(.myproject.fakeapp.BasicMixParamResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"*\n\x15\x42\x61sicMixParamResponse\x12\x11\n\tuser_name\x18\x01 \x01(\t\"b\n\'BasicMixParamWithSerializerListResponse\x12(\n\x07results\x18\x01 \x03(\x0b\x32\x17.google.protobuf.Struct\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"j\n#BasicParamWithSerializerListRequest\x12\x43\n\x07results\x18\x01 \x03(\x0b\x32\x32.myproject.fakeapp.BasicParamWithSerializerRequest\"\xbd\x01\n\x1f\x42\x61sicParamWithSerializerRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12*\n\tuser_data\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x15\n\ruser_password\x18\x03 \x01(\t\x12\x15\n\rbytes_example\x18\x04 \x01(\x0c\x12-\n\x0clist_of_dict\x18\x05 \x03(\x0b\x32\x17.google.protobuf.Struct\"`\n\x1e\x42\x61sicProtoListChildListRequest\x12>\n\x07results\x18\x01 \x03(\x0b\x32-.myproject.fakeapp.BasicProtoListChildRequest\"q\n\x1f\x42\x61sicProtoListChildListResponse\x12?\n\x07results\x18\x01 \x03(\x0b\x32..myproject.fakeapp.BasicProtoListChildResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"S\n\x1a\x42\x61sicProtoListChildRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_text\"T\n\x1b\x42\x61sicProtoListChildResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_text\"c\n\x18\x42\x61sicServiceListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.myproject.fakeapp.BasicServiceResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xb1\x01\n\x13\x42\x61sicServiceRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12*\n\tuser_data\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x15\n\ruser_password\x18\x03 \x01(\t\x12\x15\n\rbytes_example\x18\x04 \x01(\x0c\x12-\n\x0clist_of_dict\x18\x05 \x03(\x0b\x32\x17.google.protobuf.Struct\"\x9b\x01\n\x14\x42\x61sicServiceResponse\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12*\n\tuser_data\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x15\n\rbytes_example\x18\x03 \x01(\x0c\x12-\n\x0clist_of_dict\x18\x04 \x03(\x0b\x32\x17.google.protobuf.Struct\"\\\n\x1c\x43ustomMixParamForListRequest\x12<\n\x07results\x18\x01 \x03(\x0b\x32+.myproject.fakeapp.CustomMixParamForRequest\"-\n\x18\x43ustomMixParamForRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\")\n\x14\x43ustomNameForRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\"*\n\x15\x43ustomNameForResponse\x12\x11\n\tuser_name\x18\x01 \x01(\t\"\x94\x01\n0CustomRetrieveResponseSpecialFieldsModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1c\n\x14\x64\x65\x66\x61ult_method_field\x18\x02 \x01(\x05\x12\x34\n\x13\x63ustom_method_field\x18\x03 \x03(\x0b\x32\x17.google.protobuf.Struct\"3\n%ExceptionStreamRaiseExceptionResponse\x12\n\n\x02id\x18\x01 \x01(\t\"\x19\n\x17\x46oreignModelListRequest\"c\n\x18\x46oreignModelListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.myproject.fakeapp.ForeignModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"2\n\x14\x46oreignModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"B\n\"ForeignModelRetrieveCustomResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06\x63ustom\x18\x02 \x01(\t\"9\n)ForeignModelRetrieveCustomRetrieveRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"c\n#ImportStructEvenInArrayModelRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12.\n\rthis_is_crazy\x18\x02 \x03(\x0b\x32\x17.google.protobuf.Struct\"d\n$ImportStructEvenInArrayModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12.\n\rthis_is_crazy\x18\x02 \x03(\x0b\x32\x17.google.protobuf.Struct\"U\n\x14ManyManyModelRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12!\n\x19test_write_only_on_nested\x18\x03 \x01(\t\"3\n\x15ManyManyModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"0\n RecursiveTestModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"\x1f\n\x1dRecursiveTestModelListRequest\"o\n\x1eRecursiveTestModelListResponse\x12>\n\x07results\x18\x01 \x03(\x0b\x32-.myproject.fakeapp.RecursiveTestModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xd4\x01\n&RecursiveTestModelPartialUpdateRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12<\n\x06parent\x18\x03 \x01(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequest\x12>\n\x08\x63hildren\x18\x04 \x03(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequest\"\xa7\x01\n\x19RecursiveTestModelRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12<\n\x06parent\x18\x02 \x01(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequest\x12>\n\x08\x63hildren\x18\x03 \x03(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequest\"\xaa\x01\n\x1aRecursiveTestModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12=\n\x06parent\x18\x02 \x01(\x0b\x32-.myproject.fakeapp.RecursiveTestModelResponse\x12?\n\x08\x63hildren\x18\x03 \x03(\x0b\x32-.myproject.fakeapp.RecursiveTestModelResponse\"1\n!RecursiveTestModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"/\n\x1fRelatedFieldModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"\x1e\n\x1cRelatedFieldModelListRequest\"|\n\x1dRelatedFieldModelListResponse\x12L\n\x16list_custom_field_name\x18\x01 \x03(\x0b\x32,.myproject.fakeapp.RelatedFieldModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xc8\x01\n%RelatedFieldModelPartialUpdateRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12:\n\tmany_many\x18\x02 \x03(\x0b\x32\'.myproject.fakeapp.ManyManyModelRequest\x12\x19\n\x11\x63ustom_field_name\x18\x03 \x01(\t\x12\x1e\n\x16_partial_update_fields\x18\x04 \x03(\t\x12\x1a\n\x12many_many_foreigns\x18\x05 \x03(\t\"\x9b\x01\n\x18RelatedFieldModelRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12:\n\tmany_many\x18\x02 \x03(\x0b\x32\'.myproject.fakeapp.ManyManyModelRequest\x12\x19\n\x11\x63ustom_field_name\x18\x03 \x01(\t\x12\x1a\n\x12many_many_foreigns\x18\x04 \x03(\t\"\xcb\x02\n\x19RelatedFieldModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x38\n\x07\x66oreign\x18\x02 \x01(\x0b\x32\'.myproject.fakeapp.ForeignModelResponse\x12;\n\tmany_many\x18\x03 \x03(\x0b\x32(.myproject.fakeapp.ManyManyModelResponse\x12\x17\n\x0fslug_test_model\x18\x04 \x01(\x05\x12\x1f\n\x17slug_reverse_test_model\x18\x05 \x03(\x08\x12\x16\n\x0eslug_many_many\x18\x06 \x03(\t\x12 \n\x18proto_slug_related_field\x18\x07 \x01(\t\x12\x19\n\x11\x63ustom_field_name\x18\x08 \x01(\t\x12\x1a\n\x12many_many_foreigns\x18\t \x03(\t\"0\n RelatedFieldModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"0\n SpecialFieldsModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"\x1f\n\x1dSpecialFieldsModelListRequest\"o\n\x1eSpecialFieldsModelListResponse\x12>\n\x07results\x18\x01 \x03(\x0b\x32-.myproject.fakeapp.SpecialFieldsModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\x97\x01\n&SpecialFieldsModelPartialUpdateRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12+\n\nmeta_datas\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x12\n\nlist_datas\x18\x04 \x03(\x05\"j\n\x19SpecialFieldsModelRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12+\n\nmeta_datas\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x12\n\nlist_datas\x18\x03 \x03(\x05\"{\n\x1aSpecialFieldsModelResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12+\n\nmeta_datas\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x12\n\nlist_datas\x18\x03 \x03(\x05\x12\x0e\n\x06\x62inary\x18\x04 \x01(\x0c\"1\n!SpecialFieldsModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"k\n\x1cStreamInStreamInListResponse\x12<\n\x07results\x18\x01 \x03(\x0b\x32+.myproject.fakeapp.StreamInStreamInResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\'\n\x17StreamInStreamInRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\")\n\x18StreamInStreamInResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\"-\n\x1dStreamInStreamToStreamRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\".\n\x1eStreamInStreamToStreamResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\"=\n)SyncUnitTestModelListWithExtraArgsRequest\x12\x10\n\x08\x61rchived\x18\x01 \x01(\x08\"h\n\"UnitTestModelBulkCreateListRequest\x12\x42\n\x07results\x18\x01 \x03(\x0b\x32\x31.myproject.fakeapp.UnitTestModelBulkCreateRequest\"W\n\x1eUnitTestModelBulkCreateRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_text\"j\n#UnitTestModelBulkDestroyListRequest\x12\x43\n\x07results\x18\x01 \x03(\x0b\x32\x32.myproject.fakeapp.UnitTestModelBulkDestroyRequest\"-\n\x1fUnitTestModelBulkDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"h\n\"UnitTestModelBulkUpdateListRequest\x12\x42\n\x07results\x18\x01 \x03(\x0b\x32\x31.myproject.fakeapp.UnitTestModelBulkUpdateRequest\"W\n\x1eUnitTestModelBulkUpdateRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_text\")\n\x1bUnitTestModelDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\x8e\x01\n\"UnitTestModelListExtraArgsResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\x1e\n\x16query_fetched_datetime\x18\x02 \x01(\t\x12\x39\n\x07results\x18\x03 \x03(\x0b\x32(.myproject.fakeapp.UnitTestModelResponse\"\x1a\n\x18UnitTestModelListRequest\"e\n\x19UnitTestModelListResponse\x12\x39\n\x07results\x18\x01 \x03(\x0b\x32(.myproject.fakeapp.UnitTestModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"9\n%UnitTestModelListWithExtraArgsRequest\x12\x10\n\x08\x61rchived\x18\x01 \x01(\x08\"z\n!UnitTestModelPartialUpdateRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x04 \x03(\tB\x07\n\x05_text\"M\n\x14UnitTestModelRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_text\"N\n\x15UnitTestModelResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x11\n\x04text\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\r\n\x05title\x18\x03 \x01(\tB\x07\n\x05_text\"*\n\x1cUnitTestModelRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"G\n!UnitTestModelStreamCreateResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\x13\n\x0b\x62\x61tch_count\x18\x02 \x01(\x05\"\x1c\n\x1aUnitTestModelStreamRequest\"H\n!UnitTestModelStreamUpsertResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\x14\n\x0cupsert_count\x18\x02 \x01(\x05\x32\xca\t\n\x0f\x42\x61sicController\x12t\n\tBasicList\x12\x31.myproject.fakeapp.BasicProtoListChildListRequest\x1a\x32.myproject.fakeapp.BasicProtoListChildListResponse\"\x00\x12[\n\x06\x43reate\x12&.myproject.fakeapp.BasicServiceRequest\x1a\'.myproject.fakeapp.BasicServiceResponse\"\x00\x12n\n\x10\x46\x65tchDataForUser\x12/.myproject.fakeapp.BasicFetchDataForUserRequest\x1a\'.myproject.fakeapp.BasicServiceResponse\"\x00\x12\x62\n\x12\x46\x65tchTranslatedKey\x12\x16.google.protobuf.Empty\x1a\x32.myproject.fakeapp.BasicFetchTranslatedKeyResponse\"\x00\x12T\n\x0bGetMultiple\x12\x16.google.protobuf.Empty\x1a+.myproject.fakeapp.BasicServiceListResponse\"\x00\x12L\n\x07ListIds\x12\x16.google.protobuf.Empty\x1a\'.myproject.fakeapp.BasicListIdsResponse\"\x00\x12N\n\x08ListName\x12\x16.google.protobuf.Empty\x1a(.myproject.fakeapp.BasicListNameResponse\"\x00\x12k\n\x08MixParam\x12/.myproject.fakeapp.CustomMixParamForListRequest\x1a,.myproject.fakeapp.BasicMixParamListResponse\"\x00\x12\x8e\x01\n\x16MixParamWithSerializer\x12\x36.myproject.fakeapp.BasicParamWithSerializerListRequest\x1a:.myproject.fakeapp.BasicMixParamWithSerializerListResponse\"\x00\x12_\n\x08MyMethod\x12\'.myproject.fakeapp.CustomNameForRequest\x1a(.myproject.fakeapp.CustomNameForResponse\"\x00\x12x\n\x17TestBaseProtoSerializer\x12*.myproject.fakeapp.BaseProtoExampleRequest\x1a/.myproject.fakeapp.BaseProtoExampleListResponse\"\x00\x12\x43\n\x0fTestEmptyMethod\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x32\xd1\x02\n\x13\x45xceptionController\x12@\n\x0c\x41PIException\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12\x41\n\rGRPCException\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12l\n\x14StreamRaiseException\x12\x16.google.protobuf.Empty\x1a\x38.myproject.fakeapp.ExceptionStreamRaiseExceptionResponse\"\x00\x30\x01\x12G\n\x13UnaryRaiseException\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x32\xff\x01\n\x16\x46oreignModelController\x12\x61\n\x04List\x12*.myproject.fakeapp.ForeignModelListRequest\x1a+.myproject.fakeapp.ForeignModelListResponse\"\x00\x12\x81\x01\n\x08Retrieve\x12<.myproject.fakeapp.ForeignModelRetrieveCustomRetrieveRequest\x1a\x35.myproject.fakeapp.ForeignModelRetrieveCustomResponse\"\x00\x32\xa5\x01\n&ImportStructEvenInArrayModelController\x12{\n\x06\x43reate\x12\x36.myproject.fakeapp.ImportStructEvenInArrayModelRequest\x1a\x37.myproject.fakeapp.ImportStructEvenInArrayModelResponse\"\x00\x32\xa9\x05\n\x1cRecursiveTestModelController\x12g\n\x06\x43reate\x12,.myproject.fakeapp.RecursiveTestModelRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x12X\n\x07\x44\x65stroy\x12\x33.myproject.fakeapp.RecursiveTestModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12m\n\x04List\x12\x30.myproject.fakeapp.RecursiveTestModelListRequest\x1a\x31.myproject.fakeapp.RecursiveTestModelListResponse\"\x00\x12{\n\rPartialUpdate\x12\x39.myproject.fakeapp.RecursiveTestModelPartialUpdateRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x12q\n\x08Retrieve\x12\x34.myproject.fakeapp.RecursiveTestModelRetrieveRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x12g\n\x06Update\x12,.myproject.fakeapp.RecursiveTestModelRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x32\x9d\x05\n\x1bRelatedFieldModelController\x12\x65\n\x06\x43reate\x12+.myproject.fakeapp.RelatedFieldModelRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x12W\n\x07\x44\x65stroy\x12\x32.myproject.fakeapp.RelatedFieldModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12k\n\x04List\x12/.myproject.fakeapp.RelatedFieldModelListRequest\x1a\x30.myproject.fakeapp.RelatedFieldModelListResponse\"\x00\x12y\n\rPartialUpdate\x12\x38.myproject.fakeapp.RelatedFieldModelPartialUpdateRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x12o\n\x08Retrieve\x12\x33.myproject.fakeapp.RelatedFieldModelRetrieveRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x12\x65\n\x06Update\x12+.myproject.fakeapp.RelatedFieldModelRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x32\xc0\x05\n\x1cSpecialFieldsModelController\x12g\n\x06\x43reate\x12,.myproject.fakeapp.SpecialFieldsModelRequest\x1a-.myproject.fakeapp.SpecialFieldsModelResponse\"\x00\x12X\n\x07\x44\x65stroy\x12\x33.myproject.fakeapp.SpecialFieldsModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12m\n\x04List\x12\x30.myproject.fakeapp.SpecialFieldsModelListRequest\x1a\x31.myproject.fakeapp.SpecialFieldsModelListResponse\"\x00\x12{\n\rPartialUpdate\x12\x39.myproject.fakeapp.SpecialFieldsModelPartialUpdateRequest\x1a-.myproject.fakeapp.SpecialFieldsModelResponse\"\x00\x12\x87\x01\n\x08Retrieve\x12\x34.myproject.fakeapp.SpecialFieldsModelRetrieveRequest\x1a\x43.myproject.fakeapp.CustomRetrieveResponseSpecialFieldsModelResponse\"\x00\x12g\n\x06Update\x12,.myproject.fakeapp.SpecialFieldsModelRequest\x1a-.myproject.fakeapp.SpecialFieldsModelResponse\"\x00\x32\xfe\x01\n\x12StreamInController\x12k\n\x08StreamIn\x12*.myproject.fakeapp.StreamInStreamInRequest\x1a/.myproject.fakeapp.StreamInStreamInListResponse\"\x00(\x01\x12{\n\x0eStreamToStream\x12\x30.myproject.fakeapp.StreamInStreamToStreamRequest\x1a\x31.myproject.fakeapp.StreamInStreamToStreamResponse\"\x00(\x01\x30\x01\x32\x98\x0b\n\x1bSyncUnitTestModelController\x12s\n\nBulkCreate\x12\x35.myproject.fakeapp.UnitTestModelBulkCreateListRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x12_\n\x0b\x42ulkDestroy\x12\x36.myproject.fakeapp.UnitTestModelBulkDestroyListRequest\x1a\x16.google.protobuf.Empty\"\x00\x12s\n\nBulkUpdate\x12\x35.myproject.fakeapp.UnitTestModelBulkUpdateListRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x12]\n\x06\x43reate\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12S\n\x07\x44\x65stroy\x12..myproject.fakeapp.UnitTestModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x63\n\x04List\x12+.myproject.fakeapp.UnitTestModelListRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x12\x8a\x01\n\x11ListWithExtraArgs\x12<.myproject.fakeapp.SyncUnitTestModelListWithExtraArgsRequest\x1a\x35.myproject.fakeapp.UnitTestModelListExtraArgsResponse\"\x00\x12q\n\rPartialUpdate\x12\x34.myproject.fakeapp.UnitTestModelPartialUpdateRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12g\n\x08Retrieve\x12/.myproject.fakeapp.UnitTestModelRetrieveRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12\x65\n\x06Stream\x12-.myproject.fakeapp.UnitTestModelStreamRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x30\x01\x12q\n\x0cStreamCreate\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a\x34.myproject.fakeapp.UnitTestModelStreamCreateResponse\"\x00(\x01\x12s\n\x0cStreamUpsert\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a\x34.myproject.fakeapp.UnitTestModelStreamUpsertResponse\"\x00(\x01\x30\x01\x12]\n\x06Update\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x32\x90\x0b\n\x17UnitTestModelController\x12s\n\nBulkCreate\x12\x35.myproject.fakeapp.UnitTestModelBulkCreateListRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x12_\n\x0b\x42ulkDestroy\x12\x36.myproject.fakeapp.UnitTestModelBulkDestroyListRequest\x1a\x16.google.protobuf.Empty\"\x00\x12s\n\nBulkUpdate\x12\x35.myproject.fakeapp.UnitTestModelBulkUpdateListRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x12]\n\x06\x43reate\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12S\n\x07\x44\x65stroy\x12..myproject.fakeapp.UnitTestModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x63\n\x04List\x12+.myproject.fakeapp.UnitTestModelListRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x12\x86\x01\n\x11ListWithExtraArgs\x12\x38.myproject.fakeapp.UnitTestModelListWithExtraArgsRequest\x1a\x35.myproject.fakeapp.UnitTestModelListExtraArgsResponse\"\x00\x12q\n\rPartialUpdate\x12\x34.myproject.fakeapp.UnitTestModelPartialUpdateRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12g\n\x08Retrieve\x12/.myproject.fakeapp.UnitTestModelRetrieveRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12\x65\n\x06Stream\x12-.myproject.fakeapp.UnitTestModelStreamRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x30\x01\x12q\n\x0cStreamCreate\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a\x34.myproject.fakeapp.UnitTestModelStreamCreateResponse\"\x00(\x01\x12s\n\x0cStreamUpsert\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a\x34.myproject.fakeapp.UnitTestModelStreamUpsertResponse\"\x00(\x01\x30\x01\x12]\n\x06Update\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -43,145 +43,161 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['_BASICMIXPARAMWITHSERIALIZERLISTRESPONSE']._serialized_start=745
   _globals['_BASICMIXPARAMWITHSERIALIZERLISTRESPONSE']._serialized_end=843
   _globals['_BASICPARAMWITHSERIALIZERLISTREQUEST']._serialized_start=845
-  _globals['_BASICPARAMWITHSERIALIZERLISTREQUEST']._serialized_end=966
-  _globals['_BASICPARAMWITHSERIALIZERREQUEST']._serialized_start=969
-  _globals['_BASICPARAMWITHSERIALIZERREQUEST']._serialized_end=1158
-  _globals['_BASICPROTOLISTCHILDLISTREQUEST']._serialized_start=1160
-  _globals['_BASICPROTOLISTCHILDLISTREQUEST']._serialized_end=1271
-  _globals['_BASICPROTOLISTCHILDLISTRESPONSE']._serialized_start=1273
-  _globals['_BASICPROTOLISTCHILDLISTRESPONSE']._serialized_end=1386
-  _globals['_BASICPROTOLISTCHILDREQUEST']._serialized_start=1388
-  _globals['_BASICPROTOLISTCHILDREQUEST']._serialized_end=1471
-  _globals['_BASICPROTOLISTCHILDRESPONSE']._serialized_start=1473
-  _globals['_BASICPROTOLISTCHILDRESPONSE']._serialized_end=1557
-  _globals['_BASICSERVICELISTRESPONSE']._serialized_start=1559
-  _globals['_BASICSERVICELISTRESPONSE']._serialized_end=1658
-  _globals['_BASICSERVICEREQUEST']._serialized_start=1661
-  _globals['_BASICSERVICEREQUEST']._serialized_end=1838
-  _globals['_BASICSERVICERESPONSE']._serialized_start=1841
-  _globals['_BASICSERVICERESPONSE']._serialized_end=1996
-  _globals['_CUSTOMMIXPARAMFORLISTREQUEST']._serialized_start=1998
-  _globals['_CUSTOMMIXPARAMFORLISTREQUEST']._serialized_end=2105
-  _globals['_CUSTOMMIXPARAMFORREQUEST']._serialized_start=2107
-  _globals['_CUSTOMMIXPARAMFORREQUEST']._serialized_end=2152
-  _globals['_CUSTOMNAMEFORREQUEST']._serialized_start=2154
-  _globals['_CUSTOMNAMEFORREQUEST']._serialized_end=2195
-  _globals['_CUSTOMNAMEFORRESPONSE']._serialized_start=2197
-  _globals['_CUSTOMNAMEFORRESPONSE']._serialized_end=2239
-  _globals['_CUSTOMRETRIEVERESPONSESPECIALFIELDSMODELRESPONSE']._serialized_start=2242
-  _globals['_CUSTOMRETRIEVERESPONSESPECIALFIELDSMODELRESPONSE']._serialized_end=2390
-  _globals['_EXCEPTIONSTREAMRAISEEXCEPTIONRESPONSE']._serialized_start=2392
-  _globals['_EXCEPTIONSTREAMRAISEEXCEPTIONRESPONSE']._serialized_end=2443
-  _globals['_FOREIGNMODELLISTREQUEST']._serialized_start=2445
-  _globals['_FOREIGNMODELLISTREQUEST']._serialized_end=2470
-  _globals['_FOREIGNMODELLISTRESPONSE']._serialized_start=2472
-  _globals['_FOREIGNMODELLISTRESPONSE']._serialized_end=2571
-  _globals['_FOREIGNMODELRESPONSE']._serialized_start=2573
-  _globals['_FOREIGNMODELRESPONSE']._serialized_end=2623
-  _globals['_FOREIGNMODELRETRIEVECUSTOMRESPONSE']._serialized_start=2625
-  _globals['_FOREIGNMODELRETRIEVECUSTOMRESPONSE']._serialized_end=2691
-  _globals['_FOREIGNMODELRETRIEVECUSTOMRETRIEVEREQUEST']._serialized_start=2693
-  _globals['_FOREIGNMODELRETRIEVECUSTOMRETRIEVEREQUEST']._serialized_end=2750
-  _globals['_IMPORTSTRUCTEVENINARRAYMODELREQUEST']._serialized_start=2752
-  _globals['_IMPORTSTRUCTEVENINARRAYMODELREQUEST']._serialized_end=2851
-  _globals['_IMPORTSTRUCTEVENINARRAYMODELRESPONSE']._serialized_start=2853
-  _globals['_IMPORTSTRUCTEVENINARRAYMODELRESPONSE']._serialized_end=2953
-  _globals['_MANYMANYMODELREQUEST']._serialized_start=2955
-  _globals['_MANYMANYMODELREQUEST']._serialized_end=3040
-  _globals['_MANYMANYMODELRESPONSE']._serialized_start=3042
-  _globals['_MANYMANYMODELRESPONSE']._serialized_end=3093
-  _globals['_RECURSIVETESTMODELDESTROYREQUEST']._serialized_start=3095
-  _globals['_RECURSIVETESTMODELDESTROYREQUEST']._serialized_end=3143
-  _globals['_RECURSIVETESTMODELLISTREQUEST']._serialized_start=3145
-  _globals['_RECURSIVETESTMODELLISTREQUEST']._serialized_end=3176
-  _globals['_RECURSIVETESTMODELLISTRESPONSE']._serialized_start=3178
-  _globals['_RECURSIVETESTMODELLISTRESPONSE']._serialized_end=3289
-  _globals['_RECURSIVETESTMODELPARTIALUPDATEREQUEST']._serialized_start=3292
-  _globals['_RECURSIVETESTMODELPARTIALUPDATEREQUEST']._serialized_end=3504
-  _globals['_RECURSIVETESTMODELREQUEST']._serialized_start=3507
-  _globals['_RECURSIVETESTMODELREQUEST']._serialized_end=3674
-  _globals['_RECURSIVETESTMODELRESPONSE']._serialized_start=3677
-  _globals['_RECURSIVETESTMODELRESPONSE']._serialized_end=3847
-  _globals['_RECURSIVETESTMODELRETRIEVEREQUEST']._serialized_start=3849
-  _globals['_RECURSIVETESTMODELRETRIEVEREQUEST']._serialized_end=3898
-  _globals['_RELATEDFIELDMODELDESTROYREQUEST']._serialized_start=3900
-  _globals['_RELATEDFIELDMODELDESTROYREQUEST']._serialized_end=3947
-  _globals['_RELATEDFIELDMODELLISTREQUEST']._serialized_start=3949
-  _globals['_RELATEDFIELDMODELLISTREQUEST']._serialized_end=3979
-  _globals['_RELATEDFIELDMODELLISTRESPONSE']._serialized_start=3981
-  _globals['_RELATEDFIELDMODELLISTRESPONSE']._serialized_end=4105
-  _globals['_RELATEDFIELDMODELPARTIALUPDATEREQUEST']._serialized_start=4108
-  _globals['_RELATEDFIELDMODELPARTIALUPDATEREQUEST']._serialized_end=4308
-  _globals['_RELATEDFIELDMODELREQUEST']._serialized_start=4311
-  _globals['_RELATEDFIELDMODELREQUEST']._serialized_end=4466
-  _globals['_RELATEDFIELDMODELRESPONSE']._serialized_start=4469
-  _globals['_RELATEDFIELDMODELRESPONSE']._serialized_end=4800
-  _globals['_RELATEDFIELDMODELRETRIEVEREQUEST']._serialized_start=4802
-  _globals['_RELATEDFIELDMODELRETRIEVEREQUEST']._serialized_end=4850
-  _globals['_SPECIALFIELDSMODELDESTROYREQUEST']._serialized_start=4852
-  _globals['_SPECIALFIELDSMODELDESTROYREQUEST']._serialized_end=4900
-  _globals['_SPECIALFIELDSMODELLISTREQUEST']._serialized_start=4902
-  _globals['_SPECIALFIELDSMODELLISTREQUEST']._serialized_end=4933
-  _globals['_SPECIALFIELDSMODELLISTRESPONSE']._serialized_start=4935
-  _globals['_SPECIALFIELDSMODELLISTRESPONSE']._serialized_end=5046
-  _globals['_SPECIALFIELDSMODELPARTIALUPDATEREQUEST']._serialized_start=5049
-  _globals['_SPECIALFIELDSMODELPARTIALUPDATEREQUEST']._serialized_end=5200
-  _globals['_SPECIALFIELDSMODELREQUEST']._serialized_start=5202
-  _globals['_SPECIALFIELDSMODELREQUEST']._serialized_end=5308
-  _globals['_SPECIALFIELDSMODELRESPONSE']._serialized_start=5310
-  _globals['_SPECIALFIELDSMODELRESPONSE']._serialized_end=5433
-  _globals['_SPECIALFIELDSMODELRETRIEVEREQUEST']._serialized_start=5435
-  _globals['_SPECIALFIELDSMODELRETRIEVEREQUEST']._serialized_end=5484
-  _globals['_STREAMINSTREAMINLISTRESPONSE']._serialized_start=5486
-  _globals['_STREAMINSTREAMINLISTRESPONSE']._serialized_end=5593
-  _globals['_STREAMINSTREAMINREQUEST']._serialized_start=5595
-  _globals['_STREAMINSTREAMINREQUEST']._serialized_end=5634
-  _globals['_STREAMINSTREAMINRESPONSE']._serialized_start=5636
-  _globals['_STREAMINSTREAMINRESPONSE']._serialized_end=5677
-  _globals['_STREAMINSTREAMTOSTREAMREQUEST']._serialized_start=5679
-  _globals['_STREAMINSTREAMTOSTREAMREQUEST']._serialized_end=5724
-  _globals['_STREAMINSTREAMTOSTREAMRESPONSE']._serialized_start=5726
-  _globals['_STREAMINSTREAMTOSTREAMRESPONSE']._serialized_end=5772
-  _globals['_SYNCUNITTESTMODELLISTWITHEXTRAARGSREQUEST']._serialized_start=5774
-  _globals['_SYNCUNITTESTMODELLISTWITHEXTRAARGSREQUEST']._serialized_end=5835
-  _globals['_UNITTESTMODELDESTROYREQUEST']._serialized_start=5837
-  _globals['_UNITTESTMODELDESTROYREQUEST']._serialized_end=5878
-  _globals['_UNITTESTMODELLISTEXTRAARGSRESPONSE']._serialized_start=5881
-  _globals['_UNITTESTMODELLISTEXTRAARGSRESPONSE']._serialized_end=6023
-  _globals['_UNITTESTMODELLISTREQUEST']._serialized_start=6025
-  _globals['_UNITTESTMODELLISTREQUEST']._serialized_end=6051
-  _globals['_UNITTESTMODELLISTRESPONSE']._serialized_start=6053
-  _globals['_UNITTESTMODELLISTRESPONSE']._serialized_end=6154
-  _globals['_UNITTESTMODELLISTWITHEXTRAARGSREQUEST']._serialized_start=6156
-  _globals['_UNITTESTMODELLISTWITHEXTRAARGSREQUEST']._serialized_end=6213
-  _globals['_UNITTESTMODELPARTIALUPDATEREQUEST']._serialized_start=6215
-  _globals['_UNITTESTMODELPARTIALUPDATEREQUEST']._serialized_end=6337
-  _globals['_UNITTESTMODELREQUEST']._serialized_start=6339
-  _globals['_UNITTESTMODELREQUEST']._serialized_end=6416
-  _globals['_UNITTESTMODELRESPONSE']._serialized_start=6418
-  _globals['_UNITTESTMODELRESPONSE']._serialized_end=6496
-  _globals['_UNITTESTMODELRETRIEVEREQUEST']._serialized_start=6498
-  _globals['_UNITTESTMODELRETRIEVEREQUEST']._serialized_end=6540
-  _globals['_UNITTESTMODELSTREAMREQUEST']._serialized_start=6542
-  _globals['_UNITTESTMODELSTREAMREQUEST']._serialized_end=6570
-  _globals['_BASICCONTROLLER']._serialized_start=6573
-  _globals['_BASICCONTROLLER']._serialized_end=7799
-  _globals['_EXCEPTIONCONTROLLER']._serialized_start=7802
-  _globals['_EXCEPTIONCONTROLLER']._serialized_end=8139
-  _globals['_FOREIGNMODELCONTROLLER']._serialized_start=8142
-  _globals['_FOREIGNMODELCONTROLLER']._serialized_end=8397
-  _globals['_IMPORTSTRUCTEVENINARRAYMODELCONTROLLER']._serialized_start=8400
-  _globals['_IMPORTSTRUCTEVENINARRAYMODELCONTROLLER']._serialized_end=8565
-  _globals['_RECURSIVETESTMODELCONTROLLER']._serialized_start=8568
-  _globals['_RECURSIVETESTMODELCONTROLLER']._serialized_end=9249
-  _globals['_RELATEDFIELDMODELCONTROLLER']._serialized_start=9252
-  _globals['_RELATEDFIELDMODELCONTROLLER']._serialized_end=9921
-  _globals['_SPECIALFIELDSMODELCONTROLLER']._serialized_start=9924
-  _globals['_SPECIALFIELDSMODELCONTROLLER']._serialized_end=10628
-  _globals['_STREAMINCONTROLLER']._serialized_start=10631
-  _globals['_STREAMINCONTROLLER']._serialized_end=10885
-  _globals['_SYNCUNITTESTMODELCONTROLLER']._serialized_start=10888
-  _globals['_SYNCUNITTESTMODELCONTROLLER']._serialized_end=11757
-  _globals['_UNITTESTMODELCONTROLLER']._serialized_start=11760
-  _globals['_UNITTESTMODELCONTROLLER']._serialized_end=12621
+  _globals['_BASICPARAMWITHSERIALIZERLISTREQUEST']._serialized_end=951
+  _globals['_BASICPARAMWITHSERIALIZERREQUEST']._serialized_start=954
+  _globals['_BASICPARAMWITHSERIALIZERREQUEST']._serialized_end=1143
+  _globals['_BASICPROTOLISTCHILDLISTREQUEST']._serialized_start=1145
+  _globals['_BASICPROTOLISTCHILDLISTREQUEST']._serialized_end=1241
+  _globals['_BASICPROTOLISTCHILDLISTRESPONSE']._serialized_start=1243
+  _globals['_BASICPROTOLISTCHILDLISTRESPONSE']._serialized_end=1356
+  _globals['_BASICPROTOLISTCHILDREQUEST']._serialized_start=1358
+  _globals['_BASICPROTOLISTCHILDREQUEST']._serialized_end=1441
+  _globals['_BASICPROTOLISTCHILDRESPONSE']._serialized_start=1443
+  _globals['_BASICPROTOLISTCHILDRESPONSE']._serialized_end=1527
+  _globals['_BASICSERVICELISTRESPONSE']._serialized_start=1529
+  _globals['_BASICSERVICELISTRESPONSE']._serialized_end=1628
+  _globals['_BASICSERVICEREQUEST']._serialized_start=1631
+  _globals['_BASICSERVICEREQUEST']._serialized_end=1808
+  _globals['_BASICSERVICERESPONSE']._serialized_start=1811
+  _globals['_BASICSERVICERESPONSE']._serialized_end=1966
+  _globals['_CUSTOMMIXPARAMFORLISTREQUEST']._serialized_start=1968
+  _globals['_CUSTOMMIXPARAMFORLISTREQUEST']._serialized_end=2060
+  _globals['_CUSTOMMIXPARAMFORREQUEST']._serialized_start=2062
+  _globals['_CUSTOMMIXPARAMFORREQUEST']._serialized_end=2107
+  _globals['_CUSTOMNAMEFORREQUEST']._serialized_start=2109
+  _globals['_CUSTOMNAMEFORREQUEST']._serialized_end=2150
+  _globals['_CUSTOMNAMEFORRESPONSE']._serialized_start=2152
+  _globals['_CUSTOMNAMEFORRESPONSE']._serialized_end=2194
+  _globals['_CUSTOMRETRIEVERESPONSESPECIALFIELDSMODELRESPONSE']._serialized_start=2197
+  _globals['_CUSTOMRETRIEVERESPONSESPECIALFIELDSMODELRESPONSE']._serialized_end=2345
+  _globals['_EXCEPTIONSTREAMRAISEEXCEPTIONRESPONSE']._serialized_start=2347
+  _globals['_EXCEPTIONSTREAMRAISEEXCEPTIONRESPONSE']._serialized_end=2398
+  _globals['_FOREIGNMODELLISTREQUEST']._serialized_start=2400
+  _globals['_FOREIGNMODELLISTREQUEST']._serialized_end=2425
+  _globals['_FOREIGNMODELLISTRESPONSE']._serialized_start=2427
+  _globals['_FOREIGNMODELLISTRESPONSE']._serialized_end=2526
+  _globals['_FOREIGNMODELRESPONSE']._serialized_start=2528
+  _globals['_FOREIGNMODELRESPONSE']._serialized_end=2578
+  _globals['_FOREIGNMODELRETRIEVECUSTOMRESPONSE']._serialized_start=2580
+  _globals['_FOREIGNMODELRETRIEVECUSTOMRESPONSE']._serialized_end=2646
+  _globals['_FOREIGNMODELRETRIEVECUSTOMRETRIEVEREQUEST']._serialized_start=2648
+  _globals['_FOREIGNMODELRETRIEVECUSTOMRETRIEVEREQUEST']._serialized_end=2705
+  _globals['_IMPORTSTRUCTEVENINARRAYMODELREQUEST']._serialized_start=2707
+  _globals['_IMPORTSTRUCTEVENINARRAYMODELREQUEST']._serialized_end=2806
+  _globals['_IMPORTSTRUCTEVENINARRAYMODELRESPONSE']._serialized_start=2808
+  _globals['_IMPORTSTRUCTEVENINARRAYMODELRESPONSE']._serialized_end=2908
+  _globals['_MANYMANYMODELREQUEST']._serialized_start=2910
+  _globals['_MANYMANYMODELREQUEST']._serialized_end=2995
+  _globals['_MANYMANYMODELRESPONSE']._serialized_start=2997
+  _globals['_MANYMANYMODELRESPONSE']._serialized_end=3048
+  _globals['_RECURSIVETESTMODELDESTROYREQUEST']._serialized_start=3050
+  _globals['_RECURSIVETESTMODELDESTROYREQUEST']._serialized_end=3098
+  _globals['_RECURSIVETESTMODELLISTREQUEST']._serialized_start=3100
+  _globals['_RECURSIVETESTMODELLISTREQUEST']._serialized_end=3131
+  _globals['_RECURSIVETESTMODELLISTRESPONSE']._serialized_start=3133
+  _globals['_RECURSIVETESTMODELLISTRESPONSE']._serialized_end=3244
+  _globals['_RECURSIVETESTMODELPARTIALUPDATEREQUEST']._serialized_start=3247
+  _globals['_RECURSIVETESTMODELPARTIALUPDATEREQUEST']._serialized_end=3459
+  _globals['_RECURSIVETESTMODELREQUEST']._serialized_start=3462
+  _globals['_RECURSIVETESTMODELREQUEST']._serialized_end=3629
+  _globals['_RECURSIVETESTMODELRESPONSE']._serialized_start=3632
+  _globals['_RECURSIVETESTMODELRESPONSE']._serialized_end=3802
+  _globals['_RECURSIVETESTMODELRETRIEVEREQUEST']._serialized_start=3804
+  _globals['_RECURSIVETESTMODELRETRIEVEREQUEST']._serialized_end=3853
+  _globals['_RELATEDFIELDMODELDESTROYREQUEST']._serialized_start=3855
+  _globals['_RELATEDFIELDMODELDESTROYREQUEST']._serialized_end=3902
+  _globals['_RELATEDFIELDMODELLISTREQUEST']._serialized_start=3904
+  _globals['_RELATEDFIELDMODELLISTREQUEST']._serialized_end=3934
+  _globals['_RELATEDFIELDMODELLISTRESPONSE']._serialized_start=3936
+  _globals['_RELATEDFIELDMODELLISTRESPONSE']._serialized_end=4060
+  _globals['_RELATEDFIELDMODELPARTIALUPDATEREQUEST']._serialized_start=4063
+  _globals['_RELATEDFIELDMODELPARTIALUPDATEREQUEST']._serialized_end=4263
+  _globals['_RELATEDFIELDMODELREQUEST']._serialized_start=4266
+  _globals['_RELATEDFIELDMODELREQUEST']._serialized_end=4421
+  _globals['_RELATEDFIELDMODELRESPONSE']._serialized_start=4424
+  _globals['_RELATEDFIELDMODELRESPONSE']._serialized_end=4755
+  _globals['_RELATEDFIELDMODELRETRIEVEREQUEST']._serialized_start=4757
+  _globals['_RELATEDFIELDMODELRETRIEVEREQUEST']._serialized_end=4805
+  _globals['_SPECIALFIELDSMODELDESTROYREQUEST']._serialized_start=4807
+  _globals['_SPECIALFIELDSMODELDESTROYREQUEST']._serialized_end=4855
+  _globals['_SPECIALFIELDSMODELLISTREQUEST']._serialized_start=4857
+  _globals['_SPECIALFIELDSMODELLISTREQUEST']._serialized_end=4888
+  _globals['_SPECIALFIELDSMODELLISTRESPONSE']._serialized_start=4890
+  _globals['_SPECIALFIELDSMODELLISTRESPONSE']._serialized_end=5001
+  _globals['_SPECIALFIELDSMODELPARTIALUPDATEREQUEST']._serialized_start=5004
+  _globals['_SPECIALFIELDSMODELPARTIALUPDATEREQUEST']._serialized_end=5155
+  _globals['_SPECIALFIELDSMODELREQUEST']._serialized_start=5157
+  _globals['_SPECIALFIELDSMODELREQUEST']._serialized_end=5263
+  _globals['_SPECIALFIELDSMODELRESPONSE']._serialized_start=5265
+  _globals['_SPECIALFIELDSMODELRESPONSE']._serialized_end=5388
+  _globals['_SPECIALFIELDSMODELRETRIEVEREQUEST']._serialized_start=5390
+  _globals['_SPECIALFIELDSMODELRETRIEVEREQUEST']._serialized_end=5439
+  _globals['_STREAMINSTREAMINLISTRESPONSE']._serialized_start=5441
+  _globals['_STREAMINSTREAMINLISTRESPONSE']._serialized_end=5548
+  _globals['_STREAMINSTREAMINREQUEST']._serialized_start=5550
+  _globals['_STREAMINSTREAMINREQUEST']._serialized_end=5589
+  _globals['_STREAMINSTREAMINRESPONSE']._serialized_start=5591
+  _globals['_STREAMINSTREAMINRESPONSE']._serialized_end=5632
+  _globals['_STREAMINSTREAMTOSTREAMREQUEST']._serialized_start=5634
+  _globals['_STREAMINSTREAMTOSTREAMREQUEST']._serialized_end=5679
+  _globals['_STREAMINSTREAMTOSTREAMRESPONSE']._serialized_start=5681
+  _globals['_STREAMINSTREAMTOSTREAMRESPONSE']._serialized_end=5727
+  _globals['_SYNCUNITTESTMODELLISTWITHEXTRAARGSREQUEST']._serialized_start=5729
+  _globals['_SYNCUNITTESTMODELLISTWITHEXTRAARGSREQUEST']._serialized_end=5790
+  _globals['_UNITTESTMODELBULKCREATELISTREQUEST']._serialized_start=5792
+  _globals['_UNITTESTMODELBULKCREATELISTREQUEST']._serialized_end=5896
+  _globals['_UNITTESTMODELBULKCREATEREQUEST']._serialized_start=5898
+  _globals['_UNITTESTMODELBULKCREATEREQUEST']._serialized_end=5985
+  _globals['_UNITTESTMODELBULKDESTROYLISTREQUEST']._serialized_start=5987
+  _globals['_UNITTESTMODELBULKDESTROYLISTREQUEST']._serialized_end=6093
+  _globals['_UNITTESTMODELBULKDESTROYREQUEST']._serialized_start=6095
+  _globals['_UNITTESTMODELBULKDESTROYREQUEST']._serialized_end=6140
+  _globals['_UNITTESTMODELBULKUPDATELISTREQUEST']._serialized_start=6142
+  _globals['_UNITTESTMODELBULKUPDATELISTREQUEST']._serialized_end=6246
+  _globals['_UNITTESTMODELBULKUPDATEREQUEST']._serialized_start=6248
+  _globals['_UNITTESTMODELBULKUPDATEREQUEST']._serialized_end=6335
+  _globals['_UNITTESTMODELDESTROYREQUEST']._serialized_start=6337
+  _globals['_UNITTESTMODELDESTROYREQUEST']._serialized_end=6378
+  _globals['_UNITTESTMODELLISTEXTRAARGSRESPONSE']._serialized_start=6381
+  _globals['_UNITTESTMODELLISTEXTRAARGSRESPONSE']._serialized_end=6523
+  _globals['_UNITTESTMODELLISTREQUEST']._serialized_start=6525
+  _globals['_UNITTESTMODELLISTREQUEST']._serialized_end=6551
+  _globals['_UNITTESTMODELLISTRESPONSE']._serialized_start=6553
+  _globals['_UNITTESTMODELLISTRESPONSE']._serialized_end=6654
+  _globals['_UNITTESTMODELLISTWITHEXTRAARGSREQUEST']._serialized_start=6656
+  _globals['_UNITTESTMODELLISTWITHEXTRAARGSREQUEST']._serialized_end=6713
+  _globals['_UNITTESTMODELPARTIALUPDATEREQUEST']._serialized_start=6715
+  _globals['_UNITTESTMODELPARTIALUPDATEREQUEST']._serialized_end=6837
+  _globals['_UNITTESTMODELREQUEST']._serialized_start=6839
+  _globals['_UNITTESTMODELREQUEST']._serialized_end=6916
+  _globals['_UNITTESTMODELRESPONSE']._serialized_start=6918
+  _globals['_UNITTESTMODELRESPONSE']._serialized_end=6996
+  _globals['_UNITTESTMODELRETRIEVEREQUEST']._serialized_start=6998
+  _globals['_UNITTESTMODELRETRIEVEREQUEST']._serialized_end=7040
+  _globals['_UNITTESTMODELSTREAMCREATERESPONSE']._serialized_start=7042
+  _globals['_UNITTESTMODELSTREAMCREATERESPONSE']._serialized_end=7113
+  _globals['_UNITTESTMODELSTREAMREQUEST']._serialized_start=7115
+  _globals['_UNITTESTMODELSTREAMREQUEST']._serialized_end=7143
+  _globals['_UNITTESTMODELSTREAMUPSERTRESPONSE']._serialized_start=7145
+  _globals['_UNITTESTMODELSTREAMUPSERTRESPONSE']._serialized_end=7217
+  _globals['_BASICCONTROLLER']._serialized_start=7220
+  _globals['_BASICCONTROLLER']._serialized_end=8446
+  _globals['_EXCEPTIONCONTROLLER']._serialized_start=8449
+  _globals['_EXCEPTIONCONTROLLER']._serialized_end=8786
+  _globals['_FOREIGNMODELCONTROLLER']._serialized_start=8789
+  _globals['_FOREIGNMODELCONTROLLER']._serialized_end=9044
+  _globals['_IMPORTSTRUCTEVENINARRAYMODELCONTROLLER']._serialized_start=9047
+  _globals['_IMPORTSTRUCTEVENINARRAYMODELCONTROLLER']._serialized_end=9212
+  _globals['_RECURSIVETESTMODELCONTROLLER']._serialized_start=9215
+  _globals['_RECURSIVETESTMODELCONTROLLER']._serialized_end=9896
+  _globals['_RELATEDFIELDMODELCONTROLLER']._serialized_start=9899
+  _globals['_RELATEDFIELDMODELCONTROLLER']._serialized_end=10568
+  _globals['_SPECIALFIELDSMODELCONTROLLER']._serialized_start=10571
+  _globals['_SPECIALFIELDSMODELCONTROLLER']._serialized_end=11275
+  _globals['_STREAMINCONTROLLER']._serialized_start=11278
+  _globals['_STREAMINCONTROLLER']._serialized_end=11532
+  _globals['_SYNCUNITTESTMODELCONTROLLER']._serialized_start=11535
+  _globals['_SYNCUNITTESTMODELCONTROLLER']._serialized_end=12967
+  _globals['_UNITTESTMODELCONTROLLER']._serialized_start=12970
+  _globals['_UNITTESTMODELCONTROLLER']._serialized_end=14394
 # @@protoc_insertion_point(module_scope)
@@ -8,7 +8,15 @@ from django_socio_grpc import generics, mixins
 from django_socio_grpc.decorators import grpc_action
 
 
-class SyncUnitTestModelService(generics.ModelService, mixins.StreamModelMixin):
+class SyncUnitTestModelService(
+    generics.ModelService,
+    mixins.StreamModelMixin,
+    mixins.BulkCreateModelMixin,
+    mixins.BulkUpdateModelMixin,
+    mixins.BulkDestroyModelMixin,
+    mixins.StreamCreateModelMixin,
+    mixins.StreamUpsertModelMixin,
+):
     queryset = UnitTestModel.objects.all().order_by("id")
     serializer_class = UnitTestModelSerializer
     filter_backends = [DjangoFilterBackend]
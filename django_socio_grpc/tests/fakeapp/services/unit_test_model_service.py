@@ -9,7 +9,15 @@ from django_socio_grpc import generics, mixins
 from django_socio_grpc.decorators import grpc_action
 
 
-class UnitTestModelService(generics.AsyncModelService, mixins.AsyncStreamModelMixin):
+class UnitTestModelService(
+    generics.AsyncModelService,
+    mixins.AsyncStreamModelMixin,
+    mixins.AsyncBulkCreateModelMixin,
+    mixins.AsyncBulkUpdateModelMixin,
+    mixins.AsyncBulkDestroyModelMixin,
+    mixins.AsyncStreamCreateModelMixin,
+    mixins.AsyncStreamUpsertModelMixin,
+):
     queryset = UnitTestModel.objects.all().order_by("id")
     serializer_class = UnitTestModelSerializer
     filter_backends = [DjangoFilterBackend]
@@ -6,6 +6,7 @@ import asyncio
 import inspect
 import queue
 import socket
+import threading
 from collections.abc import Iterable
 
 import grpc
@@ -28,7 +29,9 @@ class FakeServer:
         pass
 
     def stop(self, grace=None):
-        pass
+        stopped_event = threading.Event()
+        stopped_event.set()
+        return stopped_event
 
     def add_secure_port(self, target, server_credentials):
         pass
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from unittest import mock
 
 from asgiref.sync import sync_to_async
 from django.test import TestCase, override_settings
@@ -112,6 +113,23 @@ class TestAsyncModelService(TestCase):
 
         self.assertEqual(len(response_list), 10)
 
+    @mock.patch.object(UnitTestModelService, "stream_chunk_size", 3)
+    async def test_async_stream_by_chunks(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelStreamRequest()
+
+        response_list = []
+        async for response in grpc_stub.Stream(request=request):
+            response_list.append(response)
+
+        titles = [
+            title
+            async for title in UnitTestModel.objects.order_by("id").values_list(
+                "title", flat=True
+            )
+        ]
+        self.assertEqual([response.title for response in response_list], titles)
+
     async def test_async_list_custom_action(self):
         with freeze_time(datetime(2022, 1, 21, tzinfo=timezone.utc)):
             grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
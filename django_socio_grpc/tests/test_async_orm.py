@@ -0,0 +1,191 @@
+import contextlib
+from unittest import mock
+
+import grpc
+from asgiref.sync import SyncToAsync
+from django.test import TestCase, override_settings
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    UnitTestModelControllerStub,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.models import ForeignModel, RelatedFieldModel, UnitTestModel
+from fakeapp.serializers import RelatedFieldModelSerializer, UnitTestModelSerializer
+from fakeapp.services.unit_test_model_service import UnitTestModelService
+
+from .benchmarks.utils import BENCHMARK_ITERATIONS, arun_benchmark, report
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC
+
+
+@contextlib.contextmanager
+def count_thread_hops():
+    """
+    Count the calls run in a thread by ``sync_to_async``, including the ones of the
+    async queryset API of Django.
+    """
+    hops = []
+    sync_to_async_call = SyncToAsync.__call__
+
+    async def counting_call(self, *args, **kwargs):
+        hops.append(self.func)
+        return await sync_to_async_call(self, *args, **kwargs)
+
+    with mock.patch.object(SyncToAsync, "__call__", counting_call):
+        yield hops
+
+
+class TestSerializeInEventLoop(TestCase):
+    def setUp(self):
+        self.instances = [
+            UnitTestModel.objects.create(title=f"title {idx}") for idx in range(2)
+        ]
+
+    def test_loaded_model_fields(self):
+        self.assertTrue(
+            UnitTestModelSerializer(self.instances[0]).can_serialize_in_event_loop()
+        )
+        self.assertTrue(
+            UnitTestModelSerializer(self.instances, many=True).can_serialize_in_event_loop()
+        )
+
+    def test_queryset(self):
+        serializer = UnitTestModelSerializer(UnitTestModel.objects.all(), many=True)
+
+        self.assertFalse(serializer.can_serialize_in_event_loop())
+
+    def test_deferred_field(self):
+        instance = UnitTestModel.objects.only("id", "title").first()
+
+        self.assertFalse(UnitTestModelSerializer(instance).can_serialize_in_event_loop())
+
+    def test_related_fields(self):
+        instance = RelatedFieldModel.objects.create(
+            foreign=ForeignModel.objects.create(name="foreign")
+        )
+
+        self.assertFalse(RelatedFieldModelSerializer(instance).can_serialize_in_event_loop())
+
+    async def test_amessage_without_thread_hop(self):
+        serializer = UnitTestModelSerializer(self.instances, many=True)
+
+        with count_thread_hops() as hops:
+            message = await serializer.amessage
+
+        self.assertEqual(hops, [])
+        self.assertEqual([result.title for result in message.results], ["title 0", "title 1"])
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+@mock.patch.object(UnitTestModelService, "async_orm", True)
+class TestAsyncORM(TestCase):
+    def setUp(self):
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server, UnitTestModelService.as_servicer()
+        )
+        self.instances = [
+            UnitTestModel.objects.create(title=f"title {idx}", text="text") for idx in range(5)
+        ]
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def test_retrieve(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        response = await grpc_stub.Retrieve(
+            request=fakeapp_pb2.UnitTestModelRetrieveRequest(id=self.instances[1].id)
+        )
+
+        self.assertEqual(response.title, "title 1")
+
+    async def test_retrieve_not_found(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        with self.assertRaises(grpc.RpcError) as error:
+            await grpc_stub.Retrieve(request=fakeapp_pb2.UnitTestModelRetrieveRequest(id=0))
+
+        self.assertEqual(error.exception.code(), grpc.StatusCode.NOT_FOUND)
+
+    async def test_list(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        response = await grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        self.assertEqual(
+            [result.title for result in response.results],
+            [f"title {idx}" for idx in range(5)],
+        )
+
+    async def test_stream(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        responses = [
+            response
+            async for response in grpc_stub.Stream(
+                request=fakeapp_pb2.UnitTestModelStreamRequest()
+            )
+        ]
+
+        self.assertEqual(len(responses), 5)
+
+    async def test_update(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        response = await grpc_stub.Update(
+            request=fakeapp_pb2.UnitTestModelRequest(id=self.instances[0].id, title="updated")
+        )
+
+        self.assertEqual(response.title, "updated")
+        self.assertEqual(
+            (await UnitTestModel.objects.aget(id=self.instances[0].id)).title, "updated"
+        )
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+class TestAsyncORMBenchmark(TestCase):
+    def setUp(self):
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server, UnitTestModelService.as_servicer()
+        )
+        self.instances = [
+            UnitTestModel.objects.create(title=f"title {idx}", text="text")
+            for idx in range(20)
+        ]
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def retrieve(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        await grpc_stub.Retrieve(
+            request=fakeapp_pb2.UnitTestModelRetrieveRequest(id=self.instances[0].id)
+        )
+
+    async def list(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        await grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+    async def measure(self, async_orm):
+        results = {}
+        with mock.patch.object(UnitTestModelService, "async_orm", async_orm):
+            for name, rpc in (("retrieve", self.retrieve), ("list", self.list)):
+                with count_thread_hops() as hops:
+                    await rpc()
+                results[name] = (
+                    len(hops),
+                    await arun_benchmark(rpc, BENCHMARK_ITERATIONS * 5),
+                )
+        return results
+
+    async def test_benchmark_async_orm(self):
+        thread_results = await self.measure(False)
+        async_orm_results = await self.measure(True)
+
+        for name in ("retrieve", "list"):
+            thread_hops, thread_timings = thread_results[name]
+            async_orm_hops, async_orm_timings = async_orm_results[name]
+            report(
+                f"{name}: {thread_hops} thread hops, {async_orm_hops} with async_orm",
+                {"sync_to_async": thread_timings, "async_orm": async_orm_timings},
+            )
+            self.assertLess(async_orm_hops, thread_hops)
@@ -1,9 +1,11 @@
 import json
 from unittest import mock
 
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from grpc._cython.cygrpc import _Metadatum
 
+from django_socio_grpc.authentication_cache import invalidate_authentication_cache
 from django_socio_grpc.services import Service
 from django_socio_grpc.services.servicer_proxy import get_servicer_context
 from django_socio_grpc.settings import grpc_settings
@@ -66,6 +68,87 @@ class TestAuthenticationUnitary(TestCase):
             mock_perform_authentication.assert_called_once_with()
 
 
+class NoAuthentication:
+    def authenticate(self, context):
+        return None
+
+
+class CountingAuthentication:
+    calls = 0
+
+    def authenticate(self, context):
+        CountingAuthentication.calls += 1
+        return ({"email": "john.doe@johndoe.com"}, context.META.get("HTTP_AUTHORIZATION"))
+
+
+class TestResolveUser(TestCase):
+    def setUp(self):
+        cache.clear()
+        CountingAuthentication.calls = 0
+        self.service = DummyService()
+        self.service.authentication_classes = [CountingAuthentication]
+
+    def resolve_user(self, token=None):
+        self.service.context = FakeContext()
+        self.service.context.META = {"HTTP_AUTHORIZATION": token} if token else {}
+        return self.service.resolve_user()
+
+    def test_resolve_user_stops_at_first_result(self):
+        self.service.authentication_classes = [
+            NoAuthentication,
+            FakeAuthentication,
+            CountingAuthentication,
+        ]
+
+        self.assertEqual(
+            self.resolve_user("faketoken"), ({"email": "john.doe@johndoe.com"}, "faketoken")
+        )
+        self.assertEqual(CountingAuthentication.calls, 0)
+
+    def test_resolve_user_without_authentication(self):
+        self.service.authentication_classes = [NoAuthentication]
+
+        self.assertIsNone(self.resolve_user("faketoken"))
+
+    def test_cache_disabled(self):
+        self.resolve_user("faketoken")
+        self.resolve_user("faketoken")
+
+        self.assertEqual(CountingAuthentication.calls, 2)
+
+    @override_settings(GRPC_FRAMEWORK={"AUTHENTICATION_CACHE_TIMEOUT": 60})
+    def test_cached_authentication(self):
+        self.assertEqual(self.resolve_user("faketoken")[1], "faketoken")
+        self.assertEqual(self.resolve_user("faketoken")[1], "faketoken")
+        self.assertEqual(CountingAuthentication.calls, 1)
+
+        self.assertEqual(self.resolve_user("othertoken")[1], "othertoken")
+        self.assertEqual(CountingAuthentication.calls, 2)
+
+    @override_settings(GRPC_FRAMEWORK={"AUTHENTICATION_CACHE_TIMEOUT": 60})
+    def test_invalidate_authentication_cache(self):
+        self.resolve_user("faketoken")
+        invalidate_authentication_cache("faketoken")
+        self.resolve_user("faketoken")
+
+        self.assertEqual(CountingAuthentication.calls, 2)
+
+    @override_settings(GRPC_FRAMEWORK={"AUTHENTICATION_CACHE_TIMEOUT": 60})
+    def test_cache_by_authentication_classes(self):
+        self.resolve_user("faketoken")
+        self.service.authentication_classes = [NoAuthentication, CountingAuthentication]
+        self.resolve_user("faketoken")
+
+        self.assertEqual(CountingAuthentication.calls, 2)
+
+    @override_settings(GRPC_FRAMEWORK={"AUTHENTICATION_CACHE_TIMEOUT": 60})
+    def test_no_credential_not_cached(self):
+        self.resolve_user()
+        self.resolve_user()
+
+        self.assertEqual(CountingAuthentication.calls, 2)
+
+
 class TestAuthenticationIntegration(TestCase):
     def setUp(self):
         self.servicer = DummyService.as_servicer()
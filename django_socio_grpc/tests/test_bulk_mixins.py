@@ -0,0 +1,293 @@
+import json
+from unittest import mock
+
+import grpc
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    SyncUnitTestModelControllerStub,
+    UnitTestModelControllerStub,
+    add_SyncUnitTestModelControllerServicer_to_server,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.models import UnitTestModel
+from fakeapp.serializers import UnitTestModelSerializer
+from fakeapp.services.sync_unit_test_model_service import SyncUnitTestModelService
+from fakeapp.services.unit_test_model_service import UnitTestModelService
+
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC, FakeGRPC
+
+
+def get_queries(queries, statement):
+    return [query for query in queries if query["sql"].startswith(statement)]
+
+
+class CustomSaveSerializer(UnitTestModelSerializer):
+    def create(self, validated_data):
+        return super().create({**validated_data, "text": "created"})
+
+    def update(self, instance, validated_data):
+        return super().update(instance, {**validated_data, "text": "updated"})
+
+
+def get_queryset_with_query(service):
+    # INFO - A query out of the thread of the sync calls fails in async mode
+    UnitTestModel.objects.exists()
+    return UnitTestModel.objects.order_by("id")
+
+
+class TestBulkMixins(TestCase):
+    def setUp(self):
+        self.fake_grpc = FakeGRPC(
+            add_SyncUnitTestModelControllerServicer_to_server,
+            SyncUnitTestModelService.as_servicer(),
+        )
+        self.instances = [
+            UnitTestModel.objects.create(title=f"title {idx}", text="text") for idx in range(3)
+        ]
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    def test_bulk_create(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelBulkCreateListRequest(
+            results=[
+                fakeapp_pb2.UnitTestModelBulkCreateRequest(title=f"new {idx}", text="new")
+                for idx in range(5)
+            ]
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            response = grpc_stub.BulkCreate(request=request)
+
+        self.assertEqual(len(get_queries(queries, "INSERT")), 1)
+        self.assertEqual(
+            [result.title for result in response.results], [f"new {idx}" for idx in range(5)]
+        )
+        self.assertTrue(all(result.id for result in response.results))
+        self.assertEqual(UnitTestModel.objects.filter(text="new").count(), 5)
+
+    def test_bulk_create_item_errors(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelBulkCreateListRequest(
+            results=[
+                fakeapp_pb2.UnitTestModelBulkCreateRequest(title="valid"),
+                fakeapp_pb2.UnitTestModelBulkCreateRequest(title="too long" * 10),
+            ]
+        )
+
+        with self.assertRaises(grpc.RpcError) as error:
+            grpc_stub.BulkCreate(request=request)
+
+        self.assertEqual(error.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+        details = json.loads(error.exception.details())
+        self.assertEqual(details[0], {})
+        self.assertEqual(details[1]["title"][0]["code"], "max_length")
+        self.assertFalse(UnitTestModel.objects.filter(title="valid").exists())
+
+    def test_bulk_update(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelBulkUpdateListRequest(
+            results=[
+                fakeapp_pb2.UnitTestModelBulkUpdateRequest(
+                    id=instance.id, title=f"updated {instance.id}"
+                )
+                for instance in self.instances
+            ]
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            response = grpc_stub.BulkUpdate(request=request)
+
+        self.assertEqual(len(get_queries(queries, "SELECT")), 1)
+        self.assertEqual(len(get_queries(queries, "UPDATE")), 1)
+        self.assertEqual(
+            [result.title for result in response.results],
+            [f"updated {instance.id}" for instance in self.instances],
+        )
+        for instance in self.instances:
+            instance.refresh_from_db()
+            self.assertEqual(instance.title, f"updated {instance.id}")
+            self.assertIsNone(instance.text)
+
+    @mock.patch.object(SyncUnitTestModelService, "serializer_class", CustomSaveSerializer)
+    def test_bulk_create_custom_create(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelBulkCreateListRequest(
+            results=[
+                fakeapp_pb2.UnitTestModelBulkCreateRequest(title=f"new {idx}")
+                for idx in range(2)
+            ]
+        )
+
+        response = grpc_stub.BulkCreate(request=request)
+
+        self.assertEqual([result.text for result in response.results], ["created"] * 2)
+        self.assertEqual(UnitTestModel.objects.filter(text="created").count(), 2)
+
+    @mock.patch.object(SyncUnitTestModelService, "serializer_class", CustomSaveSerializer)
+    def test_bulk_update_custom_update(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelBulkUpdateListRequest(
+            results=[
+                fakeapp_pb2.UnitTestModelBulkUpdateRequest(id=instance.id, title="title")
+                for instance in self.instances
+            ]
+        )
+
+        response = grpc_stub.BulkUpdate(request=request)
+
+        self.assertEqual([result.text for result in response.results], ["updated"] * 3)
+        self.assertEqual(UnitTestModel.objects.filter(text="updated").count(), 3)
+
+    def test_bulk_update_item_errors(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelBulkUpdateListRequest(
+            results=[
+                fakeapp_pb2.UnitTestModelBulkUpdateRequest(
+                    id=self.instances[0].id, title="ok"
+                ),
+                fakeapp_pb2.UnitTestModelBulkUpdateRequest(
+                    id=self.instances[1].id, title="too long" * 10
+                ),
+            ]
+        )
+
+        with self.assertRaises(grpc.RpcError) as error:
+            grpc_stub.BulkUpdate(request=request)
+
+        self.assertEqual(error.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+        details = json.loads(error.exception.details())
+        self.assertEqual(details[0], {})
+        self.assertIn("title", details[1])
+        self.instances[0].refresh_from_db()
+        self.assertEqual(self.instances[0].title, "title 0")
+
+    def test_bulk_update_not_found(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelBulkUpdateListRequest(
+            results=[
+                fakeapp_pb2.UnitTestModelBulkUpdateRequest(
+                    id=self.instances[0].id, title="ok"
+                ),
+                fakeapp_pb2.UnitTestModelBulkUpdateRequest(id=0, title="ok"),
+            ]
+        )
+
+        with self.assertRaises(grpc.RpcError) as error:
+            grpc_stub.BulkUpdate(request=request)
+
+        self.assertEqual(error.exception.code(), grpc.StatusCode.NOT_FOUND)
+        self.assertIn("UnitTestModel: 0 not found!", error.exception.details())
+
+    def test_bulk_destroy(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelBulkDestroyListRequest(
+            results=[
+                fakeapp_pb2.UnitTestModelBulkDestroyRequest(id=instance.id)
+                for instance in self.instances[:2]
+            ]
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            grpc_stub.BulkDestroy(request=request)
+
+        self.assertEqual(len(get_queries(queries, "DELETE")), 1)
+        self.assertEqual(list(UnitTestModel.objects.all()), self.instances[2:])
+
+    def test_bulk_destroy_not_found(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelBulkDestroyListRequest(
+            results=[
+                fakeapp_pb2.UnitTestModelBulkDestroyRequest(id=self.instances[0].id),
+                fakeapp_pb2.UnitTestModelBulkDestroyRequest(id=0),
+            ]
+        )
+
+        with self.assertRaises(grpc.RpcError) as error:
+            grpc_stub.BulkDestroy(request=request)
+
+        self.assertEqual(error.exception.code(), grpc.StatusCode.NOT_FOUND)
+        self.assertEqual(UnitTestModel.objects.count(), 3)
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+class TestAsyncBulkMixins(TestCase):
+    def setUp(self):
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server, UnitTestModelService.as_servicer()
+        )
+        self.instances = [
+            UnitTestModel.objects.create(title=f"title {idx}", text="text") for idx in range(3)
+        ]
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def test_async_bulk_create(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelBulkCreateListRequest(
+            results=[
+                fakeapp_pb2.UnitTestModelBulkCreateRequest(title=f"new {idx}", text="new")
+                for idx in range(5)
+            ]
+        )
+
+        response = await grpc_stub.BulkCreate(request=request)
+
+        self.assertEqual(len(response.results), 5)
+        self.assertEqual(await UnitTestModel.objects.filter(text="new").acount(), 5)
+
+    async def test_async_bulk_update(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelBulkUpdateListRequest(
+            results=[
+                fakeapp_pb2.UnitTestModelBulkUpdateRequest(id=instance.id, title="updated")
+                for instance in self.instances
+            ]
+        )
+
+        response = await grpc_stub.BulkUpdate(request=request)
+
+        self.assertEqual([result.title for result in response.results], ["updated"] * 3)
+        self.assertEqual(await UnitTestModel.objects.filter(title="updated").acount(), 3)
+
+    async def test_async_bulk_destroy(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelBulkDestroyListRequest(
+            results=[
+                fakeapp_pb2.UnitTestModelBulkDestroyRequest(id=instance.id)
+                for instance in self.instances
+            ]
+        )
+
+        await grpc_stub.BulkDestroy(request=request)
+
+        self.assertEqual(await UnitTestModel.objects.acount(), 0)
+
+    @mock.patch.object(UnitTestModelService, "get_queryset", get_queryset_with_query)
+    async def test_async_bulk_actions_get_queryset_with_query(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        await grpc_stub.BulkUpdate(
+            request=fakeapp_pb2.UnitTestModelBulkUpdateListRequest(
+                results=[
+                    fakeapp_pb2.UnitTestModelBulkUpdateRequest(
+                        id=self.instances[0].id, title="updated"
+                    )
+                ]
+            )
+        )
+        await grpc_stub.BulkDestroy(
+            request=fakeapp_pb2.UnitTestModelBulkDestroyListRequest(
+                results=[fakeapp_pb2.UnitTestModelBulkDestroyRequest(id=self.instances[1].id)]
+            )
+        )
+
+        self.assertEqual(
+            [instance.title async for instance in UnitTestModel.objects.order_by("id")],
+            ["updated", "title 2"],
+        )
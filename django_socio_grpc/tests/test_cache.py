@@ -0,0 +1,201 @@
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    UnitTestModelControllerStub,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.models import ForeignModel, UnitTestModel
+from fakeapp.services.sync_unit_test_model_service import SyncUnitTestModelService
+from fakeapp.services.unit_test_model_service import UnitTestModelService
+
+from django_socio_grpc.cache import (
+    _get_version_key,
+    cache_response,
+    invalidate_response_cache,
+)
+
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC, FakeGRPC
+
+
+class CachedUnitTestModelService(SyncUnitTestModelService):
+    @cache_response(timeout=60)
+    def List(self, request, context):
+        return super().List(request, context)
+
+    @cache_response(timeout=60)
+    def Retrieve(self, request, context):
+        return super().Retrieve(request, context)
+
+
+class AsyncCachedUnitTestModelService(UnitTestModelService):
+    @cache_response(timeout=60)
+    async def List(self, request, context):
+        return await super().List(request, context)
+
+
+class TestCacheResponse(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.fake_grpc = FakeGRPC(
+            add_UnitTestModelControllerServicer_to_server,
+            CachedUnitTestModelService.as_servicer(),
+        )
+        self.instance = UnitTestModel.objects.create(title="title", text="text")
+        self.grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    def test_list_cached(self):
+        response = self.grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        with self.assertNumQueries(0):
+            cached_response = self.grpc_stub.List(
+                request=fakeapp_pb2.UnitTestModelListRequest()
+            )
+
+        self.assertEqual(cached_response, response)
+        self.assertEqual(cached_response.results[0].title, "title")
+
+    def test_invalidated_on_save_and_delete(self):
+        self.grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        self.instance.title = "new title"
+        self.instance.save()
+        response = self.grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+        self.assertEqual(response.results[0].title, "new title")
+
+        self.instance.delete()
+        response = self.grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+        self.assertEqual(len(response.results), 0)
+
+    def test_invalidate_response_cache(self):
+        self.grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+        UnitTestModel.objects.update(title="updated")
+
+        response = self.grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+        self.assertEqual(response.results[0].title, "title")
+
+        invalidate_response_cache(UnitTestModel)
+        response = self.grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+        self.assertEqual(response.results[0].title, "updated")
+
+    def test_vary_on_filters_metadata(self):
+        UnitTestModel.objects.create(title="other", text="text")
+        self.grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        response = self.grpc_stub.List(
+            request=fakeapp_pb2.UnitTestModelListRequest(),
+            metadata=(("filters", '{"title": "other"}'),),
+        )
+
+        self.assertEqual([result.title for result in response.results], ["other"])
+
+    def test_vary_on_request(self):
+        other = UnitTestModel.objects.create(title="other", text="text")
+        self.grpc_stub.Retrieve(
+            request=fakeapp_pb2.UnitTestModelRetrieveRequest(id=self.instance.id)
+        )
+
+        response = self.grpc_stub.Retrieve(
+            request=fakeapp_pb2.UnitTestModelRetrieveRequest(id=other.id)
+        )
+
+        self.assertEqual(response.title, "other")
+
+    def test_invalidated_on_bulk_create_and_update(self):
+        self.grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        self.grpc_stub.BulkCreate(
+            request=fakeapp_pb2.UnitTestModelBulkCreateListRequest(
+                results=[fakeapp_pb2.UnitTestModelBulkCreateRequest(title="new", text="text")]
+            )
+        )
+        response = self.grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+        self.assertEqual([result.title for result in response.results], ["title", "new"])
+
+        self.grpc_stub.BulkUpdate(
+            request=fakeapp_pb2.UnitTestModelBulkUpdateListRequest(
+                results=[
+                    fakeapp_pb2.UnitTestModelBulkUpdateRequest(
+                        id=self.instance.id, title="updated", text="text"
+                    )
+                ]
+            )
+        )
+        response = self.grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+        self.assertEqual([result.title for result in response.results], ["updated", "new"])
+
+    def test_cached_response_read_by_new_decorator(self):
+        response = self.grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        # INFO - Same service decorated again, as in a process that never cached a response
+        class CachedUnitTestModelService(SyncUnitTestModelService):
+            @cache_response(timeout=60)
+            def List(self, request, context):
+                return super().List(request, context)
+
+        fake_grpc = FakeGRPC(
+            add_UnitTestModelControllerServicer_to_server,
+            CachedUnitTestModelService.as_servicer(),
+        )
+        self.addCleanup(fake_grpc.close)
+        grpc_stub = fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        with self.assertNumQueries(0):
+            cached_response = grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        self.assertEqual(cached_response, response)
+
+
+class TestCacheInvalidation(TestCase):
+    def test_version_reset_on_save_of_any_model(self):
+        version_key = _get_version_key(ForeignModel)
+        cache.set(version_key, "version")
+
+        ForeignModel.objects.create(name="name")
+
+        self.assertIsNone(cache.get(version_key))
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "versions": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "versions",
+            },
+        },
+        GRPC_FRAMEWORK={"RESPONSE_CACHE_ALIAS": "versions"},
+    )
+    def test_version_reset_in_response_cache_alias(self):
+        version_key = _get_version_key(ForeignModel)
+        caches["versions"].set(version_key, "version")
+
+        invalidate_response_cache(ForeignModel)
+
+        self.assertIsNone(caches["versions"].get(version_key))
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+class TestAsyncCacheResponse(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server,
+            AsyncCachedUnitTestModelService.as_servicer(),
+        )
+        UnitTestModel.objects.create(title="title", text="text")
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def test_async_list_cached(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        response = await grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+        await UnitTestModel.objects.all().aupdate(title="updated")
+
+        cached_response = await grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        self.assertEqual(cached_response, response)
+        self.assertEqual(cached_response.results[0].title, "title")
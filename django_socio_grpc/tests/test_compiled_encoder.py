@@ -0,0 +1,133 @@
+from django.test import TestCase
+from fakeapp.models import (
+    ForeignModel,
+    ManyManyModel,
+    RelatedFieldModel,
+    SpecialFieldsModel,
+    UnitTestModel,
+)
+from fakeapp.serializers import (
+    RelatedFieldModelSerializer,
+    SpecialFieldsModelSerializer,
+    UnitTestModelSerializer,
+)
+
+from django_socio_grpc.protobuf.encoder import is_encodable
+
+from .benchmarks.utils import report, run_benchmark
+
+
+class CompiledUnitTestModelSerializer(UnitTestModelSerializer):
+    class Meta(UnitTestModelSerializer.Meta):
+        use_compiled_encoder = True
+
+
+class CompiledRelatedFieldModelSerializer(RelatedFieldModelSerializer):
+    class Meta(RelatedFieldModelSerializer.Meta):
+        use_compiled_encoder = True
+
+
+class CompiledSpecialFieldsModelSerializer(SpecialFieldsModelSerializer):
+    class Meta(SpecialFieldsModelSerializer.Meta):
+        use_compiled_encoder = True
+
+
+class CustomRepresentationSerializer(CompiledUnitTestModelSerializer):
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data["title"] = data["title"].upper()
+        return data
+
+
+class TestCompiledEncoder(TestCase):
+    def setUp(self):
+        for idx in range(10):
+            UnitTestModel.objects.create(
+                title="z" * (idx + 1), text=None if idx % 2 else "text"
+            )
+
+        foreign = ForeignModel.objects.create(name="foreign")
+        self.related = RelatedFieldModel.objects.create(foreign=foreign)
+        self.related.many_many.add(
+            ManyManyModel.objects.create(name="first"),
+            ManyManyModel.objects.create(name="second"),
+        )
+        self.special = SpecialFieldsModel.objects.create(
+            meta_datas={"foo": "bar", "nested": {"list": [1, 2]}},
+            list_datas=[1, 2, 3],
+            binary=b"bytes",
+        )
+
+    def assertSameMessage(
+        self, serializer_class, compiled_serializer_class, instance, **kwargs
+    ):
+        serializer = serializer_class(instance, **kwargs)
+        compiled_serializer = compiled_serializer_class(instance, **kwargs)
+        self.assertTrue(compiled_serializer.can_encode_instance())
+        self.assertEqual(serializer.message, compiled_serializer.message)
+
+    def test_encode_instance(self):
+        for instance in UnitTestModel.objects.all():
+            self.assertSameMessage(
+                UnitTestModelSerializer, CompiledUnitTestModelSerializer, instance
+            )
+
+    def test_encode_optional_field_not_set(self):
+        instance = UnitTestModel.objects.filter(text__isnull=True).first()
+        message = CompiledUnitTestModelSerializer(instance).message
+        self.assertFalse(message.HasField("text"))
+
+    def test_encode_list(self):
+        queryset = UnitTestModel.objects.all().order_by("id")
+        self.assertSameMessage(
+            UnitTestModelSerializer, CompiledUnitTestModelSerializer, queryset, many=True
+        )
+        self.assertSameMessage(
+            UnitTestModelSerializer,
+            CompiledUnitTestModelSerializer,
+            queryset,
+            many=True,
+            stream=True,
+        )
+
+    def test_encode_nested_and_related_fields(self):
+        self.assertSameMessage(
+            RelatedFieldModelSerializer, CompiledRelatedFieldModelSerializer, self.related
+        )
+        message = CompiledRelatedFieldModelSerializer(self.related).message
+        self.assertEqual(message.foreign.name, "foreign")
+        self.assertEqual({item.name for item in message.many_many}, {"first", "second"})
+
+    def test_encode_special_fields(self):
+        self.assertSameMessage(
+            SpecialFieldsModelSerializer, CompiledSpecialFieldsModelSerializer, self.special
+        )
+
+    def test_custom_to_representation_is_not_compiled(self):
+        instance = UnitTestModel.objects.first()
+        serializer = CustomRepresentationSerializer(instance)
+        self.assertFalse(is_encodable(serializer))
+        self.assertFalse(serializer.can_encode_instance())
+        self.assertEqual(serializer.message.title, instance.title.upper())
+
+    def test_not_compiled_without_instance(self):
+        serializer = CompiledUnitTestModelSerializer(data={"title": "title"})
+        serializer.is_valid(raise_exception=True)
+        self.assertFalse(serializer.can_encode_instance())
+        self.assertEqual(serializer.message.title, "title")
+
+    def test_benchmark_list_encoding(self):
+        UnitTestModel.objects.bulk_create(
+            [UnitTestModel(title=str(idx), text="text") for idx in range(200)]
+        )
+        instances = list(UnitTestModel.objects.all())
+
+        results = {
+            "dict + parse_dict": run_benchmark(
+                lambda: UnitTestModelSerializer(instances, many=True).message
+            ),
+            "compiled encoder": run_benchmark(
+                lambda: CompiledUnitTestModelSerializer(instances, many=True).message
+            ),
+        }
+        report(f"List encoding of {len(instances)} instances", results)
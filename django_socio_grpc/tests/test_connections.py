@@ -0,0 +1,183 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase, override_settings
+
+from django_socio_grpc.utils.connections import (
+    ConnectionHealthManager,
+    track_connections,
+)
+
+from .benchmarks.utils import arun_benchmark, report
+
+
+class FakeConnection:
+    def __init__(self, conn_max_age=60, **settings):
+        self.connection = object()
+        self.autocommit = True
+        self.errors_occurred = False
+        self.close_at = None if conn_max_age is None else time.monotonic() + conn_max_age
+        self.settings_dict = {"AUTOCOMMIT": True, "CONN_HEALTH_CHECKS": False, **settings}
+
+    def close(self):
+        self.connection = None
+
+
+def close_connections(*connections):
+    def close_old_connections():
+        for connection in connections:
+            connection.close()
+
+    return mock.patch(
+        "django_socio_grpc.utils.connections._close_old_connections",
+        side_effect=close_old_connections,
+    )
+
+
+class TestConnectionHealthManager(TestCase):
+    def setUp(self):
+        self.manager = ConnectionHealthManager()
+
+    def test_needs_check(self):
+        connection = FakeConnection()
+        self.manager.track(connection)
+
+        self.assertFalse(self.manager.needs_check())
+
+        connection.errors_occurred = True
+        self.assertTrue(self.manager.needs_check())
+
+        # INFO - The connections in a transaction are not closed
+        connection.autocommit = False
+        self.assertFalse(self.manager.needs_check())
+
+    def test_needs_check_max_age(self):
+        connection = FakeConnection(conn_max_age=0)
+        self.manager.track(connection)
+
+        self.assertTrue(self.manager.needs_check())
+
+    def test_needs_check_health_checks(self):
+        connection = FakeConnection(CONN_HEALTH_CHECKS=True)
+        self.manager.track(connection)
+
+        self.assertTrue(self.manager.needs_check())
+
+    async def test_no_hop_without_connection_to_check(self):
+        connection = FakeConnection()
+        self.manager.track(connection)
+
+        with close_connections() as close_mock:
+            await self.manager.acheck()
+
+        close_mock.assert_not_called()
+
+    async def test_check_closes_obsolete_connection(self):
+        connection = FakeConnection(conn_max_age=0)
+        self.manager.track(connection)
+
+        with close_connections(connection) as close_mock:
+            await self.manager.acheck()
+            await self.manager.acheck()
+
+        close_mock.assert_called_once()
+        self.assertEqual(len(self.manager._connections), 0)
+
+    async def test_concurrent_checks_batched(self):
+        connection = FakeConnection(conn_max_age=0)
+        self.manager.track(connection)
+
+        with close_connections(connection) as close_mock:
+            await asyncio.gather(*(self.manager.acheck() for _ in range(5)))
+
+        close_mock.assert_called_once()
+
+    async def test_connection_of_other_thread_untracked(self):
+        connection = FakeConnection(conn_max_age=0)
+        thread = threading.Thread(target=self.manager.track, args=(connection,))
+        thread.start()
+        thread.join()
+
+        with close_connections() as close_mock:
+            await self.manager.acheck()
+            await self.manager.acheck()
+
+        # INFO - The hop can not close it, it is not checked again until it reconnects
+        close_mock.assert_called_once()
+        self.assertEqual(len(self.manager._connections), 0)
+
+    @override_settings(GRPC_FRAMEWORK={"SYNC_TO_ASYNC_THREAD_SENSITIVE": False})
+    async def test_check_in_thread_sensitive_thread(self):
+        connection = FakeConnection(CONN_HEALTH_CHECKS=True)
+        await sync_to_async(self.manager.track)(connection)
+
+        with close_connections() as close_mock:
+            await self.manager.acheck()
+
+        close_mock.assert_called_once()
+        # INFO - The check ran in the thread of the connection, which is still checked
+        self.assertEqual(len(self.manager._connections), 1)
+        self.assertTrue(self.manager.needs_check())
+
+    def test_pool_connection_not_tracked(self):
+        connection = FakeConnection(conn_max_age=0)
+        thread = threading.Thread(
+            target=self.manager.track,
+            args=(connection,),
+            name="grpc-sync-to-async_0",
+        )
+        thread.start()
+        thread.join()
+
+        self.assertFalse(self.manager.needs_check())
+
+    def test_track_connections_seeds_open_connections(self):
+        open_connection = FakeConnection(conn_max_age=0)
+        closed_connection = FakeConnection(conn_max_age=0)
+        closed_connection.close()
+
+        with mock.patch(
+            "django_socio_grpc.utils.connections.connection_health_manager", self.manager
+        ), mock.patch(
+            "django_socio_grpc.utils.connections.db.connections.all",
+            return_value=[open_connection, closed_connection],
+        ) as all_mock:
+            track_connections()
+
+        all_mock.assert_called_once_with(initialized_only=True)
+        self.assertEqual(list(self.manager._connections), [open_connection])
+        self.assertTrue(self.manager.needs_check())
+
+
+def noop():
+    pass
+
+
+class TestConnectionHealthManagerBenchmark(TestCase):
+    CONCURRENT_RPCS = 8
+
+    async def check_connections(self, check):
+        await asyncio.gather(*(check() for _ in range(self.CONCURRENT_RPCS)))
+
+    async def test_benchmark_connection_checks(self):
+        manager = ConnectionHealthManager()
+        connection = FakeConnection(CONN_HEALTH_CHECKS=True)
+        manager.track(connection)
+
+        with close_connections():
+            results = {
+                "hop by rpc": await arun_benchmark(
+                    lambda: self.check_connections(sync_to_async(noop))
+                ),
+                "batched hops": await arun_benchmark(
+                    lambda: self.check_connections(manager.acheck)
+                ),
+                "no connection to check": await arun_benchmark(
+                    lambda: self.check_connections(ConnectionHealthManager().acheck)
+                ),
+            }
+
+        report(f"{self.CONCURRENT_RPCS} concurrent connection checks", results)
@@ -0,0 +1,88 @@
+from django.core.cache import cache
+from django.test import TestCase
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    UnitTestModelControllerStub,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.models import UnitTestModel
+from fakeapp.services.sync_unit_test_model_service import SyncUnitTestModelService
+
+from django_socio_grpc.cache import cache_response
+from django_socio_grpc.services.servicer_proxy import EncodedMessage
+
+from .grpc_test_utils.fake_grpc import FakeGRPC, FakeServer
+
+CONTROLLER_PATH = "/myproject.fakeapp.UnitTestModelController"
+
+
+class EncodedUnitTestModelService(SyncUnitTestModelService):
+    encoded_response_actions = ("Retrieve",)
+
+    @cache_response(timeout=60)
+    def Retrieve(self, request, context):
+        return super().Retrieve(request, context)
+
+
+class EncodedFakeGRPC(FakeGRPC):
+    def __init__(self, grpc_add_to_server, grpc_servicer):
+        super().__init__(
+            lambda servicer, server: grpc_add_to_server(
+                servicer, servicer.wrap_server(server)
+            ),
+            grpc_servicer,
+        )
+
+
+class TestEncodedResponseServer(TestCase):
+    def setUp(self):
+        self.server = FakeServer()
+        servicer = EncodedUnitTestModelService.as_servicer()
+        add_UnitTestModelControllerServicer_to_server(
+            servicer, servicer.wrap_server(self.server)
+        )
+
+    def test_encoded_response_serializer(self):
+        serializer = self.server.handlers[f"{CONTROLLER_PATH}/Retrieve"].response_serializer
+        message = fakeapp_pb2.UnitTestModelResponse(id=1, title="title")
+
+        self.assertEqual(serializer(EncodedMessage(b"encoded")), b"encoded")
+        self.assertEqual(serializer(message), message.SerializeToString())
+
+    def test_other_actions_not_wrapped(self):
+        self.assertIs(
+            self.server.handlers[f"{CONTROLLER_PATH}/List"].response_serializer,
+            fakeapp_pb2.UnitTestModelListResponse.SerializeToString,
+        )
+
+    def test_server_not_wrapped_without_encoded_actions(self):
+        server = FakeServer()
+        servicer = SyncUnitTestModelService.as_servicer()
+
+        self.assertIs(servicer.wrap_server(server), server)
+
+
+class TestEncodedResponse(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.fake_grpc = EncodedFakeGRPC(
+            add_UnitTestModelControllerServicer_to_server,
+            EncodedUnitTestModelService.as_servicer(),
+        )
+        self.instance = UnitTestModel.objects.create(title="title", text="text")
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    def test_cached_response_sent_encoded(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelRetrieveRequest(id=self.instance.id)
+        response = grpc_stub.Retrieve(request=request)
+        self.assertIsInstance(response, fakeapp_pb2.UnitTestModelResponse)
+
+        with self.assertNumQueries(0):
+            encoded_response = grpc_stub.Retrieve(request=request)
+
+        self.assertIsInstance(encoded_response, EncodedMessage)
+        self.assertEqual(encoded_response.data, response.SerializeToString())
+        self.assertEqual(encoded_response.decode(), response)
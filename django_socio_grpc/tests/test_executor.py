@@ -0,0 +1,196 @@
+import asyncio
+import threading
+import time
+
+from django.db import connections
+from django.test import TestCase, override_settings
+
+from django_socio_grpc.metrics import metrics_registry
+from django_socio_grpc.utils.executor import (
+    POOL_EXECUTOR,
+    ConnectionsThreadPoolExecutor,
+    db_sync_to_async,
+    get_executor,
+    is_thread_sensitive,
+)
+
+from .benchmarks.utils import arun_benchmark, report
+
+
+def get_thread_name():
+    return threading.current_thread().name
+
+
+class TestThreadSensitiveSetting(TestCase):
+    def test_default_thread_sensitive(self):
+        self.assertTrue(is_thread_sensitive("queryset"))
+
+    @override_settings(GRPC_FRAMEWORK={"SYNC_TO_ASYNC_THREAD_SENSITIVE": False})
+    def test_thread_sensitive_disabled(self):
+        self.assertFalse(is_thread_sensitive("queryset"))
+        self.assertFalse(is_thread_sensitive("permissions"))
+
+    @override_settings(
+        GRPC_FRAMEWORK={
+            "SYNC_TO_ASYNC_THREAD_SENSITIVE": {"queryset": False, "filters": False}
+        }
+    )
+    def test_thread_sensitive_by_call_site(self):
+        self.assertFalse(is_thread_sensitive("queryset"))
+        self.assertFalse(is_thread_sensitive("filters"))
+        self.assertTrue(is_thread_sensitive("actions"))
+
+    def test_unknown_call_site(self):
+        with self.assertRaises(ValueError):
+            is_thread_sensitive("unknown")
+        # INFO - The connections are recycled in the thread-sensitive thread
+        with self.assertRaises(ValueError):
+            is_thread_sensitive("middlewares")
+
+
+class TestExecutor(TestCase):
+    async def test_thread_sensitive_call(self):
+        thread_name = await db_sync_to_async(get_thread_name, "queryset")()
+
+        self.assertFalse(thread_name.startswith("grpc-sync-to-async"))
+
+    @override_settings(
+        GRPC_FRAMEWORK={
+            "SYNC_TO_ASYNC_THREAD_SENSITIVE": {"queryset": False},
+            "SYNC_TO_ASYNC_MAX_WORKERS": 2,
+        }
+    )
+    async def test_pool_call(self):
+        thread_name = await db_sync_to_async(get_thread_name, "queryset")()
+
+        self.assertTrue(thread_name.startswith("grpc-sync-to-async"))
+        self.assertEqual(get_executor()._max_workers, 2)
+        self.assertFalse(
+            (await db_sync_to_async(get_thread_name, "actions")()).startswith(
+                "grpc-sync-to-async"
+            )
+        )
+
+    @override_settings(
+        GRPC_FRAMEWORK={
+            "SYNC_TO_ASYNC_THREAD_SENSITIVE": False,
+            "SYNC_TO_ASYNC_MAX_WORKERS": 2,
+        }
+    )
+    async def test_pool_runs_calls_concurrently(self):
+        # INFO - Both calls must run at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        await asyncio.gather(
+            db_sync_to_async(barrier.wait, "queryset")(),
+            db_sync_to_async(barrier.wait, "queryset")(),
+        )
+
+
+class TestConnectionsThreadPoolExecutor(TestCase):
+    def test_shutdown_closes_thread_connections(self):
+        executor = ConnectionsThreadPoolExecutor(max_workers=2)
+
+        def connect():
+            connections["default"].ensure_connection()
+            return connections["default"]
+
+        thread_connection = executor.submit(connect).result()
+        self.assertIsNotNone(thread_connection.connection)
+
+        executor.shutdown(close_connections=True)
+
+        self.assertIsNone(thread_connection.connection)
+
+    def test_initializer_called(self):
+        initialized = []
+        executor = ConnectionsThreadPoolExecutor(
+            max_workers=1, initializer=initialized.append, initargs=("thread",)
+        )
+
+        executor.submit(get_thread_name).result()
+        executor.shutdown(close_connections=True)
+
+        self.assertEqual(initialized, ["thread"])
+
+    def test_no_started_thread(self):
+        executor = ConnectionsThreadPoolExecutor(max_workers=3)
+
+        executor.shutdown(close_connections=True)
+
+
+@override_settings(
+    GRPC_FRAMEWORK={
+        "ENABLE_METRICS": True,
+        "SYNC_TO_ASYNC_THREAD_SENSITIVE": False,
+        "SYNC_TO_ASYNC_MAX_WORKERS": 1,
+    }
+)
+class TestExecutorMetrics(TestCase):
+    def setUp(self):
+        metrics_registry.clear()
+
+    async def test_executor_queue_depth(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_call():
+            started.set()
+            release.wait(5)
+
+        calls = asyncio.gather(
+            *(db_sync_to_async(blocking_call, "queryset")() for _ in range(3))
+        )
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        executor_metrics = metrics_registry.get_executor_metrics(POOL_EXECUTOR)
+
+        self.assertEqual(executor_metrics.snapshot()[:3], (2, 1, 0))
+
+        release.set()
+        await calls
+
+        pending, running, completed, wait_sum = executor_metrics.snapshot()
+        self.assertEqual((pending, running, completed), (0, 0, 3))
+        self.assertGreater(wait_sum, 0)
+        export = metrics_registry.export()
+        self.assertIn('grpc_server_sync_to_async_pending_calls{executor="pool"} 0', export)
+        self.assertIn('grpc_server_sync_to_async_calls_total{executor="pool"} 3', export)
+
+    async def test_cancelled_call_leaves_queue(self):
+        release = threading.Event()
+        running_call = asyncio.ensure_future(db_sync_to_async(release.wait, "queryset")(5))
+        queued_call = asyncio.ensure_future(db_sync_to_async(release.wait, "queryset")(5))
+        await asyncio.sleep(0.05)
+
+        queued_call.cancel()
+        await asyncio.gather(queued_call, return_exceptions=True)
+        release.set()
+        await running_call
+
+        executor_metrics = metrics_registry.get_executor_metrics(POOL_EXECUTOR)
+        self.assertEqual(executor_metrics.snapshot()[:3], (0, 0, 1))
+
+
+class TestExecutorBenchmark(TestCase):
+    CONCURRENT_CALLS = 8
+
+    async def run_concurrent_calls(self):
+        # INFO - Stands for queries waiting on the database
+        await asyncio.gather(
+            *(
+                db_sync_to_async(time.sleep, "queryset")(0.005)
+                for _ in range(self.CONCURRENT_CALLS)
+            )
+        )
+
+    async def test_benchmark_executors(self):
+        results = {"thread sensitive": await arun_benchmark(self.run_concurrent_calls, 5)}
+        with override_settings(
+            GRPC_FRAMEWORK={
+                "SYNC_TO_ASYNC_THREAD_SENSITIVE": False,
+                "SYNC_TO_ASYNC_MAX_WORKERS": self.CONCURRENT_CALLS,
+            }
+        ):
+            results["pool"] = await arun_benchmark(self.run_concurrent_calls, 5)
+
+        report(f"{self.CONCURRENT_CALLS} concurrent sync calls", results)
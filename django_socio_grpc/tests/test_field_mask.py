@@ -0,0 +1,178 @@
+from unittest import mock
+
+import grpc
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    RelatedFieldModelControllerStub,
+    UnitTestModelControllerStub,
+    add_RelatedFieldModelControllerServicer_to_server,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.models import ForeignModel, RelatedFieldModel, UnitTestModel
+from fakeapp.serializers import RelatedFieldModelSerializer
+from fakeapp.services.related_field_model_service import RelatedFieldModelService
+from fakeapp.services.sync_unit_test_model_service import SyncUnitTestModelService
+
+from django_socio_grpc.utils.field_mask import (
+    get_field_mask_only_fields,
+    parse_field_mask,
+)
+
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC, FakeGRPC
+
+
+class TestParseFieldMask(TestCase):
+    def test_parse_field_mask(self):
+        self.assertEqual(
+            parse_field_mask(["title", "foreign.name", "foreign.uuid"]),
+            {"title": {}, "foreign": {"name": {}, "uuid": {}}},
+        )
+
+    def test_parent_path_selects_whole_field(self):
+        self.assertEqual(parse_field_mask(["foreign.name", "foreign"]), {"foreign": {}})
+        self.assertEqual(parse_field_mask(["foreign", "foreign.name"]), {"foreign": {}})
+
+    def test_only_fields(self):
+        serializer = RelatedFieldModelSerializer()
+        self.assertEqual(
+            get_field_mask_only_fields(
+                RelatedFieldModel, serializer, {"foreign": {}, "many_many": {}}
+            ),
+            ["foreign", "uuid"],
+        )
+        # INFO - Unknown sources may read any column
+        self.assertIsNone(
+            get_field_mask_only_fields(
+                RelatedFieldModel, serializer, {"custom_field_name": {}}
+            )
+        )
+
+
+class TestFieldMask(TestCase):
+    def setUp(self):
+        self.fake_grpc = FakeGRPC(
+            add_UnitTestModelControllerServicer_to_server,
+            SyncUnitTestModelService.as_servicer(),
+        )
+        for idx in range(3):
+            UnitTestModel(title=f"title {idx}", text=f"text {idx}").save()
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    def test_list_field_mask(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = grpc_stub.List(
+                request=fakeapp_pb2.UnitTestModelListRequest(),
+                metadata=(("field_mask", "title"),),
+            )
+
+        self.assertEqual(len(response.results), 3)
+        self.assertEqual(response.results[0].title, "title 0")
+        self.assertFalse(response.results[0].HasField("text"))
+        self.assertFalse(response.results[0].id)
+        self.assertNotIn('"text"', queries[-1]["sql"])
+
+    def test_list_without_field_mask(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        response = grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        self.assertEqual(response.results[0].text, "text 0")
+        self.assertTrue(response.results[0].id)
+
+    def test_stream_field_mask(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        responses = list(
+            grpc_stub.Stream(
+                request=fakeapp_pb2.UnitTestModelStreamRequest(),
+                metadata=(("field_mask", "id,text"),),
+            )
+        )
+
+        self.assertEqual(
+            [response.text for response in responses], ["text 0", "text 1", "text 2"]
+        )
+        self.assertFalse(responses[0].title)
+
+    def test_retrieve_field_mask(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        instance = UnitTestModel.objects.first()
+
+        response = grpc_stub.Retrieve(
+            request=fakeapp_pb2.UnitTestModelRetrieveRequest(id=instance.id),
+            metadata=(("field_mask", "id"),),
+        )
+
+        self.assertEqual(response.id, instance.id)
+        self.assertFalse(response.title)
+
+    def test_update_ignore_field_mask(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        instance = UnitTestModel.objects.first()
+
+        response = grpc_stub.Update(
+            request=fakeapp_pb2.UnitTestModelRequest(
+                id=instance.id, title="new title", text="new text"
+            ),
+            metadata=(("field_mask", "id"),),
+        )
+
+        self.assertEqual(response.title, "new title")
+        instance.refresh_from_db()
+        self.assertEqual(instance.text, "new text")
+
+    def test_unknown_field_mask_path(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        with self.assertRaises(grpc.RpcError) as error:
+            grpc_stub.List(
+                request=fakeapp_pb2.UnitTestModelListRequest(),
+                metadata=(("field_mask", "title,unknown"),),
+            )
+
+        self.assertEqual(error.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+class TestAsyncFieldMask(TestCase):
+    def setUp(self):
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_RelatedFieldModelControllerServicer_to_server,
+            RelatedFieldModelService.as_servicer(),
+        )
+        RelatedFieldModel.objects.create(foreign=ForeignModel.objects.create(name="foreign"))
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def test_nested_field_mask(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(RelatedFieldModelControllerStub)
+
+        response = await grpc_stub.List(
+            request=fakeapp_pb2.RelatedFieldModelListRequest(),
+            metadata=(("field_mask", "foreign.name"),),
+        )
+
+        result = response.list_custom_field_name[0]
+        self.assertEqual(result.foreign.name, "foreign")
+        self.assertFalse(result.foreign.uuid)
+        self.assertFalse(result.custom_field_name)
+
+    @mock.patch.object(RelatedFieldModelService, "optimize_related_queries", True)
+    def test_related_queries_restricted_to_field_mask(self):
+        service = RelatedFieldModelService(
+            action="List", context=mock.Mock(field_mask=["foreign.name"])
+        )
+
+        queryset = service.get_queryset()
+
+        self.assertEqual(queryset.query.select_related, {"foreign": {}})
+        self.assertEqual(queryset._prefetch_related_lookups, ())
+        self.assertEqual(queryset.query.deferred_loading, ({"foreign", "uuid"}, False))
@@ -1,15 +1,55 @@
 import json
+from unittest import mock
 
 from django.test import TestCase, override_settings
+from django_filters.rest_framework import DjangoFilterBackend
 from fakeapp.grpc.fakeapp_pb2 import UnitTestModelListRequest
 from fakeapp.grpc.fakeapp_pb2_grpc import (
     UnitTestModelControllerStub,
     add_UnitTestModelControllerServicer_to_server,
 )
-from fakeapp.models import UnitTestModel
+from fakeapp.models import ForeignModel, UnitTestModel
 from fakeapp.services.unit_test_model_service import UnitTestModelService
+from grpc._cython.cygrpc import _Metadatum
+from rest_framework.filters import OrderingFilter, SearchFilter
 
-from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC
+from django_socio_grpc import generics
+from django_socio_grpc.request_transformer.grpc_internal_proxy import GRPCInternalProxyContext
+
+from .benchmarks.utils import report, run_benchmark
+from .grpc_test_utils.fake_grpc import FakeContext, FakeFullAIOGRPC
+
+
+class TextBackend:
+    stateless = True
+
+    def filter_queryset(self, context, queryset, view):
+        return queryset.exclude(text="excluded")
+
+
+class AsyncTextBackend:
+    stateless = True
+
+    async def filter_queryset(self, context, queryset, view):
+        return queryset.exclude(text="excluded")
+
+
+class StatefulBackend(TextBackend):
+    stateless = False
+
+
+class FilteringService(generics.GenericService):
+    queryset = UnitTestModel.objects.all().order_by("id")
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ["title", "text"]
+
+
+def get_service(service_class=FilteringService, filters=None):
+    context = FakeContext()
+    context._invocation_metadata.append(_Metadatum("filters", json.dumps(filters or {})))
+    service = service_class()
+    service.context = GRPCInternalProxyContext(context, "List")
+    return service
 
 
 @override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
@@ -49,3 +89,132 @@ class TestFiltering(TestCase):
         self.assertEqual(len(response.results), 2)
         # responses_as_list[0] is type of django_socio_grpc.tests.grpc_test_utils.unittest_pb2.Test
         self.assertEqual(response.results[0].title, "zzzz")
+
+
+class TestFilterPipeline(TestCase):
+    def setUp(self):
+        UnitTestModel.objects.create(title="kept", text="text")
+        UnitTestModel.objects.create(title="kept", text="excluded")
+        UnitTestModel.objects.create(title="other", text="text")
+
+    def test_backends_shared_by_requests(self):
+        with mock.patch.object(
+            FilteringService,
+            "filter_backends",
+            [DjangoFilterBackend, AsyncTextBackend, StatefulBackend],
+        ):
+            first_backends = get_service().get_filter_backends()
+            second_backends = get_service().get_filter_backends()
+
+        self.assertEqual([is_async for _, is_async in first_backends], [False, True, False])
+        self.assertIs(first_backends[0][0], second_backends[0][0])
+        self.assertIsInstance(first_backends[0][0], DjangoFilterBackend)
+        self.assertIs(first_backends[1][0], second_backends[1][0])
+        # INFO - The backends not stateless are instantiated by call
+        self.assertIsNot(first_backends[2][0], second_backends[2][0])
+
+    def test_backends_not_declared_stateless_instantiated_by_call(self):
+        class UndeclaredBackend:
+            def filter_queryset(self, context, queryset, view):
+                return queryset
+
+        class DjangoFilterSubclassBackend(DjangoFilterBackend):
+            pass
+
+        with mock.patch.object(
+            FilteringService,
+            "filter_backends",
+            [SearchFilter, OrderingFilter, UndeclaredBackend, DjangoFilterSubclassBackend],
+        ):
+            first_backends = get_service().get_filter_backends()
+            second_backends = get_service().get_filter_backends()
+
+        self.assertIs(first_backends[0][0], second_backends[0][0])
+        self.assertIs(first_backends[1][0], second_backends[1][0])
+        self.assertIsNot(first_backends[2][0], second_backends[2][0])
+        self.assertIsNot(first_backends[3][0], second_backends[3][0])
+
+    def test_pipeline_rebuilt_when_backends_change(self):
+        get_service().get_filter_backends()
+        with mock.patch.object(FilteringService, "filter_backends", [TextBackend]):
+            backends = get_service().get_filter_backends()
+
+        self.assertEqual(len(backends), 1)
+        self.assertIsInstance(backends[0][0], TextBackend)
+
+    def test_filterset_class_cached(self):
+        service = get_service()
+        backend = service.get_filter_backends()[0][0]
+
+        filterset_class = backend.get_filterset_class(service, service.get_queryset())
+
+        self.assertIs(
+            backend.get_filterset_class(get_service(), service.get_queryset()), filterset_class
+        )
+        with mock.patch.object(FilteringService, "filterset_fields", ["name"]):
+            self.assertEqual(
+                backend.get_filterset_class(service, ForeignModel.objects.all())._meta.model,
+                ForeignModel,
+            )
+        # INFO - The FilterSet classes are cached by queryset model
+        self.assertIs(
+            backend.get_filterset_class(service, service.get_queryset()), filterset_class
+        )
+        with mock.patch.object(FilteringService, "filterset_fields", ["title"]):
+            self.assertIsNot(
+                backend.get_filterset_class(service, service.get_queryset()), filterset_class
+            )
+
+    def test_filter_queryset(self):
+        with mock.patch.object(
+            FilteringService, "filter_backends", [DjangoFilterBackend, AsyncTextBackend]
+        ):
+            for _ in range(2):
+                service = get_service(filters={"title": "kept"})
+                queryset = service.filter_queryset(service.get_queryset())
+
+                self.assertEqual(list(queryset.values_list("text", flat=True)), ["text"])
+
+    async def test_afilter_queryset(self):
+        with mock.patch.object(
+            FilteringService, "filter_backends", [DjangoFilterBackend, TextBackend]
+        ):
+            service = get_service(filters={"title": "kept"})
+            queryset = await service.afilter_queryset(service.get_queryset())
+
+            self.assertEqual([instance.text async for instance in queryset], ["text"])
+
+    def test_override_warning_logged_once(self):
+        class OverridingService(FilteringService):
+            async def afilter_queryset(self, queryset):
+                return queryset
+
+        with self.assertLogs("django_socio_grpc.services", "WARNING") as logs:
+            for _ in range(3):
+                service = get_service(OverridingService)
+                service.filter_queryset(service.get_queryset())
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("custom afilter_queryset", logs.records[0].getMessage())
+
+
+class TestFilterPipelineBenchmark(TestCase):
+    def filter_by_request(self):
+        # INFO - Backends instantiated and FilterSet class built for each request
+        service = get_service(filters={"title": "kept"})
+        queryset = service.get_queryset()
+        for backend in service.filter_backends:
+            queryset = backend().filter_queryset(service.context, queryset, service)
+
+    def filter_with_pipeline(self):
+        service = get_service(filters={"title": "kept"})
+        service.filter_queryset(service.get_queryset())
+
+    def test_benchmark_filter_pipeline(self):
+        report(
+            "filter_queryset with DjangoFilterBackend and filterset_fields",
+            {
+                "by request": run_benchmark(self.filter_by_request),
+                "compiled pipeline": run_benchmark(self.filter_with_pipeline),
+            },
+        )
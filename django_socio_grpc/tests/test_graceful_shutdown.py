@@ -0,0 +1,176 @@
+import asyncio
+import signal
+import threading
+import time
+from unittest import mock
+
+import grpc
+from django.test import TestCase, override_settings
+
+from django_socio_grpc.decorators import grpc_action
+from django_socio_grpc.management.commands import grpcrunaioserver, grpcrunserver
+from django_socio_grpc.services import Service
+from django_socio_grpc.services.servicer_proxy import in_flight_rpcs
+
+from .grpc_test_utils.fake_grpc import FakeContext, FakeServer
+
+
+class InFlightService(Service):
+    @grpc_action(request=[], response=[])
+    def Unary(self, request, context):
+        return in_flight_rpcs.count
+
+    @grpc_action(request=[], response=[], response_stream=True)
+    def Stream(self, request, context):
+        yield in_flight_rpcs.count
+        yield in_flight_rpcs.count
+
+
+InFlightService.register_actions()
+
+
+class AsyncInFlightService(Service):
+    @grpc_action(request=[], response=[])
+    async def Unary(self, request, context):
+        return in_flight_rpcs.count
+
+
+AsyncInFlightService.register_actions()
+
+
+def hold_rpc(duration):
+    """
+    Simulate an RPC in flight for `duration` seconds in another thread.
+    """
+    started = threading.Event()
+
+    def run():
+        with in_flight_rpcs:
+            started.set()
+            time.sleep(duration)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    started.wait()
+    return thread
+
+
+class TestInFlightRPCs(TestCase):
+    def test_unary_rpc_counted(self):
+        servicer = InFlightService.as_servicer()
+
+        with mock.patch.object(
+            servicer,
+            "_middleware_chain",
+            lambda r: mock.Mock(grpc_response=r.service.Unary(None, None)),
+        ):
+            self.assertEqual(servicer.Unary(None, FakeContext()), 1)
+        self.assertEqual(in_flight_rpcs.count, 0)
+
+    def test_stream_rpc_counted_until_exhausted(self):
+        servicer = InFlightService.as_servicer()
+
+        with mock.patch.object(
+            servicer,
+            "_middleware_chain",
+            lambda r: (
+                mock.Mock(grpc_response=count) for count in r.service.Stream(None, None)
+            ),
+        ):
+            self.assertEqual(list(servicer.Stream(None, FakeContext())), [1, 1])
+        self.assertEqual(in_flight_rpcs.count, 0)
+
+    @override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+    async def test_async_rpc_counted(self):
+        servicer = AsyncInFlightService.as_servicer()
+
+        async def middleware_chain(request_container):
+            return mock.Mock(grpc_response=await request_container.service.Unary(None, None))
+
+        with mock.patch.object(servicer, "_middleware_chain", middleware_chain):
+            self.assertEqual(await servicer.Unary(None, FakeContext()), 1)
+        self.assertEqual(in_flight_rpcs.count, 0)
+
+    def test_counted_on_error(self):
+        servicer = InFlightService.as_servicer()
+
+        with mock.patch.object(
+            servicer, "_middleware_chain", side_effect=Exception
+        ), self.assertRaises(grpc.RpcError):
+            servicer.Unary(None, FakeContext())
+        self.assertEqual(in_flight_rpcs.count, 0)
+
+    def test_wait(self):
+        self.assertTrue(in_flight_rpcs.wait(0))
+
+        thread = hold_rpc(0.1)
+        self.assertFalse(in_flight_rpcs.wait(0))
+        self.assertTrue(in_flight_rpcs.wait(5))
+        thread.join()
+
+
+@mock.patch("django_socio_grpc.management.commands.grpcrunserver.connections")
+class TestGrpcRunServerShutdown(TestCase):
+    def get_command(self, grace_period):
+        command = grpcrunserver.Command()
+        command.grace_period = grace_period
+        return command
+
+    def test_shutdown_waits_in_flight_rpcs(self, connections_mock):
+        server = FakeServer()
+        thread = hold_rpc(0.1)
+
+        with mock.patch.object(server, "stop", wraps=server.stop) as stop_mock:
+            self.get_command(5).shutdown(server)
+
+        stop_mock.assert_called_once_with(5)
+        self.assertEqual(in_flight_rpcs.count, 0)
+        connections_mock.close_all.assert_called_once_with()
+        thread.join()
+
+    def test_shutdown_closes_executor_connections(self, connections_mock):
+        command = self.get_command(5)
+        command.executor = mock.Mock()
+
+        command.shutdown(FakeServer())
+
+        connections_mock.close_all.assert_called_once_with()
+        command.executor.shutdown.assert_called_once_with(close_connections=True)
+
+    def test_shutdown_grace_period_exceeded(self, connections_mock):
+        thread = hold_rpc(0.2)
+
+        with self.assertLogs("django_socio_grpc.internal", level="WARNING") as logs:
+            self.get_command(0.01).shutdown(FakeServer())
+
+        self.assertIn("1 RPCs still in flight after 0.01s", logs.output[0])
+        connections_mock.close_all.assert_called_once_with()
+        thread.join()
+
+
+@mock.patch("django_socio_grpc.management.commands.grpcrunaioserver.connections")
+class TestGrpcRunAioServerShutdown(TestCase):
+    def get_command(self, grace_period):
+        command = grpcrunaioserver.Command()
+        command.grace_period = grace_period
+        return command
+
+    def test_shutdown_waits_in_flight_rpcs(self, connections_mock):
+        server = mock.Mock(stop=mock.AsyncMock())
+        thread = hold_rpc(0.1)
+
+        asyncio.run(self.get_command(5).shutdown(server))
+
+        server.stop.assert_awaited_once_with(5)
+        self.assertEqual(in_flight_rpcs.count, 0)
+        connections_mock.close_all.assert_called_once_with()
+        thread.join()
+
+    def test_stop_signal(self, connections_mock):
+        async def serve():
+            wait_task = asyncio.create_task(self.get_command(5).wait_for_stop_signal())
+            await asyncio.sleep(0)
+            signal.raise_signal(signal.SIGTERM)
+            await asyncio.wait_for(wait_task, 5)
+
+        asyncio.run(serve())
@@ -0,0 +1,104 @@
+import json
+from unittest import mock
+
+from django.test import TestCase
+from grpc._cython.cygrpc import _Metadatum
+
+from django_socio_grpc.request_transformer.grpc_internal_proxy import GRPCInternalProxyContext
+from django_socio_grpc.services import Service
+from django_socio_grpc.tests.grpc_test_utils.fake_grpc import FakeContext
+
+from .benchmarks.utils import report, run_benchmark
+
+
+class DummyService(Service):
+    def DummyMethod(service, request, context):
+        pass
+
+
+def get_fake_context():
+    context = FakeContext()
+    metadata = (
+        ("headers", json.dumps({"Authorization": "faketoken"})),
+        ("filters", json.dumps({"title": "zzz"})),
+        ("pagination", json.dumps({"page_size": 3})),
+        ("custom", "value"),
+    )
+    context._invocation_metadata.extend(_Metadatum(k, v) for k, v in metadata)
+    return context
+
+
+class TestGRPCInternalProxyContext(TestCase):
+    def test_http_request_built_only_when_needed(self):
+        proxy_context = GRPCInternalProxyContext(get_fake_context(), "List")
+
+        proxy_context.invocation_metadata()
+        self.assertNotIn("http_request", proxy_context.__dict__)
+
+        proxy_context.META
+        self.assertIn("http_request", proxy_context.__dict__)
+
+    def test_metadata_parsed_when_needed(self):
+        proxy_context = GRPCInternalProxyContext(get_fake_context(), "List")
+
+        self.assertEqual(proxy_context.method, "GET")
+        self.assertEqual(proxy_context.http_request._parsed_metadata, {})
+
+        self.assertEqual(proxy_context.query_params["page_size"], 3)
+        self.assertEqual(
+            set(proxy_context.http_request._parsed_metadata), {"FILTERS", "PAGINATION"}
+        )
+
+    def test_metadata_parsed_once(self):
+        proxy_context = GRPCInternalProxyContext(get_fake_context(), "List")
+        with mock.patch(
+            "django_socio_grpc.request_transformer.socio_internal_request.json.loads",
+            wraps=json.loads,
+        ) as loads_mock:
+            for _ in range(2):
+                proxy_context.headers
+                proxy_context.META
+                proxy_context.query_params
+                proxy_context.GET
+                proxy_context.get_from_metadata("FILTERS")
+
+        self.assertEqual(loads_mock.call_count, 3)
+
+    def test_metadata_values(self):
+        proxy_context = GRPCInternalProxyContext(get_fake_context(), "List")
+
+        self.assertEqual(proxy_context.grpc_request_metadata, {"CUSTOM": "value"})
+        self.assertEqual(
+            proxy_context.headers, {"CUSTOM": "value", "Authorization": "faketoken"}
+        )
+        self.assertEqual(
+            proxy_context.META, {"CUSTOM": "value", "HTTP_AUTHORIZATION": "faketoken"}
+        )
+        self.assertEqual(
+            proxy_context.query_params, {"CUSTOM": "value", "title": "zzz", "page_size": 3}
+        )
+        self.assertIs(proxy_context.GET, proxy_context.query_params)
+
+    def test_benchmark_rpc_overhead(self):
+        servicer = DummyService.as_servicer()
+        context = get_fake_context()
+
+        def proxy_context_untouched():
+            GRPCInternalProxyContext(context, "List")
+
+        def proxy_context_all_attributes():
+            proxy_context = GRPCInternalProxyContext(context, "List")
+            proxy_context.META
+            proxy_context.query_params
+
+        def unary_rpc():
+            servicer.DummyMethod(None, context)
+
+        report(
+            "GRPCInternalProxyContext per RPC overhead",
+            {
+                "proxy context untouched": run_benchmark(proxy_context_untouched),
+                "proxy context all attributes": run_benchmark(proxy_context_all_attributes),
+                "unary RPC": run_benchmark(unary_rpc),
+            },
+        )
@@ -0,0 +1,197 @@
+import asyncio
+import importlib.util
+import signal
+from unittest import mock
+
+import grpc
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase, override_settings
+from google.protobuf import wrappers_pb2
+
+from django_socio_grpc.decorators import grpc_action
+from django_socio_grpc.management.commands.grpcrunaioserver import Command
+from django_socio_grpc.services import Service
+from django_socio_grpc.utils.event_loop import EVENT_LOOPS, get_event_loop_policy
+
+from .benchmarks.utils import BENCHMARK_ITERATIONS, arun_benchmark, report
+
+
+class TestGrpcRunAioServerWorkers(TestCase):
+    def get_command(self, workers):
+        command = Command()
+        command.address = "[::]:50051"
+        command.workers = workers
+        return command
+
+    def test_server_options(self):
+        self.assertEqual(self.get_command(1).get_server_options(), [])
+        self.assertIn(("grpc.so_reuseport", 1), self.get_command(4).get_server_options())
+
+    def test_workers_not_allowed_in_dev_mode(self):
+        with self.assertRaises(CommandError):
+            Command().handle(
+                address="[::]:50051",
+                development_mode=True,
+                max_workers=10,
+                workers=2,
+                grace_period=10,
+            )
+
+    @mock.patch("django_socio_grpc.management.commands.grpcrunaioserver.connections")
+    @mock.patch("django_socio_grpc.management.commands.grpcrunaioserver.time.sleep")
+    @mock.patch("django_socio_grpc.management.commands.grpcrunaioserver.signal.signal")
+    @mock.patch("django_socio_grpc.management.commands.grpcrunaioserver.os.kill")
+    def test_supervision(self, kill_mock, signal_mock, sleep_mock, connections_mock):
+        command = self.get_command(2)
+
+        def stop_and_wait():
+            command.stop_workers(signal.SIGTERM, None)
+            return (102, 0)
+
+        wait_results = iter([lambda: (101, 256), stop_and_wait, lambda: (103, 0)])
+
+        with mock.patch(
+            "django_socio_grpc.management.commands.grpcrunaioserver.os.fork",
+            side_effect=[101, 102, 103],
+        ) as fork_mock, mock.patch(
+            "django_socio_grpc.management.commands.grpcrunaioserver.os.wait",
+            side_effect=lambda: next(wait_results)(),
+        ):
+            command.run_workers()
+
+        # INFO - The crashed worker 101 is restarted, none is restarted once stopping
+        self.assertEqual(fork_mock.call_count, 3)
+        self.assertEqual(
+            kill_mock.call_args_list,
+            [mock.call(102, signal.SIGTERM), mock.call(103, signal.SIGTERM)],
+        )
+        self.assertEqual(command.worker_pids, {})
+        connections_mock.close_all.assert_called_once_with()
+
+
+class TestEventLoopOption(SimpleTestCase):
+    def test_loop_option(self):
+        parser = Command().create_parser("manage.py", "grpcrunaioserver")
+
+        self.assertEqual(parser.parse_args([]).loop, "asyncio")
+        self.assertEqual(parser.parse_args(["--loop", "uvloop"]).loop, "uvloop")
+
+    @mock.patch("django_socio_grpc.management.commands.grpcrunaioserver.asyncio.run")
+    @mock.patch(
+        "django_socio_grpc.management.commands.grpcrunaioserver.install_event_loop_policy"
+    )
+    def test_policy_installed_before_running(self, install_mock, run_mock):
+        run_mock.side_effect = lambda coroutine: coroutine.close()
+
+        Command().handle(
+            address="[::]:50051",
+            development_mode=False,
+            max_workers=10,
+            workers=1,
+            grace_period=10,
+            loop="uvloop",
+        )
+
+        install_mock.assert_called_once_with("uvloop")
+        run_mock.assert_called_once()
+
+    def test_asyncio_policy(self):
+        self.assertIsInstance(get_event_loop_policy("asyncio"), asyncio.DefaultEventLoopPolicy)
+
+    def test_uvloop_fallback(self):
+        with mock.patch.dict("sys.modules", {"uvloop": None}), self.assertLogs(
+            "django_socio_grpc.internal", "WARNING"
+        ):
+            policy = get_event_loop_policy("uvloop")
+
+        self.assertIsInstance(policy, asyncio.DefaultEventLoopPolicy)
+
+    def test_unknown_loop(self):
+        with self.assertRaises(ValueError):
+            get_event_loop_policy("trio")
+
+
+STREAM_MESSAGES = 100
+
+
+class EchoService(Service):
+    @grpc_action(request=[], response=[])
+    async def Unary(self, request, context):
+        return request
+
+    @grpc_action(request=[], response=[], response_stream=True)
+    async def Stream(self, request, context):
+        for _ in range(STREAM_MESSAGES):
+            yield request
+
+
+def add_echo_servicer_to_server(servicer, server):
+    method_handlers = {
+        "Unary": grpc.unary_unary_rpc_method_handler(
+            servicer.Unary,
+            request_deserializer=wrappers_pb2.StringValue.FromString,
+            response_serializer=wrappers_pb2.StringValue.SerializeToString,
+        ),
+        "Stream": grpc.unary_stream_rpc_method_handler(
+            servicer.Stream,
+            request_deserializer=wrappers_pb2.StringValue.FromString,
+            response_serializer=wrappers_pb2.StringValue.SerializeToString,
+        ),
+    }
+    server.add_generic_rpc_handlers(
+        (grpc.method_handlers_generic_handler("benchmark.Echo", method_handlers),)
+    )
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True, "GRPC_MIDDLEWARE": []})
+class TestEventLoopBenchmark(SimpleTestCase):
+    async def run_server_benchmark(self):
+        server = grpc.aio.server()
+        add_echo_servicer_to_server(EchoService.as_servicer(), server)
+        port = server.add_insecure_port("localhost:0")
+        await server.start()
+        try:
+            async with grpc.aio.insecure_channel(f"localhost:{port}") as channel:
+                unary = channel.unary_unary(
+                    "/benchmark.Echo/Unary",
+                    request_serializer=wrappers_pb2.StringValue.SerializeToString,
+                    response_deserializer=wrappers_pb2.StringValue.FromString,
+                )
+                stream = channel.unary_stream(
+                    "/benchmark.Echo/Stream",
+                    request_serializer=wrappers_pb2.StringValue.SerializeToString,
+                    response_deserializer=wrappers_pb2.StringValue.FromString,
+                )
+                request = wrappers_pb2.StringValue(value="benchmark")
+
+                async def unary_rpc():
+                    self.assertEqual(await unary(request), request)
+
+                async def stream_rpc():
+                    self.assertEqual(
+                        len([message async for message in stream(request)]), STREAM_MESSAGES
+                    )
+
+                # INFO - Warm up the channel before measuring
+                await unary_rpc()
+                return {
+                    "unary": await arun_benchmark(unary_rpc, BENCHMARK_ITERATIONS * 10),
+                    f"stream ({STREAM_MESSAGES} messages)": await arun_benchmark(stream_rpc),
+                }
+        finally:
+            await server.stop(None)
+
+    def test_benchmark_event_loops(self):
+        results = {}
+        for event_loop in EVENT_LOOPS:
+            if event_loop != "asyncio" and importlib.util.find_spec(event_loop) is None:
+                continue
+            loop = get_event_loop_policy(event_loop).new_event_loop()
+            try:
+                timings = loop.run_until_complete(self.run_server_benchmark())
+            finally:
+                loop.close()
+            for name, timing in timings.items():
+                results[f"{event_loop} {name}"] = timing
+
+        report("Async server RPC latency by event loop", results)
@@ -0,0 +1,209 @@
+import asyncio
+import urllib.request
+
+import grpc
+from django.test import TestCase, override_settings
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    UnitTestModelControllerStub,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.models import UnitTestModel
+from fakeapp.services.sync_unit_test_model_service import SyncUnitTestModelService
+from fakeapp.services.unit_test_model_service import UnitTestModelService
+from google.protobuf import empty_pb2
+
+from django_socio_grpc.decorators import grpc_action
+from django_socio_grpc.metrics import (
+    add_metrics_handler_to_server,
+    metrics_registry,
+    start_metrics_http_server,
+)
+from django_socio_grpc.services import Service
+
+from .benchmarks.utils import report, run_benchmark
+from .grpc_test_utils.fake_grpc import FakeContext, FakeFullAIOGRPC, FakeGRPC, FakeServer
+
+
+class DummyService(Service):
+    @grpc_action(request=[], response=[])
+    def DummyMethod(service, request, context):
+        return "result"
+
+
+DummyService.register_actions()
+
+
+class SlowService(Service):
+    @grpc_action(request=[], response=[])
+    async def Slow(service, request, context):
+        await asyncio.sleep(10)
+
+
+SlowService.register_actions()
+
+
+@override_settings(GRPC_FRAMEWORK={"ENABLE_METRICS": True})
+class TestMetrics(TestCase):
+    def setUp(self):
+        metrics_registry.clear()
+        self.fake_grpc = FakeGRPC(
+            add_UnitTestModelControllerServicer_to_server,
+            SyncUnitTestModelService.as_servicer(),
+        )
+        for idx in range(3):
+            UnitTestModel(title=f"title {idx}", text="text").save()
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    def get_action_metrics(self, action):
+        return metrics_registry.actions[("SyncUnitTestModel", action)]
+
+    def test_actions_recorded(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+        grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+        with self.assertRaises(grpc.RpcError):
+            grpc_stub.Retrieve(request=fakeapp_pb2.UnitTestModelRetrieveRequest(id=0))
+
+        (
+            handled,
+            in_flight,
+            messages_sent,
+            bucket_counts,
+            latency_sum,
+        ) = self.get_action_metrics("List").snapshot()
+        self.assertEqual(handled, {"OK": 2})
+        self.assertEqual(in_flight, 0)
+        self.assertEqual(messages_sent, 2)
+        self.assertEqual(sum(bucket_counts), 2)
+        self.assertGreater(latency_sum, 0)
+
+        handled, _, messages_sent, _, _ = self.get_action_metrics("Retrieve").snapshot()
+        self.assertEqual(handled, {"NOT_FOUND": 1})
+        self.assertEqual(messages_sent, 0)
+
+    def test_stream_messages_recorded(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        list(grpc_stub.Stream(request=fakeapp_pb2.UnitTestModelStreamRequest()))
+
+        handled, _, messages_sent, _, _ = self.get_action_metrics("Stream").snapshot()
+        self.assertEqual(handled, {"OK": 1})
+        self.assertEqual(messages_sent, 3)
+
+    def test_cancelled_stream_recorded(self):
+        servicer = SyncUnitTestModelService.as_servicer()
+        stream = servicer.Stream(fakeapp_pb2.UnitTestModelStreamRequest(), FakeContext())
+        next(stream)
+        # INFO - As grpc when the client cancels the RPC
+        stream.close()
+
+        handled, in_flight, messages_sent, _, _ = self.get_action_metrics("Stream").snapshot()
+        self.assertEqual(handled, {"CANCELLED": 1})
+        self.assertEqual(in_flight, 0)
+        self.assertEqual(messages_sent, 1)
+
+    def test_export(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        export = metrics_registry.export()
+        labels = 'grpc_service="SyncUnitTestModel",grpc_method="List"'
+        self.assertIn("# TYPE grpc_server_handled_total counter", export)
+        self.assertIn(f'grpc_server_handled_total{{{labels},grpc_code="OK"}} 1', export)
+        self.assertIn(f"grpc_server_in_flight_rpcs{{{labels}}} 0", export)
+        self.assertIn(f"grpc_server_msg_sent_total{{{labels}}} 1", export)
+        self.assertIn(f'grpc_server_handling_seconds_bucket{{{labels},le="+Inf"}} 1', export)
+        self.assertIn(f"grpc_server_handling_seconds_count{{{labels}}} 1", export)
+
+    def test_http_export(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        http_server = start_metrics_http_server(0)
+        try:
+            # INFO - The metrics are only served locally by default
+            self.assertEqual(http_server.server_address[0], "127.0.0.1")
+            url = f"http://127.0.0.1:{http_server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url) as response:
+                self.assertEqual(response.headers["Content-Type"].split(";")[0], "text/plain")
+                self.assertEqual(response.read().decode(), metrics_registry.export())
+        finally:
+            http_server.shutdown()
+            http_server.server_close()
+
+    def test_grpc_export(self):
+        server = FakeServer()
+        add_metrics_handler_to_server(server)
+
+        handler = server.handlers["/django_socio_grpc.Metrics/Export"]
+        response = handler.unary_unary(empty_pb2.Empty(), None)
+
+        self.assertEqual(response.value, metrics_registry.export())
+
+    @override_settings(GRPC_FRAMEWORK={"ENABLE_METRICS": False})
+    def test_disabled(self):
+        metrics_registry.clear()
+        fake_grpc = FakeGRPC(
+            add_UnitTestModelControllerServicer_to_server,
+            SyncUnitTestModelService.as_servicer(),
+        )
+        grpc_stub = fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+        fake_grpc.close()
+
+        self.assertEqual(metrics_registry.actions, {})
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True, "ENABLE_METRICS": True})
+class TestAsyncMetrics(TestCase):
+    def setUp(self):
+        metrics_registry.clear()
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server, UnitTestModelService.as_servicer()
+        )
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def test_async_action_recorded(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        await grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        handled, in_flight, messages_sent, _, _ = metrics_registry.actions[
+            ("UnitTestModel", "List")
+        ].snapshot()
+        self.assertEqual(handled, {"OK": 1})
+        self.assertEqual(in_flight, 0)
+        self.assertEqual(messages_sent, 1)
+
+    async def test_async_cancelled_rpc_recorded(self):
+        servicer = SlowService.as_servicer()
+        rpc = asyncio.ensure_future(servicer.Slow(None, FakeContext()))
+        await asyncio.sleep(0.05)
+        # INFO - As grpc when the client cancels the RPC
+        rpc.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await rpc
+
+        handled, in_flight, messages_sent, _, _ = metrics_registry.actions[
+            ("SlowService", "Slow")
+        ].snapshot()
+        self.assertEqual(handled, {"CANCELLED": 1})
+        self.assertEqual(in_flight, 0)
+        self.assertEqual(messages_sent, 0)
+
+
+class TestMetricsOverhead(TestCase):
+    def test_benchmark_metrics_overhead(self):
+        context = FakeContext()
+        timings = {}
+        for enable_metrics in (False, True):
+            with override_settings(GRPC_FRAMEWORK={"ENABLE_METRICS": enable_metrics}):
+                servicer = DummyService.as_servicer()
+                timings[
+                    f"unary RPC, metrics {'enabled' if enable_metrics else 'disabled'}"
+                ] = run_benchmark(lambda: servicer.DummyMethod(None, context))
+
+        report("Metrics per RPC overhead", timings)
@@ -0,0 +1,176 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    RelatedFieldModelControllerStub,
+    add_RelatedFieldModelControllerServicer_to_server,
+)
+from fakeapp.models import (
+    ForeignModel,
+    ManyManyModel,
+    RelatedFieldModel,
+    SlugReverseTestModel,
+    SlugTestModel,
+)
+from fakeapp.serializers import (
+    ForeignModelSerializer,
+    RecursiveTestModelSerializer,
+    RelatedFieldModelSerializer,
+)
+from fakeapp.services.related_field_model_service import RelatedFieldModelService
+from rest_framework import serializers
+
+from django_socio_grpc.utils.model_meta import get_serializer_related_paths
+
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC
+
+
+def create_related_field_models(count):
+    many_many = ManyManyModel.objects.create(name="many")
+    for idx in range(count):
+        instance = RelatedFieldModel.objects.create(
+            foreign=ForeignModel.objects.create(name=f"foreign {idx}"),
+            slug_test_model=SlugTestModel.objects.create(special_number=idx),
+        )
+        instance.many_many.add(many_many)
+        instance.slug_many_many.add(many_many)
+        SlugReverseTestModel.objects.create(related_field=instance, is_active=True)
+
+
+class TestSerializerRelatedPaths(TestCase):
+    def test_related_paths(self):
+        self.assertEqual(
+            get_serializer_related_paths(RelatedFieldModelSerializer),
+            (
+                ("foreign", "slug_test_model"),
+                (
+                    "many_many",
+                    "many_many_foreigns",
+                    "slug_many_many",
+                    "slug_reverse_test_model",
+                ),
+            ),
+        )
+
+    def test_recursive_serializer(self):
+        self.assertEqual(
+            get_serializer_related_paths(RecursiveTestModelSerializer),
+            (("parent",), ("children",)),
+        )
+
+    def test_no_relation(self):
+        self.assertEqual(get_serializer_related_paths(ForeignModelSerializer), ((), ()))
+
+    def test_serializer_depending_on_context(self):
+        self.assertEqual(
+            get_serializer_related_paths(ContextRelatedFieldModelSerializer), ((), ())
+        )
+
+    def test_nested_serializer_depending_on_context(self):
+        self.assertEqual(get_serializer_related_paths(NestedContextSerializer), ((), ()))
+
+    def test_serializer_failing_without_context(self):
+        self.assertEqual(get_serializer_related_paths(FailingSerializer), ((), ()))
+
+
+class ContextForeignModelSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ForeignModel
+        fields = ["uuid", "name"]
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.context["request"].user.is_staff:
+            fields.pop("name")
+        return fields
+
+
+class ContextRelatedFieldModelSerializer(serializers.ModelSerializer):
+    foreign = ContextForeignModelSerializer()
+
+    class Meta:
+        model = RelatedFieldModel
+        fields = ["uuid", "foreign"]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user = self.context["request"].user
+
+
+class NestedContextSerializer(serializers.ModelSerializer):
+    foreign = ContextForeignModelSerializer()
+
+    class Meta:
+        model = RelatedFieldModel
+        fields = ["uuid", "foreign"]
+
+
+class FailingSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = RelatedFieldModel
+        fields = ["not_a_field"]
+
+
+class TestOptimizeRelatedQueries(TestCase):
+    def count_list_queries(self):
+        service = RelatedFieldModelService(action="List")
+        with CaptureQueriesContext(connection) as queries:
+            RelatedFieldModelSerializer(service.get_queryset(), many=True).message
+        return len(queries)
+
+    def test_queries_not_optimized_by_default(self):
+        create_related_field_models(2)
+        queries_for_two = self.count_list_queries()
+        create_related_field_models(3)
+
+        self.assertGreater(self.count_list_queries(), queries_for_two)
+
+    @mock.patch.object(RelatedFieldModelService, "optimize_related_queries", True)
+    def test_constant_number_of_queries(self):
+        create_related_field_models(2)
+        queries_for_two = self.count_list_queries()
+        create_related_field_models(3)
+
+        self.assertEqual(self.count_list_queries(), queries_for_two)
+        # INFO - One query for the instances and their foreign keys, one by prefetched relation
+        self.assertEqual(queries_for_two, 5)
+
+    @mock.patch.object(RelatedFieldModelService, "optimize_related_queries", True)
+    def test_other_model_serializer_not_applied(self):
+        service = RelatedFieldModelService(action="List")
+        with mock.patch.object(
+            RelatedFieldModelService,
+            "get_serializer_class",
+            return_value=ForeignModelSerializer,
+        ):
+            queryset = service.get_queryset()
+
+        self.assertEqual(queryset.query.select_related, False)
+        self.assertEqual(queryset._prefetch_related_lookups, ())
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+@mock.patch.object(RelatedFieldModelService, "optimize_related_queries", True)
+class TestAsyncOptimizeRelatedQueries(TestCase):
+    def setUp(self):
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_RelatedFieldModelControllerServicer_to_server,
+            RelatedFieldModelService.as_servicer(),
+        )
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def test_async_list(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(RelatedFieldModelControllerStub)
+        request = fakeapp_pb2.RelatedFieldModelListRequest()
+
+        await RelatedFieldModelService.queryset.acreate(
+            foreign=await ForeignModel.objects.acreate(name="foreign")
+        )
+        response = await grpc_stub.List(request=request)
+
+        self.assertEqual(response.list_custom_field_name[0].foreign.name, "foreign")
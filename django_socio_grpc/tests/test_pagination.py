@@ -1,17 +1,29 @@
+import base64
 import json
+from unittest import mock
 
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.query import QuerySet
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from fakeapp.grpc.fakeapp_pb2 import UnitTestModelListRequest
 from fakeapp.grpc.fakeapp_pb2_grpc import (
     UnitTestModelControllerStub,
     add_UnitTestModelControllerServicer_to_server,
 )
-from fakeapp.models import UnitTestModel
+from fakeapp.models import ForeignModel, RelatedFieldModel, UnitTestModel
 from fakeapp.serializers import UnitTestModelSerializer
 from fakeapp.services.unit_test_model_service import UnitTestModelService
 from rest_framework.pagination import PageNumberPagination
 
-from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC
+from django_socio_grpc.decorators import grpc_action
+from django_socio_grpc.exceptions import InvalidArgument
+from django_socio_grpc.pagination import CountStrategy, KeysetPagination
+from django_socio_grpc.request_transformer.grpc_internal_proxy import GRPCInternalProxyContext
+from django_socio_grpc.services import Service
+
+from .grpc_test_utils.fake_grpc import FakeContext, FakeFullAIOGRPC
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -58,3 +70,256 @@ class TestPagination(TestCase):
 
         self.assertEqual(response.count, 10)
         self.assertEqual(len(response.results), 6)
+
+
+class UnitTestModelKeysetPagination(KeysetPagination):
+    page_size = 3
+    ordering = ("-title",)
+
+
+class UnitTestModelServiceWithKeysetPagination(UnitTestModelService):
+    queryset = UnitTestModel.objects.all()
+    serializer_class = UnitTestModelSerializer
+    pagination_class = UnitTestModelKeysetPagination
+
+
+def get_proxy_context(pagination_as_dict):
+    context = FakeContext()
+    context._invocation_metadata = [("PAGINATION", json.dumps(pagination_as_dict))]
+    return GRPCInternalProxyContext(context, "List")
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+class TestKeysetPagination(TestCase):
+    def setUp(self):
+        for idx in range(10):
+            # INFO - Titles are duplicated to check the primary key is used to break ties
+            UnitTestModel(title="z" * (idx // 2 + 1), text="abc").save()
+        self.expected_ids = list(
+            UnitTestModel.objects.order_by("-title", "pk").values_list("id", flat=True)
+        )
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server,
+            UnitTestModelServiceWithKeysetPagination.as_servicer(),
+        )
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    def test_walk_all_pages(self):
+        ids = []
+        cursor = ""
+        with self.assertNumQueries(4):
+            while True:
+                paginator = UnitTestModelKeysetPagination()
+                page = paginator.paginate_queryset(
+                    UnitTestModel.objects.all(), get_proxy_context({"cursor": cursor})
+                )
+                ids += [instance.id for instance in page]
+                cursor = paginator.next_cursor
+                if not cursor:
+                    break
+        self.assertEqual(ids, self.expected_ids)
+
+    def test_page_size_from_metadata(self):
+        paginator = UnitTestModelKeysetPagination()
+        page = paginator.paginate_queryset(
+            UnitTestModel.objects.all(), get_proxy_context({"page_size": 10})
+        )
+        self.assertEqual([instance.id for instance in page], self.expected_ids)
+        self.assertIsNone(paginator.next_cursor)
+
+    def test_invalid_cursor(self):
+        paginator = UnitTestModelKeysetPagination()
+        with self.assertRaises(InvalidArgument):
+            paginator.paginate_queryset(
+                UnitTestModel.objects.all(), get_proxy_context({"cursor": "not a cursor"})
+            )
+
+    def test_invalid_cursor_values(self):
+        for values in (["zzz", "not an id"], [{"title": "zzz"}, 1], ["zzz", [1]]):
+            cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+            paginator = UnitTestModelKeysetPagination()
+            with self.assertRaises(InvalidArgument):
+                paginator.paginate_queryset(
+                    UnitTestModel.objects.all(), get_proxy_context({"cursor": cursor})
+                )
+
+    def test_cursor_not_a_string(self):
+        for cursor in (5, ["cursor"], {"cursor": "value"}):
+            paginator = UnitTestModelKeysetPagination()
+            with self.assertRaises(InvalidArgument):
+                paginator.paginate_queryset(
+                    UnitTestModel.objects.all(), get_proxy_context({"cursor": cursor})
+                )
+
+    def test_foreign_key_ordering(self):
+        foreigns = [ForeignModel.objects.create(name=f"foreign {idx}") for idx in range(2)]
+        for idx in range(5):
+            RelatedFieldModel.objects.create(foreign=foreigns[idx % 2])
+        expected_ids = list(
+            RelatedFieldModel.objects.order_by("foreign_id", "pk").values_list("pk", flat=True)
+        )
+
+        class ForeignKeysetPagination(KeysetPagination):
+            page_size = 2
+            ordering = ("foreign",)
+
+        ids = []
+        cursor = ""
+        while True:
+            paginator = ForeignKeysetPagination()
+            page = paginator.paginate_queryset(
+                RelatedFieldModel.objects.all(), get_proxy_context({"cursor": cursor})
+            )
+            ids += [instance.pk for instance in page]
+            cursor = paginator.next_cursor
+            if not cursor:
+                break
+
+        self.assertEqual(paginator.ordering, ["foreign_id", "pk"])
+        self.assertEqual(ids, expected_ids)
+
+    def test_no_offset_no_count(self):
+        paginator = UnitTestModelKeysetPagination()
+        paginator.paginate_queryset(
+            UnitTestModel.objects.all(), get_proxy_context({"page_size": 6})
+        )
+        cursor = paginator.next_cursor
+        paginator = UnitTestModelKeysetPagination()
+        with CaptureQueriesContext(connection) as queries:
+            page = paginator.paginate_queryset(
+                UnitTestModel.objects.all(), get_proxy_context({"cursor": cursor})
+            )
+        self.assertEqual([instance.id for instance in page], self.expected_ids[6:9])
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("OFFSET", queries[0]["sql"])
+        self.assertNotIn("COUNT", queries[0]["sql"])
+
+    async def test_keyset_pagination_service(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        response = await grpc_stub.List(request=UnitTestModelListRequest())
+
+        self.assertEqual([result.id for result in response.results], self.expected_ids[:3])
+
+    async def test_async_keyset_pagination(self):
+        paginator = UnitTestModelKeysetPagination()
+        page = await paginator.apaginate_queryset(
+            UnitTestModel.objects.all(), get_proxy_context({"page_size": 4})
+        )
+
+        self.assertEqual([instance.id for instance in page], self.expected_ids[:4])
+        self.assertTrue(paginator.next_cursor)
+
+    @mock.patch.object(UnitTestModelServiceWithKeysetPagination, "async_orm", True)
+    async def test_keyset_pagination_service_async_orm(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        response = await grpc_stub.List(request=UnitTestModelListRequest())
+
+        self.assertEqual([result.id for result in response.results], self.expected_ids[:3])
+
+    def test_response_fields_registration(self):
+        class KeysetService(Service):
+            pagination_class = UnitTestModelKeysetPagination
+
+            @grpc_action(request=[], response=UnitTestModelSerializer, use_response_list=True)
+            async def List(self, request, context):
+                ...
+
+        proto_rpc = KeysetService.List.make_proto_rpc("List", KeysetService)
+
+        self.assertNotIn("count", proto_rpc.response)
+        self.assertEqual(proto_rpc.response["next_cursor"].field_type, "string")
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+class TestCountStrategy(TestCase):
+    def setUp(self):
+        cache.clear()
+        for idx in range(10):
+            UnitTestModel(title="z" * (idx + 1), text="abc").save()
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server,
+            UnitTestModelServiceWithDifferentPagination.as_servicer(),
+        )
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    def get_service(self, count_strategy):
+        service = UnitTestModelServiceWithDifferentPagination()
+        service.count_strategy = count_strategy
+        return service
+
+    async def list(self, count_strategy, page=1):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        metadata = (("PAGINATION", json.dumps({"page": page})),)
+        with mock.patch.object(
+            UnitTestModelServiceWithDifferentPagination, "count_strategy", count_strategy
+        ):
+            return await grpc_stub.List(request=UnitTestModelListRequest(), metadata=metadata)
+
+    async def test_exact_count(self):
+        response = await self.list(CountStrategy.EXACT)
+
+        self.assertEqual(response.count, 10)
+        self.assertEqual(len(response.results), 3)
+
+    async def test_no_count(self):
+        with mock.patch.object(QuerySet, "count") as count_mock:
+            response = await self.list(CountStrategy.NONE)
+
+        count_mock.assert_not_called()
+        self.assertEqual(response.count, 0)
+        self.assertEqual(len(response.results), 3)
+
+    async def test_last_page_without_count(self):
+        response = await self.list(CountStrategy.NONE, page=4)
+
+        self.assertEqual(len(response.results), 1)
+
+    async def test_cached_count(self):
+        response = await self.list(CountStrategy.CACHED)
+        self.assertEqual(response.count, 10)
+
+        await UnitTestModel.objects.acreate(title="new", text="abc")
+        with mock.patch.object(QuerySet, "count") as count_mock:
+            response = await self.list(CountStrategy.CACHED)
+
+        count_mock.assert_not_called()
+        self.assertEqual(response.count, 10)
+        self.assertEqual(len(response.results), 3)
+
+    def test_cached_count_keyed_by_filters(self):
+        service = self.get_service(CountStrategy.CACHED)
+        queryset = UnitTestModel.objects.all()
+
+        self.assertEqual(service.count_queryset(queryset), 10)
+        self.assertEqual(service.count_queryset(queryset.filter(title="z")), 1)
+        self.assertNotEqual(
+            service.get_count_cache_key(queryset),
+            service.get_count_cache_key(queryset.filter(title="z")),
+        )
+
+    def test_estimated_count(self):
+        service = self.get_service(CountStrategy.ESTIMATE)
+
+        with CaptureQueriesContext(connection) as queries:
+            count = service.count_queryset(UnitTestModel.objects.all())
+
+        self.assertIsInstance(count, int)
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0]["sql"].startswith("EXPLAIN"))
+
+    def test_count_field_registration(self):
+        class NoCountService(Service):
+            pagination_class = StandardResultsSetPagination
+            count_strategy = CountStrategy.NONE
+
+            @grpc_action(request=[], response=UnitTestModelSerializer, use_response_list=True)
+            async def List(self, request, context):
+                ...
+
+        proto_rpc = NoCountService.List.make_proto_rpc("List", NoCountService)
+
+        self.assertNotIn("count", [field.name for field in proto_rpc.response.fields])
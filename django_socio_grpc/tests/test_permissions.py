@@ -1,3 +1,5 @@
+import asyncio
+import time
 from unittest import mock
 
 import grpc
@@ -8,6 +10,7 @@ from django_socio_grpc.exceptions import PermissionDenied
 from django_socio_grpc.services import Service
 from django_socio_grpc.settings import grpc_settings
 from django_socio_grpc.tests.grpc_test_utils.fake_grpc import FakeContext
+from django_socio_grpc.utils.executor import db_sync_to_async
 
 
 class FakePermission:
@@ -33,6 +36,10 @@ def fake_create_service(self, **kwargs):
     return service
 
 
+class StatelessPermission(FakePermission):
+    stateless = True
+
+
 class TestPermissionUnitary(TestCase):
     @override_settings(
         GRPC_FRAMEWORK={
@@ -117,6 +124,57 @@ class TestPermissionUnitary(TestCase):
         self.assertEqual(len(returned_perms), 1)
         self.assertIsInstance(returned_perms[0], FakePermission)
 
+    def test_get_permissions_built_once(self):
+        class PermissionService(Service):
+            permission_classes = [StatelessPermission]
+
+        permissions = PermissionService().get_permissions()
+
+        self.assertIs(PermissionService().get_permissions()[0], permissions[0])
+        with mock.patch.object(
+            PermissionService, "permission_classes", [StatelessPermission] * 2
+        ):
+            self.assertEqual(len(PermissionService().get_permissions()), 2)
+
+    def test_get_permissions_of_instance_not_cached(self):
+        class PermissionService(Service):
+            permission_classes = [StatelessPermission]
+
+        permissions = PermissionService().get_permissions()
+        service = PermissionService()
+        service.permission_classes = [StatelessPermission] * 2
+
+        self.assertEqual(len(service.get_permissions()), 2)
+        self.assertIsNot(service.get_permissions()[0], permissions[0])
+        self.assertIs(PermissionService().get_permissions()[0], permissions[0])
+
+    def test_get_permissions_not_declared_stateless(self):
+        class PermissionService(Service):
+            permission_classes = [StatelessPermission, FakePermission]
+
+        permissions = PermissionService().get_permissions()
+        other_permissions = PermissionService().get_permissions()
+
+        self.assertIs(other_permissions[0], permissions[0])
+        self.assertIsInstance(other_permissions[1], FakePermission)
+        self.assertIsNot(other_permissions[1], permissions[1])
+
+    def test_permission_request_state_not_shared(self):
+        class OwnerPermission(FakePermission):
+            def has_object_permission(self, context, service, obj):
+                self.message = f"Not the owner of {obj}"
+                return False
+
+        class PermissionService(Service):
+            permission_classes = [OwnerPermission]
+
+        service = PermissionService()
+        service.context = FakeContext()
+        with self.assertRaises(PermissionDenied):
+            service.check_object_permissions("first_obj")
+
+        self.assertEqual(PermissionService().get_permissions()[0].message, "fake message")
+
     @mock.patch("django_socio_grpc.services.Service.perform_authentication", mock.MagicMock())
     @mock.patch("django_socio_grpc.services.Service.check_permissions")
     def test_check_permissions_called_in_before_action(self, mock_check_permissions):
@@ -125,6 +183,119 @@ class TestPermissionUnitary(TestCase):
         mock_check_permissions.assert_called_once_with()
 
 
+class SlowAsyncPermission:
+    message = "slow message"
+    evaluated = False
+
+    async def has_permission(self, context, service):
+        await asyncio.sleep(0.1)
+        SlowAsyncPermission.evaluated = True
+        return True
+
+
+class ConcurrentSlowAsyncPermission(SlowAsyncPermission):
+    concurrent = True
+
+
+class DenyingAsyncPermission:
+    message = "denied"
+
+    async def has_permission(self, context, service):
+        return False
+
+
+class DenyingPermission(FakePermission):
+    message = "sync denied"
+
+    def has_permission(self, context, service):
+        return False
+
+
+class ConcurrentDenyingAsyncPermission(DenyingAsyncPermission):
+    concurrent = True
+
+
+class TestAsyncPermissions(TestCase):
+    def get_service(self, *permission_classes):
+        service = DummyService()
+        service.permission_classes = permission_classes
+        service.context = FakeContext()
+        return service
+
+    async def test_async_permissions_evaluated_in_order(self):
+        service = self.get_service(SlowAsyncPermission, SlowAsyncPermission)
+
+        start = time.perf_counter()
+        await service._async_check_permissions()
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+
+    async def test_concurrent_async_permissions_evaluated_concurrently(self):
+        service = self.get_service(
+            ConcurrentSlowAsyncPermission,
+            ConcurrentSlowAsyncPermission,
+            ConcurrentSlowAsyncPermission,
+        )
+
+        start = time.perf_counter()
+        await service._async_check_permissions()
+
+        self.assertLess(time.perf_counter() - start, 0.25)
+
+    async def test_first_denying_permission_in_order(self):
+        SlowAsyncPermission.evaluated = False
+        service = self.get_service(DenyingPermission, SlowAsyncPermission)
+
+        with self.assertRaises(PermissionDenied) as error:
+            await service._async_check_permissions()
+
+        self.assertEqual(error.exception.detail, "sync denied")
+        self.assertFalse(SlowAsyncPermission.evaluated)
+
+        service = self.get_service(DenyingAsyncPermission, DenyingPermission)
+        with self.assertRaises(PermissionDenied) as error:
+            await service._async_check_permissions()
+
+        self.assertEqual(error.exception.detail, "denied")
+
+    async def test_first_denial_cancels_pending_permissions(self):
+        SlowAsyncPermission.evaluated = False
+        service = self.get_service(
+            ConcurrentSlowAsyncPermission, ConcurrentDenyingAsyncPermission
+        )
+
+        with self.assertRaises(PermissionDenied) as error:
+            await service._async_check_permissions()
+
+        self.assertEqual(error.exception.detail, "denied")
+        await asyncio.sleep(0.15)
+        self.assertFalse(SlowAsyncPermission.evaluated)
+
+    async def test_sync_permissions_in_one_thread_hop(self):
+        service = self.get_service(FakePermission, FakePermission, DenyingPermission)
+
+        with mock.patch(
+            "django_socio_grpc.services.base_service.db_sync_to_async",
+            wraps=db_sync_to_async,
+        ) as mock_sync_to_async:
+            await service.acheck_object_permissions("fake_obj")
+            with self.assertRaises(PermissionDenied) as error:
+                await service._async_check_permissions()
+
+        self.assertEqual(error.exception.detail, "sync denied")
+        self.assertEqual(mock_sync_to_async.call_count, 2)
+
+    async def test_no_permission(self):
+        service = self.get_service()
+
+        with mock.patch(
+            "django_socio_grpc.services.base_service.db_sync_to_async"
+        ) as mock_sync_to_async:
+            await service._async_check_permissions()
+
+        mock_sync_to_async.assert_not_called()
+
+
 @mock.patch(
     "django_socio_grpc.services.servicer_proxy.ServicerProxy.create_service",
     new=fake_create_service,
@@ -0,0 +1,171 @@
+from unittest import mock
+
+import grpc
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    StreamInControllerStub,
+    UnitTestModelControllerStub,
+    add_StreamInControllerServicer_to_server,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.models import UnitTestModel
+from fakeapp.services.stream_in_service import StreamInService
+from fakeapp.services.sync_unit_test_model_service import SyncUnitTestModelService
+from fakeapp.services.unit_test_model_service import UnitTestModelService
+
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC, FakeGRPC
+
+QUERY_COUNT_SETTINGS = {
+    "GRPC_MIDDLEWARE": ["django_socio_grpc.middlewares.query_count_middleware"],
+    "LOG_OK_RESPONSE": True,
+}
+
+
+def get_response_record(logs):
+    return next(record for record in logs.records if record.msg.startswith("OK :"))
+
+
+@override_settings(GRPC_FRAMEWORK=QUERY_COUNT_SETTINGS)
+class TestQueryCountMiddleware(TestCase):
+    def setUp(self):
+        self.fake_grpc = FakeGRPC(
+            add_UnitTestModelControllerServicer_to_server,
+            SyncUnitTestModelService.as_servicer(),
+        )
+        for idx in range(3):
+            UnitTestModel(title=f"title {idx}", text="text").save()
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    def test_query_count_logged(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        with self.assertLogs("django_socio_grpc.request", level="INFO") as logs:
+            with CaptureQueriesContext(connection) as queries:
+                grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        record = get_response_record(logs)
+        self.assertEqual(record.query_count, len(queries))
+        self.assertGreater(record.query_duration, 0)
+        self.assertFalse(hasattr(record, "max_message_query_count"))
+
+    def test_stream_query_count_logged(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        with self.assertLogs("django_socio_grpc.request", level="INFO") as logs:
+            with CaptureQueriesContext(connection) as queries:
+                responses = list(
+                    grpc_stub.Stream(request=fakeapp_pb2.UnitTestModelStreamRequest())
+                )
+
+        self.assertEqual(len(responses), 3)
+        record = get_response_record(logs)
+        self.assertEqual(record.query_count, len(queries))
+        self.assertEqual(record.max_message_query_count, len(queries))
+
+    def test_queries_out_of_rpc_not_recorded(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        with self.assertLogs("django_socio_grpc.request", level="INFO") as logs:
+            UnitTestModel.objects.count()
+            grpc_stub.Retrieve(
+                request=fakeapp_pb2.UnitTestModelRetrieveRequest(
+                    id=UnitTestModel.objects.first().id
+                )
+            )
+
+        self.assertEqual(get_response_record(logs).query_count, 1)
+
+    def test_query_budget_exceeded_warning(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        with mock.patch.object(SyncUnitTestModelService, "query_budget", 0):
+            with self.assertLogs("django_socio_grpc.middlewares", level="WARNING") as logs:
+                grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        self.assertIn("SyncUnitTestModel/List made", logs.output[0])
+        self.assertIn("more than its budget of 0", logs.output[0])
+
+    @override_settings(
+        GRPC_FRAMEWORK={**QUERY_COUNT_SETTINGS, "RAISE_ON_QUERY_BUDGET_EXCEEDED": True}
+    )
+    def test_query_budget_exceeded_raise(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        with mock.patch.object(SyncUnitTestModelService, "query_budget", {"List": 0}):
+            with self.assertRaises(grpc.RpcError) as error:
+                grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+            self.assertEqual(error.exception.code(), grpc.StatusCode.INTERNAL)
+
+            # INFO - No budget for the other actions
+            list(grpc_stub.Stream(request=fakeapp_pb2.UnitTestModelStreamRequest()))
+
+    @override_settings(
+        GRPC_FRAMEWORK={**QUERY_COUNT_SETTINGS, "RAISE_ON_QUERY_BUDGET_EXCEEDED": True}
+    )
+    def test_query_budget_exceeded_in_stream(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        with mock.patch.object(SyncUnitTestModelService, "query_budget", 0):
+            with self.assertRaises(grpc.RpcError) as error:
+                list(grpc_stub.Stream(request=fakeapp_pb2.UnitTestModelStreamRequest()))
+        self.assertEqual(error.exception.code(), grpc.StatusCode.INTERNAL)
+
+
+@override_settings(GRPC_FRAMEWORK={**QUERY_COUNT_SETTINGS, "GRPC_ASYNC": True})
+class TestAsyncQueryCountMiddleware(TestCase):
+    def setUp(self):
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server, UnitTestModelService.as_servicer()
+        )
+        for idx in range(3):
+            UnitTestModel(title=f"title {idx}", text="text").save()
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def test_async_query_count_logged(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        with self.assertLogs("django_socio_grpc.request", level="INFO") as logs:
+            await grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+        self.assertGreater(get_response_record(logs).query_count, 0)
+
+    async def test_async_context_write_stream_query_count_logged(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        with self.assertLogs("django_socio_grpc.request", level="INFO") as logs:
+            stream = grpc_stub.Stream(request=fakeapp_pb2.UnitTestModelStreamRequest())
+            responses = [response async for response in stream]
+
+        self.assertEqual(len(responses), 3)
+        record = get_response_record(logs)
+        self.assertGreater(record.query_count, 0)
+        # INFO - Messages sent with `context.write` are only counted by RPC
+        self.assertFalse(hasattr(record, "max_message_query_count"))
+
+    async def test_async_generator_stream_query_count_logged(self):
+        fake_grpc = FakeFullAIOGRPC(
+            add_StreamInControllerServicer_to_server, StreamInService.as_servicer()
+        )
+        grpc_stub = fake_grpc.get_fake_stub(StreamInControllerStub)
+
+        with self.assertLogs("django_socio_grpc.request", level="INFO") as logs:
+            stream_caller = grpc_stub.StreamToStream()
+            await stream_caller.write(fakeapp_pb2.StreamInStreamToStreamRequest(name="a"))
+            await stream_caller.write(fakeapp_pb2.StreamInStreamToStreamRequest(name="b"))
+            await stream_caller.done_writing()
+            self.assertEqual((await stream_caller.read()).name, "aResponse")
+            self.assertEqual((await stream_caller.read()).name, "bResponse")
+            self.assertEqual(await stream_caller.read(), grpc.aio.EOF)
+        fake_grpc.close()
+
+        record = get_response_record(logs)
+        self.assertEqual(record.query_count, 0)
+        self.assertEqual(record.max_message_query_count, 0)
@@ -0,0 +1,75 @@
+from unittest import mock
+
+from django.test import TestCase
+from fakeapp.services.unit_test_model_service import UnitTestModelService
+
+from django_socio_grpc.decorators import grpc_action
+from django_socio_grpc.exceptions import Unimplemented
+from django_socio_grpc.services import Service
+from django_socio_grpc.services.servicer_proxy import ServicerProxy
+
+from .benchmarks.utils import report, run_benchmark
+from .grpc_test_utils.fake_grpc import FakeContext
+
+
+class DummyService(Service):
+    def DummyMethod(service, request, context):
+        return "result"
+
+
+class RegisteredDummyService(Service):
+    @grpc_action(request=[], response=[])
+    def DummyMethod(service, request, context):
+        return "result"
+
+
+RegisteredDummyService.register_actions()
+
+
+class TestServicerProxy(TestCase):
+    def test_handlers_compiled_for_registered_actions(self):
+        servicer = UnitTestModelService.as_servicer()
+
+        self.assertTrue(
+            {"List", "Retrieve", "Create", "Stream", "ListWithExtraArgs"}
+            <= set(servicer._handlers)
+        )
+        with mock.patch.object(ServicerProxy, "get_handler") as get_handler_mock:
+            self.assertIs(servicer.List, servicer._handlers["List"])
+        get_handler_mock.assert_not_called()
+
+    def test_handlers_table_is_frozen(self):
+        servicer = UnitTestModelService.as_servicer()
+
+        with self.assertRaises(TypeError):
+            servicer._handlers["List"] = None
+
+    def test_not_compiled_action(self):
+        servicer = DummyService.as_servicer()
+
+        self.assertNotIn("DummyMethod", servicer._handlers)
+        self.assertEqual(servicer.DummyMethod(None, FakeContext()), "result")
+
+    def test_unknown_action(self):
+        servicer = DummyService.as_servicer()
+
+        with self.assertRaises(Unimplemented):
+            servicer.UnknownMethod
+
+    def test_benchmark_handler_overhead(self):
+        servicer = RegisteredDummyService.as_servicer()
+        context = FakeContext()
+
+        def uncompiled_rpc():
+            servicer.get_handler("DummyMethod")(None, context)
+
+        def compiled_rpc():
+            servicer.DummyMethod(None, context)
+
+        report(
+            "ServicerProxy per call overhead",
+            {
+                "handler built on each call": run_benchmark(uncompiled_rpc),
+                "compiled handler": run_benchmark(compiled_rpc),
+            },
+        )
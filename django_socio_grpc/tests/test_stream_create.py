@@ -0,0 +1,156 @@
+import inspect
+import json
+from unittest import mock
+
+import grpc
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    SyncUnitTestModelControllerStub,
+    UnitTestModelControllerStub,
+    add_SyncUnitTestModelControllerServicer_to_server,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.models import UnitTestModel
+from fakeapp.services.sync_unit_test_model_service import SyncUnitTestModelService
+from fakeapp.services.unit_test_model_service import UnitTestModelService
+
+from django_socio_grpc.protobuf.proto_classes import ProtoRpc
+
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC, FakeGRPC
+from .utils import register_services
+
+
+def make_requests(titles):
+    return [fakeapp_pb2.UnitTestModelRequest(title=title, text="streamed") for title in titles]
+
+
+@mock.patch.object(SyncUnitTestModelService, "stream_create_batch_size", 4)
+class TestStreamCreate(TestCase):
+    def setUp(self):
+        register_services(self, SyncUnitTestModelService)
+        self.fake_grpc = FakeGRPC(
+            add_SyncUnitTestModelControllerServicer_to_server,
+            SyncUnitTestModelService.as_servicer(),
+        )
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    def test_stream_create(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        titles = [f"title {idx}" for idx in range(10)]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = grpc_stub.StreamCreate(iter(make_requests(titles)))
+
+        self.assertEqual(response.count, 10)
+        self.assertEqual(response.batch_count, 3)
+        inserts = [query for query in queries if query["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 3)
+        self.assertEqual(
+            list(UnitTestModel.objects.order_by("id").values_list("title", flat=True)), titles
+        )
+
+    def test_stream_create_empty(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+
+        response = grpc_stub.StreamCreate(iter([]))
+
+        self.assertEqual(response.count, 0)
+        self.assertEqual(response.batch_count, 0)
+
+    def test_stream_create_invalid_message(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        titles = [f"title {idx}" for idx in range(10)]
+        titles[6] = "too long" * 10
+
+        with self.assertRaises(grpc.RpcError) as error:
+            grpc_stub.StreamCreate(iter(make_requests(titles)))
+
+        self.assertEqual(error.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+        details = json.loads(error.exception.details())
+        self.assertEqual(list(details), ["6"])
+        self.assertIn("title", details["6"])
+        # INFO - Only the batches before the one of the invalid message are created
+        self.assertEqual(
+            list(UnitTestModel.objects.order_by("id").values_list("title", flat=True)),
+            titles[:4],
+        )
+
+    def test_response_class_of_registered_action(self):
+        app_handler = mock.Mock(
+            get_pb2_module=mock.Mock(return_value="fakeapp.grpc.fakeapp_pb2")
+        )
+        proto_rpc = ProtoRpc(
+            name="StreamCreate",
+            request="UnitTestModelRequest",
+            response="StreamInStreamInResponse",
+            request_stream=True,
+        )
+
+        with mock.patch.object(SyncUnitTestModelService, "_app_handler", app_handler):
+            # INFO - The action of the class is copied on each access
+            action = inspect.getattr_static(SyncUnitTestModelService, "StreamCreate")
+            with mock.patch.object(action, "proto_rpc", proto_rpc):
+                response_class = SyncUnitTestModelService().get_stream_create_response_class()
+
+        self.assertIs(response_class, fakeapp_pb2.StreamInStreamInResponse)
+
+    def test_response_class_of_unregistered_service(self):
+        with mock.patch.object(SyncUnitTestModelService, "_app_handler", None):
+            with self.assertRaises(ImproperlyConfigured):
+                SyncUnitTestModelService().get_stream_create_response_class()
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+@mock.patch.object(UnitTestModelService, "stream_create_batch_size", 4)
+class TestAsyncStreamCreate(TestCase):
+    def setUp(self):
+        register_services(self, UnitTestModelService)
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server, UnitTestModelService.as_servicer()
+        )
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def stream_create(self, titles):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        stream_caller = grpc_stub.StreamCreate()
+        for request in make_requests(titles):
+            await stream_caller.write(request)
+        await stream_caller.done_writing()
+        return await stream_caller
+
+    async def test_async_stream_create(self):
+        titles = [f"title {idx}" for idx in range(10)]
+
+        response = await self.stream_create(titles)
+
+        self.assertEqual(response.count, 10)
+        self.assertEqual(response.batch_count, 3)
+        self.assertEqual(
+            [
+                instance.title
+                async for instance in UnitTestModel.objects.filter(text="streamed").order_by(
+                    "id"
+                )
+            ],
+            titles,
+        )
+
+    async def test_async_stream_create_invalid_message(self):
+        titles = [f"title {idx}" for idx in range(10)]
+        titles[2] = "too long" * 10
+
+        with self.assertRaises(grpc.RpcError) as error:
+            await self.stream_create(titles)
+
+        self.assertEqual(error.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+        self.assertIn('"2"', error.exception.details())
+        # INFO - Nothing of the batch of the invalid message is created
+        self.assertEqual(await UnitTestModel.objects.acount(), 0)
@@ -0,0 +1,167 @@
+import json
+import time
+from unittest import mock
+
+import grpc
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    SyncUnitTestModelControllerStub,
+    UnitTestModelControllerStub,
+    add_SyncUnitTestModelControllerServicer_to_server,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.models import UnitTestModel
+from fakeapp.services.sync_unit_test_model_service import SyncUnitTestModelService
+from fakeapp.services.unit_test_model_service import UnitTestModelService
+
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC, FakeGRPC
+from .utils import register_services
+
+
+def get_titles():
+    return dict(UnitTestModel.objects.values_list("id", "title"))
+
+
+@mock.patch.object(SyncUnitTestModelService, "stream_upsert_batch_size", 2)
+@mock.patch.object(SyncUnitTestModelService, "stream_upsert_batch_delay", 60)
+class TestStreamUpsert(TestCase):
+    def setUp(self):
+        register_services(self, SyncUnitTestModelService)
+        self.fake_grpc = FakeGRPC(
+            add_SyncUnitTestModelControllerServicer_to_server,
+            SyncUnitTestModelService.as_servicer(),
+        )
+        self.instance = UnitTestModel.objects.create(title="existing")
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    def test_stream_upsert(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        requests = [
+            fakeapp_pb2.UnitTestModelRequest(id=self.instance.id, title="first"),
+            fakeapp_pb2.UnitTestModelRequest(id=self.instance.id, title="second"),
+            fakeapp_pb2.UnitTestModelRequest(id=self.instance.id + 1000, title="new"),
+            fakeapp_pb2.UnitTestModelRequest(id=self.instance.id + 1001, title="last"),
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            responses = list(grpc_stub.StreamUpsert(iter(requests)))
+
+        # INFO - The messages of the same instance are coalesced in the first batch
+        self.assertEqual(
+            [(response.count, response.upsert_count) for response in responses],
+            [(3, 2), (1, 1)],
+        )
+        inserts = [query for query in queries if query["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 2)
+        self.assertIn("ON CONFLICT", inserts[0]["sql"])
+        self.assertEqual(
+            get_titles(),
+            {
+                self.instance.id: "second",
+                self.instance.id + 1000: "new",
+                self.instance.id + 1001: "last",
+            },
+        )
+
+    def test_stream_upsert_batch_delay(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        requests = [
+            fakeapp_pb2.UnitTestModelRequest(id=self.instance.id, title="first"),
+            fakeapp_pb2.UnitTestModelRequest(id=self.instance.id, title="second"),
+        ]
+
+        with mock.patch.object(SyncUnitTestModelService, "stream_upsert_batch_delay", 0):
+            responses = list(grpc_stub.StreamUpsert(iter(requests)))
+
+        self.assertEqual([response.count for response in responses], [1, 1])
+
+    def test_stream_upsert_batch_delay_without_message(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+
+        def slow_requests():
+            yield fakeapp_pb2.UnitTestModelRequest(id=self.instance.id, title="first")
+            time.sleep(0.2)
+            yield fakeapp_pb2.UnitTestModelRequest(id=self.instance.id + 1000, title="new")
+
+        with mock.patch.object(SyncUnitTestModelService, "stream_upsert_batch_delay", 0.05):
+            responses = list(grpc_stub.StreamUpsert(slow_requests()))
+
+        # INFO - The first batch is upserted when its delay expires, not with the next message
+        self.assertEqual([response.count for response in responses], [1, 1])
+
+    @mock.patch.object(SyncUnitTestModelService, "lookup_field", "pk")
+    @mock.patch.object(SyncUnitTestModelService, "lookup_request_field", "id")
+    def test_stream_upsert_pk_lookup_field(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        requests = [
+            fakeapp_pb2.UnitTestModelRequest(id=self.instance.id, title="updated"),
+            fakeapp_pb2.UnitTestModelRequest(id=self.instance.id + 1000, title="new"),
+        ]
+
+        self.assertEqual(SyncUnitTestModelService().get_stream_upsert_unique_field(), "id")
+        list(grpc_stub.StreamUpsert(iter(requests)))
+
+        self.assertEqual(
+            get_titles(), {self.instance.id: "updated", self.instance.id + 1000: "new"}
+        )
+
+    def test_stream_upsert_invalid_message(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SyncUnitTestModelControllerStub)
+        requests = [
+            fakeapp_pb2.UnitTestModelRequest(id=self.instance.id, title="updated"),
+            fakeapp_pb2.UnitTestModelRequest(
+                id=self.instance.id + 1000, title="too long" * 10
+            ),
+        ]
+
+        with self.assertRaises(grpc.RpcError) as error:
+            list(grpc_stub.StreamUpsert(iter(requests)))
+
+        self.assertEqual(error.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+        details = json.loads(error.exception.details())
+        self.assertEqual(list(details), [str(self.instance.id + 1000)])
+        self.assertEqual(get_titles(), {self.instance.id: "existing"})
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+@mock.patch.object(UnitTestModelService, "stream_upsert_batch_size", 10)
+@mock.patch.object(UnitTestModelService, "stream_upsert_batch_delay", 0.05)
+class TestAsyncStreamUpsert(TestCase):
+    def setUp(self):
+        register_services(self, UnitTestModelService)
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server, UnitTestModelService.as_servicer()
+        )
+        self.instance = UnitTestModel.objects.create(title="existing")
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def test_async_stream_upsert(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        stream_caller = grpc_stub.StreamUpsert()
+
+        await stream_caller.write(
+            fakeapp_pb2.UnitTestModelRequest(id=self.instance.id, title="first")
+        )
+        # INFO - The batch is acknowledged once its delay expires, without a next message
+        response = await stream_caller.read()
+
+        self.assertEqual((response.count, response.upsert_count), (1, 1))
+        self.assertEqual(
+            (await UnitTestModel.objects.aget(id=self.instance.id)).title, "first"
+        )
+
+        await stream_caller.write(
+            fakeapp_pb2.UnitTestModelRequest(id=self.instance.id + 1000, title="new")
+        )
+        await stream_caller.done_writing()
+        response = await stream_caller.read()
+
+        self.assertEqual((response.count, response.upsert_count), (1, 1))
+        self.assertEqual(await UnitTestModel.objects.acount(), 2)
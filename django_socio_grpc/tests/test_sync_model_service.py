@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from unittest import mock
 
 from django.test import TestCase
 from fakeapp.grpc import fakeapp_pb2
@@ -85,6 +86,23 @@ class TestSyncModelService(TestCase):
 
         self.assertEqual(len(response_list), 10)
 
+    @mock.patch.object(SyncUnitTestModelService, "stream_chunk_size", 3)
+    def test_stream_by_chunks(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelStreamRequest()
+        response_list = [response for response in grpc_stub.Stream(request=request)]
+
+        self.assertEqual(
+            [response.title for response in response_list],
+            list(UnitTestModel.objects.order_by("id").values_list("title", flat=True)),
+        )
+
+    def test_get_stream_chunks(self):
+        service = SyncUnitTestModelService(stream_chunk_size=3)
+        chunks = list(service.get_stream_chunks(service.get_queryset()))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 3, 1])
+
     def test_partial_update(self):
         instance = UnitTestModel.objects.first()
 
@@ -1,6 +1,9 @@
 from contextlib import contextmanager
 from unittest.mock import mock_open, patch
 
+from django_socio_grpc.protobuf import RegistrySingleton
+from django_socio_grpc.services import AppHandlerRegistry
+
 
 @contextmanager
 def patch_open(read_data=""):
@@ -10,3 +13,15 @@ def patch_open(read_data=""):
         "pathlib.Path.open", m
     ):
         yield m
+
+
+def register_services(test_case, *service_classes, app_name="fakeapp"):
+    """
+    Register `service_classes` in an app handler without server for the duration of
+    `test_case`, as the run commands do before serving them.
+    """
+    RegistrySingleton.clean_all()
+    test_case.addCleanup(RegistrySingleton.clean_all)
+    app_handler = AppHandlerRegistry(app_name, server=None)
+    for service_class in service_classes:
+        app_handler.register(service_class)
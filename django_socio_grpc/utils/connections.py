@@ -0,0 +1,138 @@
+"""
+Recycling of the database connections used by the sync code of the async services.
+
+`close_old_connections_middleware` closes the obsolete connections before and after each
+RPC. In async mode the connections live in the executor threads, so closing them costs a
+thread hop even when there is nothing to close. The `ConnectionHealthManager` tracks from
+the event loop the connections opened by these threads (with the `connection_created`
+signal) and only hops when one of them may need to be closed: it outlived `CONN_MAX_AGE`,
+an error occurred, the autocommit setting was not restored or `CONN_HEALTH_CHECKS` is
+enabled. The RPCs ending at the same time share the same hop.
+"""
+import asyncio
+import threading
+import time
+import weakref
+from typing import Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django import db
+from django.db.backends.signals import connection_created
+
+
+def _close_old_connections():
+    for conn in db.connections.all():
+        if conn.connection is None:
+            continue
+        if conn.get_autocommit():
+            conn.close_if_unusable_or_obsolete()
+
+
+def _needs_check(connection, now: float) -> bool:
+    # INFO - Same conditions as close_if_unusable_or_obsolete, for the connections
+    # checked by _close_old_connections
+    if connection.connection is None or not connection.autocommit:
+        return False
+    settings_dict = connection.settings_dict
+    return (
+        not settings_dict["AUTOCOMMIT"]
+        or connection.errors_occurred
+        or (connection.close_at is not None and now >= connection.close_at)
+        # INFO - The health check of the next query is enabled by the check
+        or settings_dict.get("CONN_HEALTH_CHECKS", False)
+    )
+
+
+class _ConnectionCheck:
+    """
+    `_close_old_connections` call shared by the RPCs awaiting it before it starts.
+    """
+
+    def __init__(self):
+        self.started = False
+
+    def __call__(self) -> int:
+        self.started = True
+        _close_old_connections()
+        return threading.get_ident()
+
+
+class ConnectionHealthManager:
+    """
+    Close the obsolete connections of the executor threads, only hopping to a thread when
+    one of the connections they opened may need to be closed.
+    """
+
+    def __init__(self):
+        # INFO - Open connections by identifier of the thread that opened them
+        self._connections = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._batch: Optional[Tuple[_ConnectionCheck, asyncio.Future]] = None
+
+    def track(self, connection):
+        """
+        Track `connection`, opened in the current thread.
+        """
+        # INFO - The pool threads of db_sync_to_async recycle their connections themselves
+        if threading.current_thread().name.startswith("grpc-sync-to-async"):
+            return
+        with self._lock:
+            self._connections[connection] = threading.get_ident()
+
+    def needs_check(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            connections = list(self._connections)
+        return any(_needs_check(connection, now) for connection in connections)
+
+    async def acheck(self):
+        """
+        Close the obsolete connections, in a thread hop shared with the other RPCs
+        calling it before the hop starts.
+        """
+        if not self.needs_check():
+            return
+        loop = asyncio.get_running_loop()
+        batch = self._batch
+        # INFO - A started check may miss the connections used since, a new one is needed
+        if batch is None or batch[0].started or batch[1].get_loop() is not loop:
+            check = _ConnectionCheck()
+            task = loop.create_task(sync_to_async(check)())
+            batch = self._batch = (check, task)
+            task.add_done_callback(self._end_batch)
+        await asyncio.shield(batch[1])
+
+    def _end_batch(self, task: asyncio.Future):
+        if self._batch is not None and self._batch[1] is task:
+            self._batch = None
+        if task.cancelled() or task.exception() is not None:
+            return
+        checked_thread = task.result()
+        with self._lock:
+            for connection, thread in list(self._connections.items()):
+                # INFO - The connections of other threads can not be closed by this hop,
+                # they are tracked again when they reconnect
+                if connection.connection is None or thread != checked_thread:
+                    del self._connections[connection]
+
+
+connection_health_manager = ConnectionHealthManager()
+
+
+def _track_connection(sender, connection, **kwargs):
+    connection_health_manager.track(connection)
+
+
+def track_connections():
+    """
+    Start tracking by `connection_health_manager` the connections opened from now on, and
+    the ones of the current thread already open.
+    """
+    connection_created.connect(
+        _track_connection, dispatch_uid="django_socio_grpc.connection_health_manager"
+    )
+    # INFO - The connections opened before the signal was connected, as by the system
+    # checks, would otherwise never be checked
+    for connection in db.connections.all(initialized_only=True):
+        if connection.connection is not None:
+            connection_health_manager.track(connection)
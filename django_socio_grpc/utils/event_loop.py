@@ -0,0 +1,32 @@
+import asyncio
+import logging
+
+logger = logging.getLogger("django_socio_grpc.internal")
+
+EVENT_LOOPS = ("asyncio", "uvloop")
+
+
+def get_event_loop_policy(event_loop: str) -> asyncio.AbstractEventLoopPolicy:
+    """
+    Return the policy creating the `event_loop` ("asyncio" or "uvloop") event loops.
+    Fall back to the asyncio policy when uvloop is not installed.
+    """
+    if event_loop not in EVENT_LOOPS:
+        raise ValueError(
+            f"Unknown event loop {event_loop!r}, expected one of {', '.join(EVENT_LOOPS)}"
+        )
+    if event_loop == "uvloop":
+        try:
+            import uvloop
+        except ImportError:
+            logger.warning("uvloop is not installed, falling back to the asyncio event loop")
+        else:
+            return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+def install_event_loop_policy(event_loop: str):
+    """
+    Make `asyncio.run` and the new event loops use the `event_loop` event loop.
+    """
+    asyncio.set_event_loop_policy(get_event_loop_policy(event_loop))
@@ -0,0 +1,209 @@
+"""
+Executors running the sync code (ORM queries, serializers, permissions...) of the async services.
+
+By default, as with `asgiref.sync.sync_to_async`, this code runs in the single
+thread-sensitive thread, one call at a time. The `SYNC_TO_ASYNC_THREAD_SENSITIVE`
+setting can instead run the calls of some call sites in a dedicated thread pool of
+`SYNC_TO_ASYNC_MAX_WORKERS` threads, each one with its own database connection.
+"""
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, connections
+from django.test.signals import setting_changed
+
+from django_socio_grpc.metrics import metrics_registry
+from django_socio_grpc.settings import grpc_settings
+
+# INFO - The connections of the thread-sensitive thread are recycled by
+# close_old_connections_middleware in this thread, so it is not a call site
+SYNC_TO_ASYNC_CALL_SITES = (
+    "authentication",
+    "permissions",
+    "queryset",
+    "filters",
+    "serializers",
+    "actions",
+    "cache",
+)
+THREAD_SENSITIVE_EXECUTOR = "thread_sensitive"
+POOL_EXECUTOR = "pool"
+
+
+class ConnectionsThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    Thread pool able to close the database connections of its threads on shutdown.
+
+    `connections.close_all` only closes the connections of its thread, so the connection
+    handlers of each thread are registered by the pool initializer when it starts, and
+    closed once the threads exited.
+    """
+
+    def __init__(self, *args, initializer=None, initargs=(), **kwargs):
+        self._thread_initializer = initializer
+        self._thread_connections = []
+        self._thread_connections_lock = threading.Lock()
+        super().__init__(
+            *args, initializer=self._register_thread_connections, initargs=initargs, **kwargs
+        )
+
+    def _register_thread_connections(self, *initargs):
+        # INFO - The handlers are created without connecting, the thread reuses them
+        thread_connections = [connections[alias] for alias in connections]
+        with self._thread_connections_lock:
+            self._thread_connections += thread_connections
+        if self._thread_initializer is not None:
+            self._thread_initializer(*initargs)
+
+    def shutdown(self, wait=True, *, close_connections=False, **kwargs):
+        """
+        Same as `ThreadPoolExecutor.shutdown`, closing the database connections of the
+        threads after they exited if `close_connections` is set, which requires `wait`.
+        """
+        super().shutdown(wait=wait, **kwargs)
+        if close_connections and wait:
+            self.close_connections()
+
+    def close_connections(self):
+        with self._thread_connections_lock:
+            thread_connections, self._thread_connections = self._thread_connections, []
+        for connection in thread_connections:
+            # INFO - The thread owning the connection exited, it is closed from this one
+            connection.inc_thread_sharing()
+            try:
+                connection.close()
+            finally:
+                connection.dec_thread_sharing()
+
+
+_executor: Optional[ConnectionsThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def is_thread_sensitive(call_site: str) -> bool:
+    """
+    Return whether the sync calls of `call_site` run in the thread-sensitive thread.
+    """
+    if call_site not in SYNC_TO_ASYNC_CALL_SITES:
+        raise ValueError(
+            f"Unknown call site {call_site!r}, expected one of {', '.join(SYNC_TO_ASYNC_CALL_SITES)}"
+        )
+    thread_sensitive = grpc_settings.SYNC_TO_ASYNC_THREAD_SENSITIVE
+    if isinstance(thread_sensitive, dict):
+        return thread_sensitive.get(call_site, True)
+    return bool(thread_sensitive)
+
+
+def get_executor() -> ConnectionsThreadPoolExecutor:
+    """
+    Return the thread pool running the calls of the call sites that are not thread sensitive.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ConnectionsThreadPoolExecutor(
+                    max_workers=grpc_settings.SYNC_TO_ASYNC_MAX_WORKERS,
+                    thread_name_prefix="grpc-sync-to-async",
+                )
+    return _executor
+
+
+def shutdown_executor(wait: bool = True, close_connections: bool = False):
+    """
+    Shut down the thread pool, closing first the database connections of its threads
+    if `close_connections` is set.
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, close_connections=close_connections)
+
+
+def _run_in_pool(func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # INFO - The pool threads are shared by the RPCs, their connections are recycled
+        # as the ones of the thread-sensitive thread by close_old_connections_middleware
+        close_old_connections()
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+class _ObservedCall:
+    """
+    Sync call recording its wait for and its run in an executor thread.
+    """
+
+    def __init__(self, func: Callable, executor_metrics):
+        self.func = func
+        self.executor_metrics = executor_metrics
+        self.submitted_at = executor_metrics.submit()
+        self.state = "pending"
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            observed = self.state == "pending"
+            self.state = "started"
+        if observed:
+            self.executor_metrics.start(self.submitted_at)
+        try:
+            return self.func(*args, **kwargs)
+        finally:
+            if observed:
+                self.executor_metrics.finish()
+
+    def cancel(self):
+        # INFO - Only a call cancelled before running leaves the queue here
+        with self._lock:
+            if self.state != "pending":
+                return
+            self.state = "cancelled"
+        self.executor_metrics.cancel()
+
+
+def _observe(func: Callable, thread_sensitive: bool) -> Callable:
+    executor = THREAD_SENSITIVE_EXECUTOR if thread_sensitive else POOL_EXECUTOR
+    executor_metrics = metrics_registry.get_executor_metrics(executor)
+
+    async def inner(*args, **kwargs):
+        call = _ObservedCall(func, executor_metrics)
+        try:
+            return await _sync_to_async(call, thread_sensitive)(*args, **kwargs)
+        finally:
+            call.cancel()
+
+    return inner
+
+
+def _sync_to_async(func: Callable, thread_sensitive: bool) -> Callable:
+    if thread_sensitive:
+        return sync_to_async(func)
+    return sync_to_async(func, thread_sensitive=False, executor=get_executor())
+
+
+def db_sync_to_async(func: Callable, call_site: str) -> Callable:
+    """
+    Same as `asgiref.sync.sync_to_async(func)`, in the executor configured for `call_site`
+    by the `SYNC_TO_ASYNC_THREAD_SENSITIVE` setting.
+    """
+    thread_sensitive = is_thread_sensitive(call_site)
+    if not thread_sensitive:
+        func = _run_in_pool(func)
+    if grpc_settings.ENABLE_METRICS:
+        return _observe(func, thread_sensitive)
+    return _sync_to_async(func, thread_sensitive)
+
+
+def reset_executor(*args, **kwargs):
+    if kwargs["setting"] == "GRPC_FRAMEWORK":
+        shutdown_executor(wait=False)
+
+
+setting_changed.connect(reset_executor)
@@ -0,0 +1,84 @@
+from typing import Dict, Iterable, List, Optional
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+from django_socio_grpc.exceptions import InvalidArgument
+
+# INFO - A field mask is kept as a tree of field names: {"title": {}, "author": {"name": {}}}.
+# An empty sub tree selects the whole field.
+FieldMaskTree = Dict[str, "FieldMaskTree"]
+
+
+def parse_field_mask(paths: Iterable[str]) -> FieldMaskTree:
+    """
+    Build the tree of the dot separated `paths` of a `google.protobuf.FieldMask`.
+    """
+    tree = {}
+    for path in paths:
+        node = tree
+        names = path.split(".")
+        for idx, name in enumerate(names):
+            if name in node and not node[name]:
+                # INFO - A parent path already selects the whole field
+                break
+            node = node.setdefault(name, {})
+            if idx == len(names) - 1:
+                node.clear()
+    return tree
+
+
+def _get_fields(serializer: serializers.BaseSerializer):
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    return serializer.fields
+
+
+def apply_field_mask(serializer: serializers.BaseSerializer, field_mask: FieldMaskTree):
+    """
+    Remove from `serializer` (and its nested serializers) the fields not selected by `field_mask`.
+    """
+    fields = _get_fields(serializer)
+    unknown_fields = set(field_mask) - set(fields)
+    if unknown_fields:
+        raise InvalidArgument(
+            detail=f"Unknown field mask paths: {', '.join(sorted(unknown_fields))}"
+        )
+    for field_name in list(fields):
+        if field_name not in field_mask:
+            del fields[field_name]
+        elif field_mask[field_name]:
+            if not isinstance(fields[field_name], serializers.BaseSerializer):
+                raise InvalidArgument(
+                    detail=f"Field mask path {field_name} does not have sub fields"
+                )
+            apply_field_mask(fields[field_name], field_mask[field_name])
+
+
+def get_field_mask_only_fields(
+    model, serializer: serializers.BaseSerializer, field_mask: FieldMaskTree
+) -> Optional[List[str]]:
+    """
+    Return the fields of `model` to load with `QuerySet.only()` to serialize the fields
+    selected by `field_mask`, or None if some of them read unknown model attributes.
+    """
+    fields = _get_fields(serializer)
+    only_fields = {model._meta.pk.name}
+    for field_name in field_mask:
+        field = fields.get(field_name)
+        if field is None:
+            continue
+        if field.source == "*" or isinstance(field, serializers.SerializerMethodField):
+            return None
+        try:
+            model_field = model._meta.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            # INFO - Properties or methods of the model may read any column
+            return None
+        if model_field.concrete and not model_field.many_to_many:
+            only_fields.add(model_field.name)
+        elif not model_field.is_relation or not (
+            model_field.auto_created or model_field.many_to_many or model_field.one_to_many
+        ):
+            return None
+    return sorted(only_fields)
@@ -1,3 +1,14 @@
+import logging
+from functools import lru_cache
+from typing import List, Set, Tuple
+
+from rest_framework import serializers
+from rest_framework.fields import HiddenField
+from rest_framework.utils.model_meta import RelationInfo, get_field_info
+
+logger = logging.getLogger("django_socio_grpc.internal")
+
+
 def get_model_pk(model):
     opts = model._meta.concrete_model._meta
     pk = opts.pk
@@ -9,3 +20,151 @@ def get_model_pk(model):
         rel = pk.remote_field
 
     return pk
+
+
+def get_relations(model, source_attrs: List[str]) -> List[Tuple[str, RelationInfo]]:
+    """
+    Return the relations followed by `source_attrs` from `model`, stopping at the
+    first attribute that is not a relation.
+    """
+    relations = []
+    for source in source_attrs:
+        if not (relation := get_field_info(model).relations.get(source)):
+            break
+        relations.append((source, relation))
+        model = relation.related_model
+    return relations
+
+
+class _RecordingContext(dict):
+    """
+    Empty serializer context recording whether it was read.
+    """
+
+    read = False
+
+    def __getitem__(self, key):
+        self.read = True
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.read = True
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        self.read = True
+        return super().__contains__(key)
+
+
+@lru_cache(maxsize=None)
+def get_serializer_related_paths(serializer_class) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Return the `select_related` and `prefetch_related` paths needed to serialize instances of
+    the model of `serializer_class` without one query by instance and relation.
+
+    The fields are read from a serializer built without context. No path is returned
+    when building them fails or reads the context, as they may depend on the request.
+    """
+    model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+    select_related = set()
+    prefetch_related = set()
+    if model is None:
+        return (), ()
+    context = _RecordingContext()
+    try:
+        _collect_related_paths(
+            serializer_class(context=context),
+            model,
+            [],
+            False,
+            (serializer_class,),
+            select_related,
+            prefetch_related,
+        )
+    except Exception:
+        logger.debug(
+            f"Related queries of {serializer_class.__name__} not optimized", exc_info=True
+        )
+        return (), ()
+    if context.read:
+        logger.debug(f"Related queries of {serializer_class.__name__} depend on the context")
+        return (), ()
+    return _longest_paths(select_related), _longest_paths(prefetch_related)
+
+
+def _collect_related_paths(
+    serializer: serializers.BaseSerializer,
+    model,
+    prefix: List[str],
+    to_many: bool,
+    parents: Tuple[type, ...],
+    select_related: Set[str],
+    prefetch_related: Set[str],
+):
+    for field in serializer.fields.values():
+        if field.write_only or isinstance(
+            field, (HiddenField, serializers.SerializerMethodField)
+        ):
+            continue
+
+        nested_serializer = None
+        if isinstance(field, serializers.ListSerializer):
+            nested_serializer = field.child
+        elif isinstance(field, serializers.BaseSerializer):
+            nested_serializer = field
+
+        if field.source == "*":
+            if nested_serializer and nested_serializer.__class__ not in parents:
+                _collect_related_paths(
+                    nested_serializer,
+                    model,
+                    prefix,
+                    to_many,
+                    (*parents, nested_serializer.__class__),
+                    select_related,
+                    prefetch_related,
+                )
+            continue
+
+        relations = get_relations(model, field.source_attrs)
+        # INFO - Primary key related fields read the foreign key column of the instance
+        if (
+            isinstance(field, serializers.RelatedField)
+            and field.use_pk_only_optimization()
+            and len(relations) == len(field.source_attrs)
+            and not relations[-1][1].to_many
+            and not relations[-1][1].reverse
+        ):
+            relations = relations[:-1]
+
+        path = list(prefix)
+        path_to_many = to_many
+        for source, relation in relations:
+            path.append(source)
+            path_to_many = path_to_many or relation.to_many
+            (prefetch_related if path_to_many else select_related).add("__".join(path))
+
+        if (
+            nested_serializer
+            and relations
+            and len(relations) == len(field.source_attrs)
+            and nested_serializer.__class__ not in parents
+        ):
+            _collect_related_paths(
+                nested_serializer,
+                relations[-1][1].related_model,
+                path,
+                path_to_many,
+                (*parents, nested_serializer.__class__),
+                select_related,
+                prefetch_related,
+            )
+
+
+def _longest_paths(paths: Set[str]) -> Tuple[str, ...]:
+    """
+    Remove the paths included in another one: `select_related("a__b")` also selects `a`.
+    """
+    return tuple(
+        sorted(path for path in paths if not any(p.startswith(f"{path}__") for p in paths))
+    )